@@ -1,13 +1,49 @@
 import argparse
+import contextlib
+import functools
+import importlib.util
 import json
 import os
 import re
 import subprocess
 import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from typing import Dict, List, Optional
 
+from policy import DEFAULT_POLICY, IssueAbandoned, IssueBudget, load_policy, open_readiness
+from scheduler import CycleError, IssueSchedule, build_schedule, describe_schedule
+from telemetry import (
+    DEFAULT_TELEMETRY_FILE,
+    TELEMETRY,
+    configure,
+    issue_scope,
+    load_spans,
+    report_lines,
+    set_current_issue,
+)
+
 STATE_FILE = "DRIVER_STATE.json"
+# Kept in the common git dir: out of every commit and shared by all worktrees.
+JOURNAL_FILE = "DRIVER_JOURNAL.jsonl"
+# Sub-steps of one issue, in order. "reopened" and "abandoned" send the issue back to implementation.
+JOURNAL_STEPS = ("started", "verified", "pr_opened", "reviewed", "merged")
 PROGRESS_FILE = "TASK_PROGRESS.md"
+# Parallel mode checks issues out under <git common dir>/driver-worktrees/issue-N.
+WORKTREE_DIR = "driver-worktrees"
+STAGE_SCRIPTS = {
+    "start": ("project-task-start", "start.py"),
+    "finish": ("project-task-finish", "finish.py"),
+    "review": ("project-task-review", "review.py"),
+    "debug": ("project-task-debugger", "debug.py"),
+}
+# Merged issues queued before the integration PR checklist is rewritten.
+INTEGRATION_PR_BATCH = 5
+# A prefetched feature-branch head older than this is looked up again when the driver reaches the issue;
+# the prefetched issue body and context sections are kept however old they are.
+PREFETCH_MAX_AGE = 600.0
 CONTEXT_HEADINGS = [
     "Why this week exists",
     "Read first",
@@ -20,9 +56,32 @@ CONTEXT_HEADINGS = [
 ]
 
 
-def run_command(cmd_list: List[str], fatal: bool = True) -> Optional[str]:
+# Parallel issues share one terminal; prompts are asked one at a time.
+PROMPT_LOCK = threading.Lock()
+# Remote head of each integration branch as of its last sync; local branch and origin/<branch> match it.
+SYNCED_HEADS: Dict[str, str] = {}
+
+
+def command_span(cmd_list: List[str]):
+    """Telemetry span for an external command, named by its program and subcommand."""
+    return TELEMETRY.span("command", " ".join(cmd_list[:2]), argv=[arg[:80] for arg in cmd_list[:8]])
+
+
+def record_output(span: Dict[str, object], returncode: int, stdout: Optional[str], stderr: Optional[str]) -> None:
+    span["exit_code"] = returncode
+    span["stdout_bytes"] = len((stdout or "").encode("utf-8"))
+    span["stderr_bytes"] = len((stderr or "").encode("utf-8"))
+
+
+def run_command(cmd_list: List[str], fatal: bool = True, cwd: Optional[str] = None) -> Optional[str]:
     try:
-        result = subprocess.run(cmd_list, capture_output=True, text=True, check=True)
+        with command_span(cmd_list) as span:
+            try:
+                result = subprocess.run(cmd_list, capture_output=True, text=True, check=True, cwd=cwd)
+            except subprocess.CalledProcessError as error:
+                record_output(span, error.returncode, error.stdout, error.stderr)
+                raise
+            record_output(span, result.returncode, result.stdout, result.stderr)
         return result.stdout.strip()
     except subprocess.CalledProcessError as error:
         stderr = error.stderr.strip() if error.stderr else ""
@@ -34,13 +93,17 @@ def run_command(cmd_list: List[str], fatal: bool = True) -> Optional[str]:
         return None
 
 
-def run_python_script(path: str, args: List[str]) -> int:
-    result = subprocess.run(["python3", path, *args], check=False)
+def run_python_script(path: str, args: List[str], cwd: Optional[str] = None) -> int:
+    with command_span(["python3", os.path.basename(path), *args]) as span:
+        result = subprocess.run(["python3", path, *args], check=False, cwd=cwd)
+        span["exit_code"] = result.returncode
     return result.returncode
 
 
-def run_json_script(path: str, args: List[str]) -> Dict[str, object]:
-    result = subprocess.run(["python3", path, *args], capture_output=True, text=True, check=False)
+def run_json_script(path: str, args: List[str], cwd: Optional[str] = None) -> Dict[str, object]:
+    with command_span(["python3", os.path.basename(path), *args]) as span:
+        result = subprocess.run(["python3", path, *args], capture_output=True, text=True, check=False, cwd=cwd)
+        record_output(span, result.returncode, result.stdout, result.stderr)
     if result.stdout:
         print(result.stdout.strip())
     if result.stderr:
@@ -61,40 +124,17 @@ def run_json_script(path: str, args: List[str]) -> Dict[str, object]:
 
 
 def get_open_issues(milestone_title: str) -> List[Dict[str, object]]:
-    output = run_command(
-        [
-            "gh",
-            "issue",
-            "list",
-            "--milestone",
-            milestone_title,
-            "--state",
-            "open",
-            "--json",
-            "number,title,state,milestone",
-            "--limit",
-            "100",
-        ],
-        fatal=False,
-    )
-    if not output:
+    try:
+        with TELEMETRY.span("github", "milestone_issues"):
+            issues = github_index().milestone_issues(None, milestone_title, states=["OPEN"], with_body=True)
+    except RuntimeError as error:
+        print(f"\n[ERROR] Could not list issues for '{milestone_title}': {error}")
         return []
 
-    issues = json.loads(output)
     issues.sort(key=lambda item: item["number"])
     return issues
 
 
-def get_issue_details(issue_num: int) -> Dict[str, object]:
-    output = run_command(
-        ["gh", "issue", "view", str(issue_num), "--json", "number,title,body,milestone"],
-        fatal=False,
-    )
-    if not output:
-        return {"number": issue_num, "title": f"Issue #{issue_num}", "body": ""}
-    return json.loads(output)
-
-
 def normalize_heading(line: str) -> Optional[str]:
     stripped = line.strip()
     if stripped.startswith("**") and stripped.endswith("**"):
@@ -125,10 +165,109 @@ def extract_context_sections(body: str) -> Dict[str, List[str]]:
     return sections
 
 
-def print_issue_context(issue: Dict[str, object]) -> None:
+def feature_branch_name(issue_num: int) -> str:
+    return f"feat/issue-{issue_num}"
+
+
+def fetch_issue_context(issue_num: int) -> Dict[str, object]:
+    """
+    Everything the driver and start need to move onto an issue: its title,
+    body, and milestone, the parsed context sections, and the remote head
+    of its feature branch. Safe to run on a background thread (no prompts, no
+    checkout, no output).
+    """
+    with issue_scope(issue_num):
+        try:
+            with TELEMETRY.span("github", "issue_by_number"):
+                issue = github_index().issue_by_number(None, issue_num)
+        except RuntimeError:
+            issue = None
+        if not issue:
+            issue = {"number": issue_num, "title": f"Issue #{issue_num}", "body": ""}
+    return {
+        "issue": issue,
+        "sections": extract_context_sections(str(issue.get("body") or "")),
+        **fetch_feature_head(issue_num),
+    }
+
+
+def fetch_feature_head(issue_num: int) -> Dict[str, object]:
+    """The issue's feature branch and its remote head ("" when absent), with the time it was looked up."""
+    branch = feature_branch_name(issue_num)
+    command = ["git", "ls-remote", "--heads", "origin", branch]
+    with issue_scope(issue_num), command_span(command) as span:
+        result = subprocess.run(command, capture_output=True, text=True)
+        record_output(span, result.returncode, result.stdout, result.stderr)
+    remote = result.stdout.split() if result.returncode == 0 else []
+    return {"feature_branch": branch, "remote_head": remote[0] if remote else "", "fetched_at": time.time()}
+
+
+class IssuePrefetcher:
+    """Fetches upcoming issue context on a background thread while the current issue is being implemented."""
+
+    def __init__(self):
+        self._pool = ThreadPoolExecutor(max_workers=1)
+        self._pending: Dict[int, Future] = {}
+
+    def prefetch(self, issue_num: int) -> None:
+        if issue_num not in self._pending:
+            self._pending[issue_num] = self._pool.submit(fetch_issue_context, issue_num)
+
+    def get(self, issue_num: int) -> Dict[str, object]:
+        """
+        Return prefetched context (waiting for it if still running), or fetch
+        it now. Implementing an issue usually takes longer than
+        PREFETCH_MAX_AGE, so a stale prefetch keeps its issue context and only
+        the cheap feature-branch head lookup is repeated.
+        """
+        future = self._pending.pop(issue_num, None)
+        if future is None:
+            return fetch_issue_context(issue_num)
+        try:
+            context = future.result()
+        except Exception as error:
+            print(f"[Driver] Prefetch for Issue #{issue_num} failed ({error}); fetching again.")
+            return fetch_issue_context(issue_num)
+        if time.time() - float(context["fetched_at"]) > PREFETCH_MAX_AGE:
+            context = {**context, **fetch_feature_head(issue_num)}
+        return context
+
+    def shutdown(self) -> None:
+        for future in self._pending.values():
+            future.cancel()
+        self._pool.shutdown(wait=False)
+
+
+def write_context_file(context: Dict[str, object]) -> str:
+    """Hand prefetched context to start.py through a temp file (`--context-file`)."""
+    payload = {key: context[key] for key in ("issue", "remote_head", "base_branch", "base_head") if key in context}
+    with tempfile.NamedTemporaryFile("w", suffix=".json", prefix="driver-issue-", delete=False, encoding="utf-8") as file:
+        json.dump(payload, file)
+        return file.name
+
+
+def with_synced_base(context: Dict[str, object], integration_branch: str) -> Dict[str, object]:
+    """Tell start which integration-branch head the driver already fetched, so it can skip fetch/pull."""
+    head = SYNCED_HEADS.get(integration_branch)
+    if not head:
+        return context
+    return {**context, "base_branch": integration_branch, "base_head": head}
+
+
+def ask(prompt: str) -> str:
+    with PROMPT_LOCK, TELEMETRY.span("wait", "prompt"):
+        return input(prompt).strip().lower()
+
+
+def print_issue_context(
+    issue: Dict[str, object],
+    sections: Optional[Dict[str, List[str]]] = None,
+    directory: str = ".",
+) -> None:
     print("\n[Driver] Issue context")
     print(f"Title: {issue.get('title', '')}")
-    sections = extract_context_sections(str(issue.get("body", "")))
+    if sections is None:
+        sections = extract_context_sections(str(issue.get("body", "")))
     for heading in ["Read first", "Current code reality", "Target outcome", "Definition of done", "Verification"]:
         values = sections.get(heading, [])
         if not values:
@@ -137,10 +276,17 @@ def print_issue_context(issue: Dict[str, object]) -> None:
         for value in values[:8]:
             print(value)
 
-    if not os.path.exists(PROGRESS_FILE):
+    if not os.path.exists(os.path.join(directory, PROGRESS_FILE)):
         print(f"\n[Driver] Note: `{PROGRESS_FILE}` does not exist yet. The implementer should initialize it before coding.")
 
 
+def git_common_path(name: str) -> str:
+    """`name` inside the common git directory (shared by all worktrees), or in the cwd outside git."""
+    result = subprocess.run(["git", "rev-parse", "--git-common-dir"], capture_output=True, text=True, check=False)
+    common_dir = result.stdout.strip() if result.returncode == 0 else ""
+    return os.path.join(os.path.abspath(common_dir), name) if common_dir else os.path.abspath(name)
+
+
 def save_state(milestone: str, issue_num: int) -> None:
     with open(STATE_FILE, "w", encoding="utf-8") as file:
         json.dump({"milestone": milestone, "current_issue": issue_num}, file)
@@ -155,11 +301,110 @@ def load_state() -> Optional[Dict[str, object]]:
 
 
 def clear_state() -> None:
-    if os.path.exists(STATE_FILE):
-        os.remove(STATE_FILE)
+    for path in (STATE_FILE, git_common_path(JOURNAL_FILE)):
+        if os.path.exists(path):
+            os.remove(path)
     print("[Driver] State cleared.")
 
 
+class StepJournal:
+    """
+    Append-only log of the sub-steps the driver completed for each issue.
+
+    Every line is one JSON entry `{"time", "milestone", "issue", "step",
+    "data"}` written with flush + fsync before the driver moves on, so after a
+    crash the last line names the last step that really finished. A torn
+    final line is ignored. The default path is in the common git directory,
+    so finish never commits it and parallel worktrees share one journal.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path or git_common_path(JOURNAL_FILE)
+        self._lock = threading.Lock()
+
+    def record(self, milestone: str, issue_num: int, step: str, **data: object) -> None:
+        entry = {"time": time.time(), "milestone": milestone, "issue": issue_num, "step": step, "data": data}
+        line = (json.dumps(entry, ensure_ascii=False) + "\n").encode("utf-8")
+        with self._lock, open(self.path, "ab+") as file:
+            if file.seek(0, os.SEEK_END) > 0:
+                file.seek(-1, os.SEEK_END)
+                if file.read(1) != b"\n":
+                    # Terminate a line torn by a crash so this entry stays readable.
+                    line = b"\n" + line
+            file.write(line)
+            file.flush()
+            os.fsync(file.fileno())
+
+    def entries(self) -> List[Dict[str, object]]:
+        if not os.path.exists(self.path):
+            return []
+        entries: List[Dict[str, object]] = []
+        with open(self.path, "r", encoding="utf-8") as file:
+            for line in file:
+                try:
+                    entries.append(json.loads(line))
+                except json.JSONDecodeError:
+                    continue
+        return entries
+
+    def last_step(self, milestone: str, issue_num: int) -> Optional[Dict[str, object]]:
+        """The latest entry for an issue of this milestone, or None if it never started."""
+        last = None
+        for entry in self.entries():
+            if entry.get("milestone") == milestone and entry.get("issue") == issue_num:
+                last = entry
+        return last
+
+
+def head_commit(cwd: Optional[str] = None) -> Optional[str]:
+    return run_command(["git", "rev-parse", "HEAD"], fatal=False, cwd=cwd)
+
+
+def worktree_dirty(cwd: Optional[str] = None) -> bool:
+    status = run_command(["git", "status", "--porcelain", "--untracked-files=no"], fatal=False, cwd=cwd)
+    return bool(status)
+
+
+def resume_point(
+    journal: StepJournal,
+    milestone: str,
+    issue_num: int,
+    worktree: Optional[str] = None,
+) -> Optional[Dict[str, object]]:
+    """
+    Where to pick an issue back up, or None to run it from the start.
+
+    Steps after "started" are only trusted while the feature branch is still
+    at the commit they were recorded on; otherwise the issue goes back to
+    implementation. Without a `worktree` the feature branch is checked out in
+    the current checkout.
+    """
+    entry = journal.last_step(milestone, issue_num)
+    if entry is None:
+        return None
+    step = entry["step"]
+    if step == "merged":
+        return entry
+    if worktree is None:
+        run_command(["git", "checkout", feature_branch_name(issue_num)])
+    if step in ("verified", "pr_opened", "reviewed"):
+        recorded_head = entry["data"].get("head")
+        if worktree_dirty(worktree) or head_commit(worktree) != recorded_head:
+            print(f"[Driver] Branch changed since step '{step}'; resuming at implementation instead.")
+            return {**entry, "step": "started"}
+    if step in ("reopened", "abandoned"):
+        return {**entry, "step": "started"}
+    return entry
+
+
+def verification_summary(result: Dict[str, object]) -> List[Dict[str, str]]:
+    """Command/status pairs of a stage result, without the captured output."""
+    items = result.get("verification_results", [])
+    if not isinstance(items, list):
+        return []
+    return [{"command": str(item.get("command")), "status": str(item.get("status"))} for item in items if isinstance(item, dict)]
+
+
 def detect_integration_branch(milestone_title: str) -> str:
     match = re.search(r"Phase\s+(\d+)", milestone_title, re.IGNORECASE)
     if match:
@@ -176,15 +421,192 @@ def script_path(skill_name: str, script_name: str) -> str:
     return os.path.join(skills_root(), skill_name, "scripts", script_name)
 
 
-def ensure_integration_branch(branch: str) -> None:
-    print(f"[Driver] Switching to {branch}...")
-    run_command(["git", "fetch", "origin"], fatal=False)
-    run_command(["git", "checkout", branch])
-    run_command(["git", "pull", "origin", branch], fatal=False)
+@functools.lru_cache(maxsize=None)
+def github_index():
+    """
+    Load the shared paginated GraphQL loader from the project-setup skill.
+
+    Registered in `sys.modules` so in-process stages reuse the same client.
+    """
+    module = sys.modules.get("github_index")
+    if module is not None:
+        return module
+    path = script_path("project-setup", "github_index.py")
+    spec = importlib.util.spec_from_file_location("github_index", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    sys.modules["github_index"] = module
+    return module
+
+
+@functools.lru_cache(maxsize=None)
+def stage_module(stage: str):
+    """Import a stage script (start/finish/review/debug) as a module."""
+    skill_name, script_name = STAGE_SCRIPTS[stage]
+    spec = importlib.util.spec_from_file_location(f"task_{stage}", script_path(skill_name, script_name))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class StageRunner:
+    """
+    Runs the start/finish/review/debug stages for the driver.
+
+    By default every stage is called in-process through its importable entry
+    point: the stage modules and the GitHub client are loaded once, and one
+    parsed TASK_PROGRESS.md is shared by finish, review, and debug within a
+    cycle. A stage that calls `sys.exit` is reported as failed instead of
+    ending the driver. With `isolated=True` each stage runs as a `python3`
+    subprocess as before.
+
+    With `cwd` (an issue worktree), stages always run as subprocesses inside
+    that directory, since in-process stages share the driver's working
+    directory.
+
+    With `test_impact`, finish and review get `--test-impact`: review runs
+    only the affected tests, while the final finish still runs the full
+    suite and feeds the learned test mapping.
+    """
+
+    def __init__(self, isolated: bool = False, cwd: Optional[str] = None, test_impact: bool = False):
+        self.isolated = isolated or cwd is not None
+        self.cwd = cwd
+        self.test_impact = test_impact
+
+    def in_worktree(self, path: str) -> "StageRunner":
+        """A runner with the same options whose stages run inside the worktree at `path`."""
+        return StageRunner(cwd=path, test_impact=self.test_impact)
+
+    def _impact_args(self) -> List[str]:
+        return ["--test-impact"] if self.test_impact else []
+
+    def _timed(self, stage: str, succeeded, function, *args):
+        """Run one stage inside a telemetry span; `succeeded(result)` decides its exit code."""
+        mode = "subprocess" if self.isolated else "in-process"
+        with TELEMETRY.span("stage", stage, mode=mode) as span:
+            result = function(*args)
+            span["exit_code"] = 0 if succeeded(result) else 1
+            return result
+
+    def _call(self, stage: str, function, *args) -> Dict[str, object]:
+        try:
+            return function(*args)
+        except SystemExit as error:
+            code = error.code if isinstance(error.code, int) else 1
+            if code == 0:
+                return {"status": "exited", "exit_code": 0}
+            print(f"[Driver] project-task-{stage} exited with code {code}.")
+            return {"status": "failed", "exit_code": code}
+
+    def read_progress(self) -> Optional[Dict[str, object]]:
+        """Parse TASK_PROGRESS.md once for the stages of this cycle (subprocesses read it themselves)."""
+        if self.isolated:
+            return None
+        return stage_module("finish").read_progress_file(PROGRESS_FILE)
+
+    def start(self, issue_num: int, context: Dict[str, object]) -> bool:
+        """Start the issue; with `cwd` set, its worktree is created at that path."""
+        return self._timed("start", bool, self._start, issue_num, context)
+
+    def finish(self, issue_num: int, progress: Optional[Dict[str, object]]) -> Dict[str, object]:
+        return self._timed("finish", lambda result: result.get("status") == "finished", self._finish, issue_num, progress)
+
+    def review(self, pr_number: int, progress: Optional[Dict[str, object]]) -> Dict[str, object]:
+        return self._timed("review", lambda result: result.get("status") == "pass", self._review, pr_number, progress)
+
+    def debug(self, command: str, progress: Optional[Dict[str, object]]) -> int:
+        return self._timed("debug", lambda code: code == 0, self._debug, command, progress)
+
+    def _start(self, issue_num: int, context: Dict[str, object]) -> bool:
+        if self.isolated:
+            argv = ["--issue", str(issue_num)]
+            if self.cwd:
+                argv += ["--worktree", self.cwd]
+            context_file = write_context_file(context)
+            try:
+                code = run_python_script(script_path(*STAGE_SCRIPTS["start"]), [*argv, "--context-file", context_file])
+            finally:
+                os.remove(context_file)
+            return code == 0
+        result = self._call("start", stage_module("start").start_task, issue_num, context)
+        return result.get("status") == "started"
+
+    def _finish(self, issue_num: int, progress: Optional[Dict[str, object]]) -> Dict[str, object]:
+        argv = ["--issue", str(issue_num), "--use-progress-verification", "--use-debugger", *self._impact_args()]
+        if self.isolated:
+            code = run_python_script(script_path(*STAGE_SCRIPTS["finish"]), argv, cwd=self.cwd)
+            return {"status": "finished" if code == 0 else "failed", "exit_code": code}
+        finish = stage_module("finish")
+        return self._call("finish", finish.finish_task, finish.build_parser().parse_args(argv), progress)
+
+    def _review(self, pr_number: int, progress: Optional[Dict[str, object]]) -> Dict[str, object]:
+        argv = [
+            "--pr",
+            str(pr_number),
+            "--progress-file",
+            PROGRESS_FILE,
+            "--use-progress-verification",
+            "--json",
+            *self._impact_args(),
+        ]
+        if self.isolated:
+            return run_json_script(script_path(*STAGE_SCRIPTS["review"]), argv, cwd=self.cwd)
+        review = stage_module("review")
+        result = self._call("review", review.review_task, review.build_parser().parse_args(argv), progress)
+        if result.get("status") in ("failed", "exited"):
+            return {"status": "fail", "error": f"Review exited with code {result['exit_code']}."}
+        review.print_human_summary(result)
+        return result
+
+    def _debug(self, command: str, progress: Optional[Dict[str, object]]) -> int:
+        argv = ["--command", command, "--progress-file", PROGRESS_FILE]
+        if self.isolated:
+            return run_python_script(script_path(*STAGE_SCRIPTS["debug"]), argv, cwd=self.cwd)
+        debug = stage_module("debug")
+        try:
+            return debug.debug_loop(debug.build_parser().parse_args(argv), progress)
+        except SystemExit as error:
+            return error.code if isinstance(error.code, int) else 1
+
+
+def remote_head(branch: str) -> Optional[str]:
+    output = run_command(["git", "ls-remote", "--heads", "origin", branch], fatal=False)
+    return output.split()[0] if output else None
+
+
+def local_ref(ref: str) -> Optional[str]:
+    result = subprocess.run(["git", "rev-parse", "--verify", "--quiet", ref], capture_output=True, text=True)
+    return result.stdout.strip() or None
+
+
+def ensure_integration_branch(branch: str) -> Optional[str]:
+    """
+    Check out the integration branch and bring it up to date with origin.
+
+    One `git ls-remote` tells whether the branch moved; the branch alone is
+    fetched and fast-forwarded only when the local branch or `origin/<branch>`
+    is behind, so an unchanged branch costs no fetch or pull. Returns the
+    synced remote head, which start reuses to skip its own fetch.
+    """
+    head = remote_head(branch)
+    if head and local_ref(f"refs/remotes/origin/{branch}") != head:
+        print(f"[Driver] Fetching {branch} ({head[:7]})...")
+        run_command(["git", "fetch", "origin", branch], fatal=False)
+    if run_command(["git", "branch", "--show-current"], fatal=False) != branch:
+        print(f"[Driver] Switching to {branch}...")
+        run_command(["git", "checkout", branch])
+    if head and local_ref(f"refs/heads/{branch}") != head:
+        run_command(["git", "merge", "--ff-only", f"origin/{branch}"], fatal=False)
+    if head and local_ref(f"refs/heads/{branch}") == head:
+        SYNCED_HEADS[branch] = head
+    else:
+        SYNCED_HEADS.pop(branch, None)
+    return SYNCED_HEADS.get(branch)
 
 
-def current_pr() -> Optional[Dict[str, object]]:
-    branch = run_command(["git", "branch", "--show-current"], fatal=False)
+def current_pr(cwd: Optional[str] = None) -> Optional[Dict[str, object]]:
+    branch = run_command(["git", "branch", "--show-current"], fatal=False, cwd=cwd)
     if not branch:
         return None
     output = run_command(
@@ -197,44 +619,100 @@ def current_pr() -> Optional[Dict[str, object]]:
     return prs[0] if prs else None
 
 
-def merge_pr(pr_number: int) -> None:
-    run_command(["gh", "pr", "merge", str(pr_number), "--merge", "--delete-branch"])
+def merge_pr(pr_number: int, delete_branch: bool = True) -> None:
+    command = ["gh", "pr", "merge", str(pr_number), "--merge"]
+    if delete_branch:
+        command.append("--delete-branch")
+    run_command(command)
+
+
+def worktree_path(issue_num: int) -> str:
+    common_dir = run_command(["git", "rev-parse", "--git-common-dir"])
+    return os.path.join(os.path.abspath(common_dir), WORKTREE_DIR, f"issue-{issue_num}")
+
+
+def remove_worktree(issue_num: int, path: str) -> None:
+    """Drop a merged issue's worktree and its feature branch, locally and on origin."""
+    if os.path.isdir(path):
+        run_command(["git", "worktree", "remove", path], fatal=False)
+    branch = feature_branch_name(issue_num)
+    run_command(["git", "branch", "-D", branch], fatal=False)
+    run_command(["git", "push", "origin", "--delete", branch], fatal=False)
 
 
 def close_issue(issue_num: int) -> None:
     run_command(["gh", "issue", "close", str(issue_num)], fatal=False)
 
 
-def update_integration_pr(integration_branch: str, issue_num: int, issue_title: str) -> None:
-    output = run_command(
-        [
-            "gh",
-            "pr",
-            "list",
-            "--head",
-            integration_branch,
-            "--state",
-            "open",
-            "--json",
-            "number,body",
-            "--limit",
-            "1",
-        ],
-        fatal=False,
-    )
-    if not output:
-        return
+class IntegrationPRUpdates:
+    """
+    Checklist lines for the integration PR, coalesced per branch.
+
+    Merged issues are queued and written with one PR lookup and one body edit
+    per flush; `add` flushes by itself once `batch_size` issues are pending.
+    """
+
+    def __init__(self, batch_size: int = INTEGRATION_PR_BATCH):
+        self.batch_size = batch_size
+        self.pending: Dict[str, List[str]] = {}
+        self._lock = threading.Lock()
+
+    def add(self, integration_branch: str, issue_num: int, issue_title: str) -> None:
+        with self._lock:
+            lines = self.pending.setdefault(integration_branch, [])
+            lines.append(f"- [x] Completed Issue #{issue_num}: {issue_title}")
+            if len(lines) < self.batch_size:
+                return
+        self.flush(integration_branch)
+
+    def flush(self, integration_branch: Optional[str] = None) -> None:
+        """Write the queued lines of one branch (or of every branch) to its integration PR."""
+        with self._lock:
+            branches = [integration_branch] if integration_branch else list(self.pending)
+            for branch in branches:
+                lines = self.pending.pop(branch, [])
+                if lines:
+                    self._write(branch, lines)
+
+    def _write(self, integration_branch: str, lines: List[str]) -> None:
+        output = run_command(
+            [
+                "gh",
+                "pr",
+                "list",
+                "--head",
+                integration_branch,
+                "--state",
+                "open",
+                "--json",
+                "number,body",
+                "--limit",
+                "1",
+            ],
+            fatal=False,
+        )
+        if not output:
+            return
 
-    prs = json.loads(output)
-    if not prs:
-        return
+        prs = json.loads(output)
+        if not prs:
+            return
+
+        current_body = prs[0].get("body") or ""
+        new_lines = [line for line in dict.fromkeys(lines) if line not in current_body]
+        if not new_lines:
+            return
+        new_body = "\n".join([current_body, *new_lines]).strip()
+        print(f"[Driver] Updating integration PR #{prs[0]['number']} with {len(new_lines)} completed issue(s).")
+        run_command(["gh", "pr", "edit", str(prs[0]["number"]), "--body", new_body], fatal=False)
 
-    current_body = prs[0].get("body") or ""
-    new_line = f"- [x] Completed Issue #{issue_num}: {issue_title}"
-    if new_line in current_body:
-        return
-    new_body = f"{current_body}\n{new_line}".strip()
-    run_command(["gh", "pr", "edit", str(prs[0]["number"]), "--body", new_body], fatal=False)
+
+INTEGRATION_PR = IntegrationPRUpdates()
+
+
+def update_integration_pr(integration_branch: str, issue_num: int, issue_title: str) -> None:
+    """Queue the checklist line for a merged issue; see `IntegrationPRUpdates`."""
+    INTEGRATION_PR.add(integration_branch, issue_num, issue_title)
 
 
 def first_failed_verification(review_result: Dict[str, object]) -> Optional[str]:
@@ -242,7 +720,7 @@ def first_failed_verification(review_result: Dict[str, object]) -> Optional[str]
     if not isinstance(verification, list):
         return None
     for item in verification:
-        if isinstance(item, dict) and item.get("status") == "failed":
+        if isinstance(item, dict) and item.get("status") in ("failed", "timeout", "oom"):
             return str(item.get("command"))
     return None
 
@@ -267,47 +745,61 @@ def print_review_failures(review_result: Dict[str, object]) -> None:
 
 
 def create_release_pr(milestone_title: str, integration_branch: str) -> None:
+    """
+    Open the release PR. Closed issues are listed page by page and each page
+    is appended to the body file as it arrives, so large milestones get
+    complete notes without holding every issue or passing the body on argv.
+    """
     print(f"\n[Driver] Creating release PR for {milestone_title}...")
-    output = run_command(
-        ["gh", "issue", "list", "--milestone", milestone_title, "--state", "closed", "--json", "number,title"],
-        fatal=False,
-    )
-    closed_issues = json.loads(output) if output else []
-
-    body_lines = [
-        f"# Release: {milestone_title}",
-        "",
-        "## Released Features",
-        "",
-    ]
-    if closed_issues:
-        for issue in closed_issues:
-            body_lines.append(f"- Closes #{issue['number']}: {issue['title']}")
-    else:
-        body_lines.append("- No closed issues found for this milestone.")
-
-    body_lines.extend(["", "## Integration Details", f"Merges `{integration_branch}` into `main`."])
-    body = "\n".join(body_lines)
-
-    run_command(
-        [
-            "gh",
-            "pr",
-            "create",
-            "--title",
-            f"Release: {milestone_title}",
-            "--body",
-            body,
-            "--base",
-            "main",
-            "--head",
-            integration_branch,
-        ],
-        fatal=False,
-    )
-
-
-def drive_milestone(milestone_title: Optional[str] = None, resume_issue: Optional[int] = None) -> None:
+    with tempfile.NamedTemporaryFile("w", encoding="utf-8", suffix=".md", delete=False) as body_file:
+        body_file.write(f"# Release: {milestone_title}\n\n## Released Features\n\n")
+        count = 0
+        try:
+            with TELEMETRY.span("github", "milestone_issues"):
+                for page in github_index().iter_milestone_issue_pages(None, milestone_title, states=["CLOSED"]):
+                    body_file.writelines(f"- Closes #{issue['number']}: {issue['title']}\n" for issue in page)
+                    count += len(page)
+        except RuntimeError as error:
+            print(f"[Driver] Could not list closed issues for '{milestone_title}': {error}")
+            if count:
+                body_file.write("- (list incomplete: closed issues could not be fully listed)\n")
+        if not count:
+            body_file.write("- No closed issues found for this milestone.\n")
+        body_file.write(f"\n## Integration Details\nMerges `{integration_branch}` into `main`.\n")
+
+    print(f"[Driver] Release notes list {count} closed issue(s).")
+    try:
+        run_command(
+            [
+                "gh",
+                "pr",
+                "create",
+                "--title",
+                f"Release: {milestone_title}",
+                "--body-file",
+                body_file.name,
+                "--base",
+                "main",
+                "--head",
+                integration_branch,
+            ],
+            fatal=False,
+        )
+    finally:
+        os.remove(body_file.name)
+
+
+def drive_milestone(
+    milestone_title: Optional[str] = None,
+    resume_issue: Optional[int] = None,
+    stages: Optional[StageRunner] = None,
+    parallel: int = 1,
+    policy: Optional[Dict[str, object]] = None,
+    readiness=None,
+) -> None:
+    stages = stages or StageRunner()
+    policy = policy or DEFAULT_POLICY
+    journal = StepJournal()
     if not milestone_title:
         state = load_state()
         if not state:
@@ -324,106 +816,461 @@ def drive_milestone(milestone_title: Optional[str] = None, resume_issue: Optiona
         clear_state()
         return
 
+    read_first = {
+        int(issue["number"]): extract_context_sections(str(issue.get("body") or ""))["Read first"] for issue in issues
+    }
+    try:
+        schedule = build_schedule(issues, read_first)
+    except CycleError as error:
+        print(f"[Driver] {error}. Fix the issue dependencies before driving this milestone.")
+        return
+    print("[Driver] Schedule:")
+    for line in describe_schedule(schedule):
+        print(line)
+    issues = schedule.ordered()
+
     integration_branch = detect_integration_branch(milestone_title)
     print(f"[Driver] Integration branch: {integration_branch}")
     ensure_integration_branch(integration_branch)
 
-    start_script = script_path("project-task-start", "start.py")
-    finish_script = script_path("project-task-finish", "finish.py")
-    review_script = script_path("project-task-review", "review.py")
-    debug_script = script_path("project-task-debugger", "debug.py")
+    if parallel > 1:
+        if resume_issue:
+            numbers = [int(issue["number"]) for issue in issues]
+            issues = issues[numbers.index(resume_issue):] if resume_issue in numbers else []
+            schedule = build_schedule(issues, read_first)
+        completed = drive_parallel(
+            milestone_title, schedule, integration_branch, journal, parallel, policy, readiness, stages
+        )
+        INTEGRATION_PR.flush()
+        if not completed:
+            return
+        issues = []
 
-    for issue in issues:
-        issue_num = int(issue["number"])
-        issue_title = str(issue["title"])
+    prefetcher = IssuePrefetcher()
+    skipped: List[int] = []
+    try:
+        for position, issue in enumerate(issues):
+            issue_num = int(issue["number"])
+            issue_title = str(issue["title"])
 
-        if resume_issue and issue_num != resume_issue:
-            continue
-        resume_issue = None
+            if resume_issue and issue_num != resume_issue:
+                continue
+            resume_issue = None
+            if issue_num in schedule.blocked():
+                print(f"\n[Driver] Skipping Issue #{issue_num}: it depends on an abandoned issue.")
+                skipped.append(issue_num)
+                continue
+            schedule.mark_started(issue_num)
+
+            set_current_issue(issue_num)
+            save_state(milestone_title, issue_num)
+            print(f"\n--- Processing Issue #{issue_num}: {issue_title} ---")
+            context = prefetcher.get(issue_num)
+
+            resume = resume_point(journal, milestone_title, issue_num)
+            if resume is not None:
+                print(f"[Driver] Resuming Issue #{issue_num} after step '{resume['step']}'.")
+            else:
+                ensure_integration_branch(integration_branch)
+                if not stages.start(issue_num, with_synced_base(context, integration_branch)):
+                    print(f"[Driver] project-task-start failed for Issue #{issue_num}.")
+                    sys.exit(1)
+                journal.record(milestone_title, issue_num, "started", branch=feature_branch_name(issue_num))
+
+            print_issue_context(context["issue"], context["sections"])
+            blocked = set(schedule.blocked())
+            upcoming = next((int(item["number"]) for item in issues[position + 1:] if int(item["number"]) not in blocked), None)
+            if upcoming is not None:
+                # Fetch the next issue the schedule will run while this one is being implemented.
+                prefetcher.prefetch(upcoming)
+
+            try:
+                drive_issue(
+                    issue_num,
+                    issue_title,
+                    integration_branch,
+                    stages,
+                    journal,
+                    milestone_title,
+                    resume,
+                    policy=policy,
+                    readiness=readiness,
+                )
+            except IssueAbandoned as error:
+                journal.record(milestone_title, issue_num, "abandoned", reason=str(error))
+                if policy["on_failure"] != "skip":
+                    print(f"[Driver] {error}. Halting; use --resume to retry it.")
+                    sys.exit(1)
+                print(f"[Driver] {error}. Skipping it and its dependents.")
+                schedule.mark_failed(issue_num)
+                skipped.append(issue_num)
+                continue
+            schedule.mark_done(issue_num)
+    finally:
+        prefetcher.shutdown()
+        set_current_issue(None)
+        INTEGRATION_PR.flush()
+
+    if skipped:
+        skipped.sort(key=schedule.position.get)
+        save_state(milestone_title, skipped[0])
+        print(f"[Driver] Skipped issues: {', '.join(f'#{number}' for number in skipped)}.")
+        print("[Driver] Release PR not created. Use --resume to retry the skipped issues.")
+        return
+
+    clear_state()
+    print(f"=== Project Driver complete: {milestone_title} ===")
+    if integration_branch != "main":
+        create_release_pr(milestone_title, integration_branch)
 
-        save_state(milestone_title, issue_num)
-        ensure_integration_branch(integration_branch)
 
-        print(f"\n--- Processing Issue #{issue_num}: {issue_title} ---")
-        start_code = run_python_script(start_script, ["--issue", str(issue_num)])
-        if start_code != 0:
-            print(f"[Driver] project-task-start failed for Issue #{issue_num}.")
-            sys.exit(start_code)
+def drive_issue_in_worktree(
+    issue: Dict[str, object],
+    milestone_title: str,
+    integration_branch: str,
+    journal: StepJournal,
+    merge_lock: threading.Lock,
+    policy: Dict[str, object],
+    readiness=None,
+    stages: Optional[StageRunner] = None,
+) -> None:
+    """Start (or resume) one issue in its own worktree and drive it until it is merged."""
+    issue_num = int(issue["number"])
+    issue_title = str(issue["title"])
+    set_current_issue(issue_num)
+    path = worktree_path(issue_num)
+    stages = (stages or StageRunner()).in_worktree(path)
+    print(f"\n--- Processing Issue #{issue_num}: {issue_title} (worktree {path}) ---")
+    context = fetch_issue_context(issue_num)
+
+    entry = journal.last_step(milestone_title, issue_num)
+    if (entry is None or entry["step"] != "merged") and not os.path.isdir(path):
+        if not stages.start(issue_num, with_synced_base(context, integration_branch)):
+            raise RuntimeError(f"project-task-start failed for Issue #{issue_num}")
+    if entry is None:
+        journal.record(milestone_title, issue_num, "started", branch=feature_branch_name(issue_num), worktree=path)
+    resume = resume_point(journal, milestone_title, issue_num, worktree=path)
+    if entry is not None:
+        print(f"[Driver] Resuming Issue #{issue_num} after step '{resume['step']}'.")
+
+    print_issue_context(context["issue"], context["sections"], path)
+    drive_issue(
+        issue_num,
+        issue_title,
+        integration_branch,
+        stages,
+        journal,
+        milestone_title,
+        resume,
+        merge_lock,
+        policy,
+        readiness,
+    )
 
-        issue_details = get_issue_details(issue_num)
-        print_issue_context(issue_details)
 
+def drive_parallel(
+    milestone_title: str,
+    schedule: IssueSchedule,
+    integration_branch: str,
+    journal: StepJournal,
+    slots: int,
+    policy: Dict[str, object],
+    readiness=None,
+    stages: Optional[StageRunner] = None,
+) -> bool:
+    """
+    Drive up to `slots` issues at once, each in its own worktree on
+    `feat/issue-N`. An issue is only started once everything it depends on
+    has merged. Merges into the integration branch are serialized. Returns
+    True when every issue was merged; failed or stopped issues leave the saved
+    state pointing at the first unfinished one. With the "halt" failure policy
+    no new issues are started after the first one fails.
+    """
+    print(f"[Driver] Parallel mode: up to {slots} issues at once.")
+    merge_lock = threading.Lock()
+    in_flight: Dict[Future, int] = {}
+    unfinished: List[int] = []
+    stopping = False
+    saved: Optional[int] = None
+
+    with ThreadPoolExecutor(max_workers=slots) as pool:
         while True:
+            while len(in_flight) < slots and not stopping:
+                ready = schedule.ready()
+                if not ready:
+                    break
+                issue_num = int(ready[0]["number"])
+                schedule.mark_started(issue_num)
+                future = pool.submit(
+                    drive_issue_in_worktree,
+                    ready[0],
+                    milestone_title,
+                    integration_branch,
+                    journal,
+                    merge_lock,
+                    policy,
+                    readiness,
+                    stages,
+                )
+                in_flight[future] = issue_num
+
+            open_numbers = unfinished + list(in_flight.values()) + schedule.waiting()
+            first_open = min(open_numbers, key=schedule.position.get) if open_numbers else None
+            if first_open is not None and first_open != saved:
+                saved = first_open
+                save_state(milestone_title, saved)
+            if not in_flight:
+                break
+
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                issue_num = in_flight.pop(future)
+                try:
+                    future.result()
+                    schedule.mark_done(issue_num)
+                    continue
+                except SystemExit as error:
+                    unfinished.append(issue_num)
+                    if error.code in (0, None):
+                        stopping = True
+                        print("[Driver] Stop requested; waiting for in-flight issues to reach a prompt.")
+                    else:
+                        print(f"[Driver] Issue #{issue_num} stopped with exit code {error.code}.")
+                except Exception as error:
+                    unfinished.append(issue_num)
+                    if isinstance(error, IssueAbandoned):
+                        journal.record(milestone_title, issue_num, "abandoned", reason=str(error))
+                    print(f"[Driver] Issue #{issue_num} failed: {error}")
+                    if policy["on_failure"] != "skip" and not stopping:
+                        stopping = True
+                        print("[Driver] Halting: no new issues will be started.")
+                schedule.mark_failed(issue_num)
+
+    if unfinished or schedule.waiting():
+        print(f"[Driver] Unfinished issues: {', '.join(f'#{number}' for number in sorted(unfinished))}.")
+        blocked = schedule.blocked()
+        if blocked:
+            print(f"[Driver] Blocked by them: {', '.join(f'#{number}' for number in blocked)}.")
+        print("[Driver] Use --resume to continue.")
+        return False
+    return True
+
+
+def drive_issue(
+    issue_num: int,
+    issue_title: str,
+    integration_branch: str,
+    stages: StageRunner,
+    journal: StepJournal,
+    milestone_title: str,
+    resume: Optional[Dict[str, object]] = None,
+    merge_lock: Optional[threading.Lock] = None,
+    policy: Optional[Dict[str, object]] = None,
+    readiness=None,
+) -> None:
+    """
+    Implementation -> finish -> review loop for one started issue, until it is
+    merged. Each completed sub-step is journaled; `resume` (a journal entry)
+    skips the steps that already succeeded. When the stages run in an issue
+    worktree (`stages.cwd`), merging and the integration-branch updates hold
+    `merge_lock` so parallel issues merge one at a time.
+
+    `policy` may merge without asking and limits review loops and time; an
+    issue over its budget raises IssueAbandoned. With a `readiness` hook the
+    implementer signals through it instead of the prompt.
+    """
+    policy = policy or DEFAULT_POLICY
+    budget = IssueBudget(issue_num, policy)
+    worktree = stages.cwd
+    step = str(resume["step"]) if resume else "started"
+    pr: Optional[Dict[str, object]] = resume["data"].get("pr") if resume else None
+    progress: Optional[Dict[str, object]] = None
+
+    def record(name: str, **data: object) -> None:
+        journal.record(milestone_title, issue_num, name, **data)
+
+    while True:
+        if step == "started":
             print("\n[Driver] Implementation handoff")
             print(f"- Issue #{issue_num}: {issue_title}")
             print(f"- Use `project-task-implementer` and keep `{PROGRESS_FILE}` updated.")
             print("- Review should pass against Definition of done and Verification, not only compile success.")
-            user_input = input("Press Enter when implementation is ready for finish/review (or 'q' to stop): ").strip().lower()
-            if user_input == "q":
-                sys.exit(0)
-
-            finish_code = run_python_script(
-                finish_script,
-                ["--issue", str(issue_num), "--use-progress-verification", "--use-debugger"],
-            )
-            if finish_code != 0:
+            if worktree:
+                print(f"- Worktree: {worktree}")
+            if readiness is not None:
+                print(f"- Signal readiness with: {readiness.describe(issue_num)}")
+                with TELEMETRY.span("wait", "readiness"):
+                    signal = readiness.wait(issue_num, budget.remaining())
+                if signal == "timeout":
+                    raise IssueAbandoned(f"Issue #{issue_num} exceeded its time budget")
+                if signal == "stop":
+                    sys.exit(0)
+            else:
+                user_input = ask(
+                    f"[Issue #{issue_num}] Press Enter when implementation is ready for finish/review (or 'q' to stop): "
+                )
+                if user_input == "q":
+                    sys.exit(0)
+                budget.check_time()
+
+            progress = stages.read_progress()
+            finish_result = stages.finish(issue_num, progress)
+            if finish_result.get("status") != "finished":
                 print("[Driver] Finish failed. Check TASK_DEBUG.md or verification output, then continue implementation.")
+                budget.loop_back()
                 continue
+            record(
+                "verified",
+                head=head_commit(worktree),
+                pr_url=finish_result.get("pr_url"),
+                verification=verification_summary(finish_result),
+            )
+            step = "verified"
 
-            pr = current_pr()
+        if step == "verified":
+            pr = current_pr(worktree)
             if not pr:
                 print("[Driver] No open PR found for the current branch after finish.")
+                step = "started"
+                budget.loop_back()
                 continue
+            record("pr_opened", head=head_commit(worktree), pr=pr)
+            step = "pr_opened"
 
-            review_result = run_json_script(
-                review_script,
-                ["--pr", str(pr["number"]), "--progress-file", PROGRESS_FILE, "--use-progress-verification", "--json"],
-            )
+        if step == "pr_opened":
+            if progress is None:
+                progress = stages.read_progress()
+            review_result = stages.review(int(pr["number"]), progress)
 
             if review_result.get("status") != "pass":
                 print_review_failures(review_result)
                 failed_command = first_failed_verification(review_result)
                 if failed_command:
                     print(f"[Driver] Creating debug report for failed command: {failed_command}")
-                    run_python_script(debug_script, ["--command", failed_command, "--progress-file", PROGRESS_FILE])
+                    stages.debug(failed_command, progress)
+                progress = None
+                record("reopened", reason="review failed", verification=verification_summary(review_result))
                 print("[Driver] Looping back to implementation.")
+                step = "started"
+                budget.loop_back()
                 continue
+            record("reviewed", head=head_commit(worktree), pr=pr, verification=verification_summary(review_result))
+            step = "reviewed"
 
+        if step == "reviewed":
             print(f"[Driver] Review passed for PR #{pr['number']}: {pr['title']}")
-            merge_input = input("Merge this PR and close the issue? (y/n): ").strip().lower()
+            if policy["auto_merge"]:
+                merge_input = "y"
+                print("[Driver] Merging (auto_merge policy).")
+            else:
+                merge_input = ask(f"[Issue #{issue_num}] Merge this PR and close the issue? (y/n): ")
             if merge_input != "y":
+                record("reopened", reason="merge postponed")
                 print("[Driver] Merge postponed. Returning to implementation loop.")
+                step = "started"
                 continue
 
-            merge_pr(int(pr["number"]))
+        with merge_lock or contextlib.nullcontext():
+            if step == "reviewed":
+                # gh cannot delete a branch that is checked out in a worktree; remove_worktree does it afterwards.
+                merge_pr(int(pr["number"]), delete_branch=worktree is None)
+                record("merged", pr=pr)
+            if worktree:
+                remove_worktree(issue_num, worktree)
             close_issue(issue_num)
             ensure_integration_branch(integration_branch)
             update_integration_pr(integration_branch, issue_num, issue_title)
-            print(f"[Driver] Issue #{issue_num} complete.")
-            break
-
-    clear_state()
-    print(f"=== Project Driver complete: {milestone_title} ===")
-    if integration_branch != "main":
-        create_release_pr(milestone_title, integration_branch)
+        print(f"[Driver] Issue #{issue_num} complete.")
+        return
 
 
 def main() -> None:
     parser = argparse.ArgumentParser(description="Drive milestone execution with week-issue context.")
     parser.add_argument("--milestone", type=str, help="Milestone title to drive")
     parser.add_argument("--resume", action="store_true", help="Resume from saved state")
+    parser.add_argument(
+        "--parallel",
+        type=int,
+        default=1,
+        help="Issues worked on at once, each in its own git worktree (default: 1, the current checkout).",
+    )
+    parser.add_argument(
+        "--subprocess-stages",
+        action="store_true",
+        help="Run start/finish/review/debug as separate python3 processes instead of in-process.",
+    )
+    parser.add_argument(
+        "--telemetry-file",
+        help="JSONL file that stage and command timing spans are appended to "
+        f"(default: {DEFAULT_TELEMETRY_FILE} in the common git directory, outside the working tree).",
+    )
+    parser.add_argument("--no-telemetry", action="store_true", help="Do not record timing spans.")
+    parser.add_argument(
+        "--report",
+        action="store_true",
+        help="Print per-stage and per-issue latency percentiles and the slowest commands from the telemetry file.",
+    )
+    parser.add_argument(
+        "--integration-pr-batch",
+        type=int,
+        default=INTEGRATION_PR_BATCH,
+        help="Merged issues collected before the integration PR checklist is updated; the rest are written "
+        f"when the run ends (default: {INTEGRATION_PR_BATCH}).",
+    )
+    parser.add_argument(
+        "--test-impact",
+        action="store_true",
+        help="Pass --test-impact to finish and review: reviews run only the tests affected by each issue's "
+        "changes; the final finish still runs the full suite.",
+    )
+    parser.add_argument(
+        "--policy",
+        type=str,
+        help="JSON policy for unattended runs: auto_merge, max_review_loops, issue_time_budget_minutes, "
+        "on_failure (skip/halt), and readiness (stdin/file/socket).",
+    )
     args = parser.parse_args()
+    # Inside the working tree the file would be committed by finish and change the verification cache key.
+    args.telemetry_file = args.telemetry_file or git_common_path(DEFAULT_TELEMETRY_FILE)
 
-    if args.resume and not args.milestone:
-        drive_milestone()
-    elif args.milestone:
-        drive_milestone(args.milestone)
-    else:
+    if args.report:
+        if not os.path.exists(args.telemetry_file):
+            print(f"No telemetry file at {args.telemetry_file}.")
+            sys.exit(1)
+        for line in report_lines(load_spans(args.telemetry_file)):
+            print(line)
+        return
+
+    try:
+        policy = load_policy(args.policy)
+    except (OSError, ValueError) as error:
+        print(f"Error: could not read policy {args.policy}: {error}")
+        sys.exit(1)
+
+    configure(None if args.no_telemetry else os.path.abspath(args.telemetry_file))
+    INTEGRATION_PR.batch_size = max(1, args.integration_pr_batch)
+    stages = StageRunner(isolated=args.subprocess_stages, test_impact=args.test_impact)
+
+    if not args.resume and not args.milestone:
         state = load_state()
         if state:
             print(f"Found saved state for '{state['milestone']}'. Use --resume to continue.")
         else:
             parser.print_help()
+        return
+
+    readiness = open_readiness(policy)
+    try:
+        drive_milestone(
+            args.milestone,
+            stages=stages,
+            parallel=args.parallel,
+            policy=policy,
+            readiness=readiness,
+        )
+    finally:
+        if readiness is not None:
+            readiness.close()
 
 
 if __name__ == "__main__":
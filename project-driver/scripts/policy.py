@@ -0,0 +1,173 @@
+import json
+import os
+import socket
+import threading
+import time
+from typing import Dict, Optional, Set, Tuple
+
+DEFAULT_POLICY: Dict[str, object] = {
+    # Merge as soon as review passes instead of asking.
+    "auto_merge": False,
+    # Finish/review attempts that may fail before the issue is abandoned; 0 = unlimited.
+    "max_review_loops": 0,
+    # Wall-clock minutes one issue may take in this run before it is abandoned; 0 = unlimited.
+    "issue_time_budget_minutes": 0,
+    # What to do with an abandoned or failed issue: "skip" it (and its dependents) or "halt" the driver.
+    "on_failure": "halt",
+    # How the implementer signals readiness: {"type": "stdin"}, {"type": "file", "dir": ...},
+    # or {"type": "socket", "path": ...}.
+    "readiness": {"type": "stdin"},
+}
+SIGNALS = ("ready", "stop")
+FILE_POLL_INTERVAL = 1.0
+
+
+class IssueAbandoned(Exception):
+    """An issue ran out of review loops or time; the policy decides whether to skip it or halt."""
+
+
+def load_policy(path: Optional[str]) -> Dict[str, object]:
+    """Read a JSON policy file over `DEFAULT_POLICY`; raises ValueError on unknown or invalid settings."""
+    policy = dict(DEFAULT_POLICY)
+    if not path:
+        return policy
+    with open(path, "r", encoding="utf-8") as file:
+        data = json.load(file)
+    unknown = set(data) - set(DEFAULT_POLICY)
+    if unknown:
+        raise ValueError(f"unknown policy settings: {', '.join(sorted(unknown))}")
+    policy.update(data)
+    if policy["on_failure"] not in ("skip", "halt"):
+        raise ValueError("on_failure must be 'skip' or 'halt'")
+    readiness = policy["readiness"]
+    if not isinstance(readiness, dict) or readiness.get("type") not in ("stdin", "file", "socket"):
+        raise ValueError("readiness.type must be 'stdin', 'file', or 'socket'")
+    if readiness["type"] == "file" and not readiness.get("dir"):
+        raise ValueError("file readiness needs a 'dir'")
+    if readiness["type"] == "socket" and not readiness.get("path"):
+        raise ValueError("socket readiness needs a 'path'")
+    return policy
+
+
+class FileReadiness:
+    """
+    Readiness through marker files: the implementer creates `<dir>/ready-<issue>`
+    (or `stop-<issue>`), and the driver consumes the file when it sees it.
+    """
+
+    def __init__(self, directory: str, poll_interval: float = FILE_POLL_INTERVAL):
+        self.directory = os.path.abspath(directory)
+        self.poll_interval = poll_interval
+        os.makedirs(self.directory, exist_ok=True)
+
+    def describe(self, issue_num: int) -> str:
+        return f"touch {os.path.join(self.directory, f'ready-{issue_num}')}"
+
+    def wait(self, issue_num: int, timeout: Optional[float]) -> str:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            for signal in SIGNALS:
+                path = os.path.join(self.directory, f"{signal}-{issue_num}")
+                if os.path.exists(path):
+                    os.remove(path)
+                    return signal
+            if deadline is not None and time.monotonic() >= deadline:
+                return "timeout"
+            delay = self.poll_interval if deadline is None else min(self.poll_interval, max(0.0, deadline - time.monotonic()))
+            time.sleep(delay)
+
+    def close(self) -> None:
+        pass
+
+
+class SocketReadiness:
+    """
+    Readiness through a Unix socket: a client sends one line, `ready <issue>`
+    or `stop <issue>`, and gets `ok` back. Signals that arrive before the
+    driver waits for that issue are kept until it does.
+    """
+
+    def __init__(self, path: str):
+        self.path = os.path.abspath(path)
+        if os.path.exists(self.path):
+            os.remove(self.path)
+        self._server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._server.bind(self.path)
+        self._server.listen()
+        self._signals: Set[Tuple[str, int]] = set()
+        self._changed = threading.Condition()
+        self._closed = False
+        threading.Thread(target=self._serve, daemon=True).start()
+
+    def describe(self, issue_num: int) -> str:
+        return f"echo 'ready {issue_num}' | nc -U {self.path}"
+
+    def _serve(self) -> None:
+        while not self._closed:
+            try:
+                connection, _ = self._server.accept()
+            except OSError:
+                return
+            with connection:
+                parts = connection.makefile("r").readline().split()
+                if len(parts) == 2 and parts[0] in SIGNALS and parts[1].lstrip("#").isdigit():
+                    with self._changed:
+                        self._signals.add((parts[0], int(parts[1].lstrip("#"))))
+                        self._changed.notify_all()
+                    connection.sendall(b"ok\n")
+                else:
+                    connection.sendall(b"error: expected 'ready <issue>' or 'stop <issue>'\n")
+
+    def wait(self, issue_num: int, timeout: Optional[float]) -> str:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._changed:
+            while True:
+                for signal in SIGNALS:
+                    if (signal, issue_num) in self._signals:
+                        self._signals.discard((signal, issue_num))
+                        return signal
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return "timeout"
+                self._changed.wait(remaining)
+
+    def close(self) -> None:
+        self._closed = True
+        self._server.close()
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+
+def open_readiness(policy: Dict[str, object]):
+    """The readiness hook configured by the policy, or None for the interactive stdin prompt."""
+    readiness = policy["readiness"]
+    if readiness["type"] == "file":
+        return FileReadiness(str(readiness["dir"]))
+    if readiness["type"] == "socket":
+        return SocketReadiness(str(readiness["path"]))
+    return None
+
+
+class IssueBudget:
+    """Review-loop and wall-clock limits for one issue under a policy."""
+
+    def __init__(self, issue_num: int, policy: Dict[str, object]):
+        self.issue_num = issue_num
+        self.max_loops = int(policy["max_review_loops"] or 0)
+        minutes = float(policy["issue_time_budget_minutes"] or 0)
+        self.deadline = time.monotonic() + minutes * 60 if minutes else None
+        self.loops = 0
+
+    def remaining(self) -> Optional[float]:
+        return None if self.deadline is None else max(0.0, self.deadline - time.monotonic())
+
+    def check_time(self) -> None:
+        if self.deadline is not None and time.monotonic() >= self.deadline:
+            raise IssueAbandoned(f"Issue #{self.issue_num} exceeded its time budget")
+
+    def loop_back(self) -> None:
+        """Count one failed attempt that sends the issue back to implementation."""
+        self.loops += 1
+        if self.max_loops and self.loops >= self.max_loops:
+            raise IssueAbandoned(f"Issue #{self.issue_num} used all {self.max_loops} review loops")
+        self.check_time()
@@ -0,0 +1,171 @@
+import heapq
+import re
+from typing import Dict, Iterable, List, Optional, Set
+
+# "Depends on #12", "blocked by #3 and #4", "after: #7, #8", "requires Week 3", "after Week 2 & Week 5"
+DEPENDENCY_RE = re.compile(
+    r"\b(?:depends\s+on|blocked\s+by|requires|after)\s*:?\s*"
+    r"((?:(?:#\d+|week\s+\d+)(?:\s*(?:,|&|and)\s*)?)+)",
+    re.IGNORECASE,
+)
+ISSUE_REF_RE = re.compile(r"#(\d+)")
+WEEK_REF_RE = re.compile(r"\bweek\s+(\d+)\b", re.IGNORECASE)
+WEEK_TITLE_RE = re.compile(r"^\s*Week\s+(\d+)\s*:", re.IGNORECASE)
+
+
+class CycleError(ValueError):
+    """Raised when issue dependencies form a cycle; `cycle` lists the issue numbers in order."""
+
+    def __init__(self, cycle: List[int]):
+        self.cycle = cycle
+        super().__init__("Dependency cycle: " + " -> ".join(f"#{number}" for number in cycle))
+
+
+def week_number(title: str) -> Optional[int]:
+    match = WEEK_TITLE_RE.match(title or "")
+    return int(match.group(1)) if match else None
+
+
+def _references(text: str, weeks: Dict[int, int]) -> Set[int]:
+    numbers = {int(number) for number in ISSUE_REF_RE.findall(text)}
+    numbers.update(weeks[int(week)] for week in WEEK_REF_RE.findall(text) if int(week) in weeks)
+    return numbers
+
+
+def issue_dependencies(issue: Dict[str, object], weeks: Dict[int, int], read_first: Iterable[str] = ()) -> Set[int]:
+    """
+    Issue numbers an issue has to wait for.
+
+    Explicit phrases in the body ("depends on #12", "after Week 3") count, and
+    so does any issue or week referenced from its "Read first" list. `weeks`
+    maps week numbers to the issue numbers of the same milestone.
+    """
+    dependencies: Set[int] = set()
+    for match in DEPENDENCY_RE.finditer(str(issue.get("body") or "")):
+        dependencies |= _references(match.group(1), weeks)
+    for line in read_first:
+        dependencies |= _references(line, weeks)
+    dependencies.discard(int(issue["number"]))
+    return dependencies
+
+
+def find_cycle(graph: Dict[int, Set[int]], nodes: Iterable[int]) -> List[int]:
+    """Return one dependency cycle among `nodes` (every one of them must still have an unmet dependency)."""
+    remaining = set(nodes)
+    node = min(remaining)
+    path: List[int] = []
+    seen: Dict[int, int] = {}
+    while node not in seen:
+        seen[node] = len(path)
+        path.append(node)
+        node = min(dependency for dependency in graph[node] if dependency in remaining)
+    return path[seen[node]:] + [node]
+
+
+class IssueSchedule:
+    """
+    Dependency DAG over the open issues of a milestone.
+
+    `order` is a topological order that keeps issue-number order wherever the
+    dependencies allow it. Dependencies on issues outside the schedule
+    (closed, or in another milestone) are treated as met and listed in
+    `external`. Cycles are rejected with `CycleError` when the schedule is built.
+    """
+
+    def __init__(self, issues: List[Dict[str, object]], dependencies: Dict[int, Set[int]]):
+        self.issues = {int(issue["number"]): issue for issue in issues}
+        self.external = {number: deps - set(self.issues) for number, deps in dependencies.items() if deps - set(self.issues)}
+        self.dependencies = {number: dependencies.get(number, set()) & set(self.issues) for number in self.issues}
+        self.dependents: Dict[int, Set[int]] = {number: set() for number in self.issues}
+        for number, deps in self.dependencies.items():
+            for dependency in deps:
+                self.dependents[dependency].add(number)
+        self.order = self._topological_order()
+        self.position = {number: index for index, number in enumerate(self.order)}
+        self.started: Set[int] = set()
+        self.done: Set[int] = set()
+        self.failed: Set[int] = set()
+
+    def _topological_order(self) -> List[int]:
+        waiting = {number: len(deps) for number, deps in self.dependencies.items()}
+        heap = [number for number, count in waiting.items() if count == 0]
+        heapq.heapify(heap)
+        order: List[int] = []
+        while heap:
+            number = heapq.heappop(heap)
+            order.append(number)
+            for dependent in self.dependents[number]:
+                waiting[dependent] -= 1
+                if waiting[dependent] == 0:
+                    heapq.heappush(heap, dependent)
+        if len(order) < len(self.issues):
+            raise CycleError(find_cycle(self.dependencies, set(self.issues) - set(order)))
+        return order
+
+    def ordered(self) -> List[Dict[str, object]]:
+        return [self.issues[number] for number in self.order]
+
+    def ready(self) -> List[Dict[str, object]]:
+        """Issues not started yet whose dependencies are all done; these can run concurrently."""
+        return [
+            self.issues[number]
+            for number in self.order
+            if number not in self.started and self.dependencies[number] <= self.done
+        ]
+
+    def mark_started(self, number: int) -> None:
+        self.started.add(number)
+
+    def mark_done(self, number: int) -> None:
+        self.done.add(number)
+
+    def mark_failed(self, number: int) -> None:
+        self.failed.add(number)
+
+    def blocked(self) -> List[int]:
+        """Issues that can no longer run because something they depend on failed."""
+        blocked: Set[int] = set()
+        frontier = list(self.failed)
+        while frontier:
+            for dependent in self.dependents[frontier.pop()]:
+                if dependent not in blocked:
+                    blocked.add(dependent)
+                    frontier.append(dependent)
+        return sorted(blocked - self.started, key=self.position.get)
+
+    def waiting(self) -> List[int]:
+        """Issues not started yet, in schedule order."""
+        return [number for number in self.order if number not in self.started]
+
+
+def build_schedule(
+    issues: List[Dict[str, object]],
+    read_first: Optional[Dict[int, List[str]]] = None,
+) -> IssueSchedule:
+    """Build the dependency schedule for `issues`; raises `CycleError` on circular dependencies."""
+    weeks: Dict[int, int] = {}
+    for issue in sorted(issues, key=lambda item: int(item["number"])):
+        week = week_number(str(issue.get("title") or ""))
+        if week is not None:
+            weeks.setdefault(week, int(issue["number"]))
+
+    read_first = read_first or {}
+    dependencies = {
+        int(issue["number"]): issue_dependencies(issue, weeks, read_first.get(int(issue["number"]), []))
+        for issue in issues
+    }
+    return IssueSchedule(issues, dependencies)
+
+
+def describe_schedule(schedule: IssueSchedule) -> List[str]:
+    """Human-readable schedule lines for the driver's output."""
+    lines = []
+    for number in schedule.order:
+        deps = sorted(schedule.dependencies[number], key=schedule.position.get)
+        suffix = f" (after {', '.join(f'#{dep}' for dep in deps)})" if deps else ""
+        lines.append(f"- #{number}: {schedule.issues[number].get('title', '')}{suffix}")
+    for number, deps in sorted(schedule.external.items()):
+        lines.append(f"- #{number} also references {', '.join(f'#{dep}' for dep in sorted(deps))} outside this milestone (not scheduled).")
+    ready = [int(issue["number"]) for issue in schedule.ready()]
+    lines.append(f"Ready now: {', '.join(f'#{number}' for number in ready) or 'none'}")
+    return lines
@@ -0,0 +1,163 @@
+import contextlib
+import json
+import threading
+import time
+from typing import Dict, Iterator, List, Optional
+
+DEFAULT_TELEMETRY_FILE = "DRIVER_TELEMETRY.jsonl"
+SLOWEST_COMMANDS = 10
+
+_local = threading.local()
+
+
+class Telemetry:
+    """
+    Append-only JSONL spans for the driver.
+
+    Each line is `{"kind", "name", "issue", "start", "end", "duration",
+    "exit_code", ...}` where kind is `stage` (start/finish/review/debug),
+    `command` (git/gh run by the driver), `github` (GraphQL lookups), or
+    `wait` (time spent at a prompt). Command spans also carry `argv` and the
+    `stdout_bytes`/`stderr_bytes` they produced. A disabled instance (no path)
+    records nothing.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path
+        self._lock = threading.Lock()
+
+    def record(self, span: Dict[str, object]) -> None:
+        if not self.path:
+            return
+        line = json.dumps(span, ensure_ascii=False) + "\n"
+        with self._lock, open(self.path, "a", encoding="utf-8") as file:
+            file.write(line)
+
+    @contextlib.contextmanager
+    def span(self, kind: str, name: str, **attrs: object) -> Iterator[Dict[str, object]]:
+        """Time the body; callers may set `exit_code` and byte counts on the yielded dict."""
+        span: Dict[str, object] = {"kind": kind, "name": name, "issue": current_issue(), **attrs}
+        started = time.time()
+        clock = time.monotonic()
+        try:
+            yield span
+        except SystemExit as error:
+            span.setdefault("exit_code", error.code if isinstance(error.code, int) else 1)
+            raise
+        except BaseException:
+            span.setdefault("exit_code", -1)
+            raise
+        finally:
+            span["start"] = round(started, 3)
+            span["duration"] = round(time.monotonic() - clock, 3)
+            span["end"] = round(started + float(span["duration"]), 3)
+            self.record(span)
+
+
+TELEMETRY = Telemetry()
+
+
+def configure(path: Optional[str]) -> Telemetry:
+    """Point the process-wide recorder at `path` (None disables it)."""
+    TELEMETRY.path = path
+    return TELEMETRY
+
+
+def set_current_issue(issue_num: Optional[int]) -> None:
+    """Attribute spans recorded on this thread to an issue."""
+    _local.issue = issue_num
+
+
+def current_issue() -> Optional[int]:
+    return getattr(_local, "issue", None)
+
+
+def load_spans(path: str) -> List[Dict[str, object]]:
+    spans: List[Dict[str, object]] = []
+    with open(path, "r", encoding="utf-8") as file:
+        for line in file:
+            try:
+                spans.append(json.loads(line))
+            except json.JSONDecodeError:
+                continue
+    return spans
+
+
+def percentile_stats(samples: List[float]) -> Dict[str, float]:
+    """Count, total, p50, p95, and max of `samples` (seconds)."""
+    samples = sorted(samples)
+    count = len(samples)
+    return {
+        "count": count,
+        "total": sum(samples),
+        "p50": samples[(count - 1) // 2],
+        "p95": samples[min(count - 1, int(round(0.95 * (count - 1))))],
+        "max": samples[-1],
+    }
+
+
+def _stats_lines(title: str, groups: Dict[str, List[float]]) -> List[str]:
+    lines = [f"{title:<28} {'count':>5} {'total':>9} {'p50':>8} {'p95':>8} {'max':>8}"]
+    for key, samples in sorted(groups.items(), key=lambda item: -sum(item[1])):
+        stat = percentile_stats(samples)
+        lines.append(
+            f"{key:<28} {stat['count']:>5} {stat['total']:>8.1f}s {stat['p50']:>7.2f}s "
+            f"{stat['p95']:>7.2f}s {stat['max']:>7.2f}s"
+        )
+    return lines
+
+
+def report_lines(spans: List[Dict[str, object]], slowest: int = SLOWEST_COMMANDS) -> List[str]:
+    """Per-stage and per-issue latency percentiles plus the slowest commands."""
+    if not spans:
+        return ["No telemetry recorded."]
+
+    by_stage: Dict[str, List[float]] = {}
+    for span in spans:
+        by_stage.setdefault(f"{span['kind']}:{span['name']}", []).append(float(span["duration"]))
+
+    by_issue: Dict[str, Dict[str, float]] = {}
+    issue_bounds: Dict[str, List[float]] = {}
+    for span in spans:
+        issue = f"#{span['issue']}" if span.get("issue") is not None else "(milestone)"
+        totals = by_issue.setdefault(issue, {})
+        totals[str(span["kind"])] = totals.get(str(span["kind"]), 0.0) + float(span["duration"])
+        bounds = issue_bounds.setdefault(issue, [float(span["start"]), float(span["end"])])
+        bounds[0] = min(bounds[0], float(span["start"]))
+        bounds[1] = max(bounds[1], float(span["end"]))
+    issue_walls = {issue: end - start for issue, (start, end) in issue_bounds.items()}
+
+    wall = max(float(span["end"]) for span in spans) - min(float(span["start"]) for span in spans)
+    lines = [f"Spans: {len(spans)}, wall clock {wall:.1f}s", "", *_stats_lines("stage", by_stage), ""]
+
+    kinds = sorted({str(span["kind"]) for span in spans})
+    lines.append(f"{'issue':<12} {'wall':>10} " + " ".join(f"{kind:>10}" for kind in kinds))
+    for issue, totals in sorted(by_issue.items()):
+        lines.append(
+            f"{issue:<12} {issue_walls[issue]:>9.1f}s " + " ".join(f"{totals.get(kind, 0.0):>9.1f}s" for kind in kinds)
+        )
+    walls = [duration for issue, duration in issue_walls.items() if issue != "(milestone)"]
+    if walls:
+        lines.extend(["", *_stats_lines("issue wall time", {"issues": walls})])
+
+    commands = sorted((span for span in spans if span["kind"] == "command"), key=lambda span: -float(span["duration"]))
+    if commands:
+        lines.extend(["", f"Slowest commands (top {min(slowest, len(commands))}):"])
+        for span in commands[:slowest]:
+            issue = f"#{span['issue']}" if span.get("issue") is not None else "-"
+            lines.append(
+                f"  {float(span['duration']):>7.2f}s  exit {span.get('exit_code', '?')!s:>3}  {issue:<6} "
+                f"{' '.join(span.get('argv') or [span['name']])[:100]}"
+            )
+    return lines
+
+
+@contextlib.contextmanager
+def issue_scope(issue_num: Optional[int]) -> Iterator[None]:
+    """Attribute spans on this thread to `issue_num` for the duration of the block."""
+    previous = current_issue()
+    set_current_issue(issue_num)
+    try:
+        yield
+    finally:
+        set_current_issue(previous)
@@ -0,0 +1,98 @@
+import argparse
+import os
+import tempfile
+import time
+from typing import List
+
+from sync_to_github import render_week
+from task_list_ast import parse_task_list_file
+
+WEEK_TEMPLATE = """### Week {week}: Synthetic Week {week}
+
+**Why this week exists**
+- Keeps phase {phase} moving; see docs/v2/{week:05d}_PLAN.md.
+
+**Read first**
+- docs/v2/08_INTERFACE_PLANNING.md
+
+#### {week}.1 Data Model
+- [ ] Define types for feature {week}
+- [ ] Align schema for feature {week}
+
+```dart
+final value = {week};
+```
+
+**{week}.2 Wiring**
+- [ ] Connect repository layer
+
+**Files likely touched**
+- `lib/features/feature_{week}.dart`
+
+**Definition of done**
+- Feature {week} compiles and is covered by tests
+
+**Verification**
+```bash
+cd client
+flutter analyze
+flutter test
+```
+
+**Risks**
+- Schema drift between client and server
+"""
+
+
+def synthetic_plan(weeks: int, weeks_per_phase: int) -> str:
+    parts: List[str] = ["# Synthetic Plan", ""]
+    for week in range(1, weeks + 1):
+        if (week - 1) % weeks_per_phase == 0:
+            phase = (week - 1) // weeks_per_phase + 1
+            parts.append(f"## Phase {phase}: Synthetic Phase {phase}")
+            parts.append("")
+        parts.append(WEEK_TEMPLATE.format(week=week, phase=(week - 1) // weeks_per_phase + 1))
+    return "\n".join(parts)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the task list parser on a synthetic plan.")
+    parser.add_argument("--weeks", type=int, default=10000, help="Number of synthetic weeks (default: 10000).")
+    parser.add_argument("--weeks-per-phase", type=int, default=4, help="Weeks per synthetic phase (default: 4).")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed repetitions; the best run is reported.")
+    args = parser.parse_args()
+    for option in ("weeks", "weeks_per_phase", "repeat"):
+        if getattr(args, option) < 1:
+            parser.error(f"--{option.replace('_', '-')} must be at least 1")
+
+    with tempfile.NamedTemporaryFile("w", suffix=".md", delete=False, encoding="utf-8") as tmp:
+        tmp.write(synthetic_plan(args.weeks, args.weeks_per_phase))
+        path = tmp.name
+
+    try:
+        size_mb = os.path.getsize(path) / (1024 * 1024)
+        parse_times: List[float] = []
+        render_times: List[float] = []
+        for _ in range(args.repeat):
+            started = time.perf_counter()
+            phases = parse_task_list_file(path)
+            parse_times.append(time.perf_counter() - started)
+
+            started = time.perf_counter()
+            for phase in phases:
+                for week in phase["weeks"]:
+                    week["body"] = render_week(phase, week, path, detailed_issues=True)
+            render_times.append(time.perf_counter() - started)
+
+        week_count = sum(len(phase["weeks"]) for phase in phases)
+        parse_best = min(parse_times)
+        render_best = min(render_times)
+        print(f"Plan: {len(phases)} phases, {week_count} weeks, {size_mb:.1f} MiB")
+        print(f"Parse (AST):      {parse_best * 1000:8.1f} ms  ({week_count / parse_best:,.0f} weeks/s)")
+        print(f"Render (detailed): {render_best * 1000:7.1f} ms  ({week_count / render_best:,.0f} weeks/s)")
+    finally:
+        os.unlink(path)
+
+
+if __name__ == "__main__":
+    main()
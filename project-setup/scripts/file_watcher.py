@@ -0,0 +1,151 @@
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import time
+from typing import Dict, Iterable, Optional, Set, Tuple
+
+DEFAULT_DEBOUNCE = 1.0
+DEFAULT_POLL_INTERVAL = 1.0
+
+IN_MODIFY = 0x00000002
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+# Directories are watched instead of the files themselves: editors that save by
+# writing a temp file and renaming it over the original replace the inode.
+WATCH_MASK = IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+
+EVENT_HEADER = struct.Struct("iIII")
+
+
+class PollingWatcher:
+    """Detect changes by comparing mtime and size every `interval` seconds."""
+
+    kind = "polling"
+
+    def __init__(self, paths: Iterable[str], interval: float = DEFAULT_POLL_INTERVAL):
+        self.paths = sorted({os.path.abspath(path) for path in paths})
+        self.interval = interval
+        self._stats = {path: self._stat(path) for path in self.paths}
+
+    @staticmethod
+    def _stat(path: str) -> Optional[Tuple[int, int]]:
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def read_events(self, timeout: Optional[float]) -> Set[str]:
+        """Return the watched paths that changed, waiting up to `timeout` seconds (forever when None)."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            changed: Set[str] = set()
+            for path in self.paths:
+                stat = self._stat(path)
+                if stat != self._stats[path]:
+                    self._stats[path] = stat
+                    changed.add(path)
+            if changed:
+                return changed
+            if deadline is not None and time.monotonic() >= deadline:
+                return changed
+            delay = self.interval if deadline is None else min(self.interval, max(0.0, deadline - time.monotonic()))
+            time.sleep(delay)
+
+    def close(self) -> None:
+        pass
+
+
+class InotifyWatcher:
+    """Linux inotify through libc; raises OSError where inotify is unavailable."""
+
+    kind = "inotify"
+
+    def __init__(self, paths: Iterable[str]):
+        libc_name = ctypes.util.find_library("c")
+        if not libc_name:
+            raise OSError("libc not found")
+        libc = ctypes.CDLL(libc_name, use_errno=True)
+        if not hasattr(libc, "inotify_init1"):
+            raise OSError("inotify is not available on this platform")
+        self._libc = libc
+        self.paths = {os.path.abspath(path) for path in paths}
+
+        self.fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self._dirs: Dict[int, str] = {}
+        for directory in sorted({os.path.dirname(path) for path in self.paths}):
+            wd = libc.inotify_add_watch(self.fd, os.fsencode(directory), WATCH_MASK)
+            if wd < 0:
+                errno = ctypes.get_errno()
+                os.close(self.fd)
+                raise OSError(errno, f"inotify_add_watch failed for {directory}")
+            self._dirs[wd] = directory
+
+    def read_events(self, timeout: Optional[float]) -> Set[str]:
+        """Return the watched paths that changed, waiting up to `timeout` seconds (forever when None)."""
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if not ready:
+            return set()
+
+        changed: Set[str] = set()
+        while True:
+            try:
+                data = os.read(self.fd, 64 * 1024)
+            except BlockingIOError:
+                break
+            offset = 0
+            while offset + EVENT_HEADER.size <= len(data):
+                wd, _mask, _cookie, length = EVENT_HEADER.unpack_from(data, offset)
+                offset += EVENT_HEADER.size
+                name = data[offset:offset + length].rstrip(b"\0")
+                offset += length
+                directory = self._dirs.get(wd)
+                if directory is None or not name:
+                    continue
+                path = os.path.join(directory, os.fsdecode(name))
+                if path in self.paths:
+                    changed.add(path)
+        return changed
+
+    def close(self) -> None:
+        os.close(self.fd)
+
+
+def open_watcher(paths: Iterable[str], poll_interval: float = DEFAULT_POLL_INTERVAL, *, polling: bool = False):
+    """Prefer inotify; fall back to mtime polling when it cannot be set up."""
+    paths = list(paths)
+    if not polling:
+        try:
+            return InotifyWatcher(paths)
+        except (OSError, AttributeError) as error:
+            print(f"inotify unavailable ({error}); polling every {poll_interval:g}s instead.")
+    return PollingWatcher(paths, poll_interval)
+
+
+def wait_for_changes(watcher, debounce: float = DEFAULT_DEBOUNCE) -> Set[str]:
+    """
+    Block until a watched file changes, then keep collecting until the files
+    have been quiet for `debounce` seconds, so a burst of saves is one cycle.
+    """
+    changed: Set[str] = set()
+    while not changed:
+        # Events for other files in a watched directory come back empty.
+        changed = watcher.read_events(None)
+    quiet_until = time.monotonic() + debounce
+    while True:
+        remaining = quiet_until - time.monotonic()
+        if remaining <= 0:
+            return changed
+        more = watcher.read_events(remaining)
+        if more:
+            changed |= more
+            quiet_until = time.monotonic() + debounce
@@ -0,0 +1,262 @@
+import json
+import subprocess
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+from github_index import graphql_command, graphql_data
+
+DEFAULT_WORKERS = 4
+DEFAULT_RETRIES = 5
+# GitHub asks integrators to space out content-creating requests; this keeps
+# concurrent upserts below the secondary rate limit without serializing them.
+DEFAULT_MUTATION_INTERVAL = 0.25
+SECONDARY_LIMIT_BACKOFF = 60.0
+
+_print_lock = threading.Lock()
+_log_context = threading.local()
+
+
+def set_log_prefix(prefix: str) -> None:
+    """Prefix every `log` line written by the current thread (e.g. with the target repo)."""
+    _log_context.prefix = prefix
+
+
+def log(message: str) -> None:
+    """Print one whole line at a time so worker-thread output does not interleave."""
+    prefix = getattr(_log_context, "prefix", "")
+    if prefix:
+        message = "\n".join(f"{prefix}{line}" if line else line for line in message.split("\n"))
+    with _print_lock:
+        print(message, flush=True)
+
+
+class GhApiError(RuntimeError):
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+def parse_included_response(output: str) -> Tuple[int, Dict[str, str], str]:
+    """Split `gh api --include` output into (status, lower-cased headers, body)."""
+    normalized = output.replace("\r\n", "\n")
+    head, _, body = normalized.partition("\n\n")
+    lines = head.splitlines()
+    status = 0
+    if lines and lines[0].startswith("HTTP/"):
+        parts = lines[0].split()
+        if len(parts) > 1 and parts[1].isdigit():
+            status = int(parts[1])
+        lines = lines[1:]
+    headers: Dict[str, str] = {}
+    for line in lines:
+        key, sep, value = line.partition(":")
+        if sep:
+            headers[key.strip().lower()] = value.strip()
+    return status, headers, body
+
+
+class RateLimiter:
+    """
+    Shared pause gate driven by GitHub's rate-limit response headers.
+
+    Any worker that sees `Retry-After` or an exhausted `X-RateLimit-Remaining`
+    pushes `resume_at` forward; every worker waits on it before its next request.
+    """
+
+    def __init__(self, mutation_interval: float = DEFAULT_MUTATION_INTERVAL):
+        self.mutation_interval = mutation_interval
+        self.resume_at = 0.0
+        self.last_mutation = 0.0
+        self.remaining: Optional[int] = None
+        self.limit: Optional[int] = None
+        self._lock = threading.Lock()
+
+    def wait(self, mutation: bool) -> None:
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                ready_at = self.resume_at
+                if mutation:
+                    ready_at = max(ready_at, self.last_mutation + self.mutation_interval)
+                if now >= ready_at:
+                    if mutation:
+                        self.last_mutation = now
+                    return
+            time.sleep(ready_at - now)
+
+    def pause_for(self, seconds: float) -> None:
+        with self._lock:
+            self.resume_at = max(self.resume_at, time.monotonic() + seconds)
+
+    def observe(self, status: int, headers: Dict[str, str], body: str = "") -> Optional[float]:
+        """Record rate-limit feedback; return a delay when the request should be retried."""
+        remaining = headers.get("x-ratelimit-remaining", "")
+        if remaining.isdigit():
+            self.remaining = int(remaining)
+        limit = headers.get("x-ratelimit-limit", "")
+        if limit.isdigit():
+            self.limit = int(limit)
+
+        delay: Optional[float] = None
+        retry_after = headers.get("retry-after", "")
+        reset = headers.get("x-ratelimit-reset", "")
+        if retry_after.isdigit():
+            delay = float(retry_after)
+        elif remaining == "0" and reset.isdigit():
+            delay = max(0.0, float(reset) - time.time()) + 1.0
+        elif status in (403, 429) and "rate limit" in body.lower():
+            # Secondary limits without Retry-After: GitHub asks for at least a minute.
+            delay = SECONDARY_LIMIT_BACKOFF
+
+        if delay is not None:
+            self.pause_for(delay)
+        return delay if status in (403, 429) else None
+
+
+class GhExecutor:
+    """Bounded worker pool for gh calls with rate-limit backoff and latency accounting."""
+
+    def __init__(
+        self,
+        max_workers: int = DEFAULT_WORKERS,
+        *,
+        max_retries: int = DEFAULT_RETRIES,
+        limiter: Optional[RateLimiter] = None,
+        budget: Optional[threading.Semaphore] = None,
+    ):
+        self.max_workers = max(1, max_workers)
+        self.max_retries = max_retries
+        self.limiter = limiter or RateLimiter()
+        # Shared by executors that sync different targets at once, capping the
+        # total number of gh calls in flight across all of them.
+        self.budget = budget
+        self.latencies: Dict[str, List[float]] = {}
+        self._pool = ThreadPoolExecutor(max_workers=self.max_workers)
+        self._lock = threading.Lock()
+
+    def record(self, kind: str, seconds: float) -> None:
+        with self._lock:
+            self.latencies.setdefault(kind, []).append(seconds)
+
+    @contextmanager
+    def timed(self, kind: str) -> Iterator[None]:
+        started = time.monotonic()
+        try:
+            yield
+        finally:
+            self.record(kind, time.monotonic() - started)
+
+    @contextmanager
+    def slot(self) -> Iterator[None]:
+        """Hold one unit of the shared API-concurrency budget, if any, around a gh call."""
+        if self.budget is None:
+            yield
+            return
+        with self.budget:
+            yield
+
+    def submit(self, kind: str, fn: Callable, *args, **kwargs) -> Future:
+        prefix = getattr(_log_context, "prefix", "")
+
+        def task():
+            set_log_prefix(prefix)
+            with self.timed(kind):
+                return fn(*args, **kwargs)
+
+        return self._pool.submit(task)
+
+    def api(self, kind: str, method: str, endpoint: str, payload: Optional[dict] = None):
+        """Call the REST API through `gh api --include`, honoring rate-limit feedback."""
+        mutation = method.upper() != "GET"
+        command = ["gh", "api", "--include", "-X", method.upper(), endpoint]
+        stdin = None
+        if payload is not None:
+            command.extend(["--input", "-"])
+            stdin = json.dumps(payload)
+        body = self.call(kind, command, stdin=stdin, mutation=mutation, label=f"{method.upper()} {endpoint}")
+        return json.loads(body) if body.strip() else None
+
+    def graphql(self, kind: str, query: str, variables: Dict[str, object]) -> dict:
+        """Run one GraphQL read like `api` does a REST call; returns the response `data`."""
+        command = graphql_command(query, variables)
+        command.insert(3, "--include")
+        return graphql_data(self.call(kind, command, label="gh api graphql"))
+
+    def runner(self, kind: str) -> Callable[[str, Dict[str, object]], dict]:
+        """A `github_index` GraphQL runner that goes through this executor."""
+        return lambda query, variables: self.graphql(kind, query, variables)
+
+    def call(
+        self,
+        kind: str,
+        command: List[str],
+        *,
+        stdin: Optional[str] = None,
+        mutation: bool = False,
+        label: Optional[str] = None,
+    ) -> str:
+        """
+        Run one `gh api --include` command inside the shared budget and rate limiter.
+
+        Retries on rate limiting and server errors; returns the response body.
+        """
+        label = label or " ".join(command[:3])
+        with self.timed(kind):
+            for attempt in range(self.max_retries + 1):
+                self.limiter.wait(mutation)
+                with self.slot():
+                    result = subprocess.run(command, input=stdin, capture_output=True, text=True)
+                status, headers, body = parse_included_response(result.stdout or "")
+                retry_delay = self.limiter.observe(status, headers, body)
+                if result.returncode == 0 and status < 400:
+                    return body
+                if retry_delay is not None and attempt < self.max_retries:
+                    log(f"  > Rate limited on {kind}; retrying in {retry_delay:.0f}s")
+                    continue
+                if status >= 500 and attempt < self.max_retries:
+                    time.sleep(2 ** attempt)
+                    continue
+                message = body.strip() or result.stderr.strip() or f"HTTP {status}"
+                log(f"Error running {label}:\n{message}")
+                raise GhApiError(status, message)
+        raise GhApiError(0, f"{label} exhausted retries")
+
+    def shutdown(self) -> None:
+        self._pool.shutdown(wait=True)
+
+    def latency_stats(self) -> Dict[str, Dict[str, float]]:
+        """Per-operation count, total, p50, p95, and max latency in seconds."""
+        stats: Dict[str, Dict[str, float]] = {}
+        with self._lock:
+            latencies = {kind: sorted(samples) for kind, samples in self.latencies.items()}
+        for kind, samples in latencies.items():
+            count = len(samples)
+            stats[kind] = {
+                "count": count,
+                "total": sum(samples),
+                "p50": samples[(count - 1) // 2],
+                "p95": samples[min(count - 1, int(round(0.95 * (count - 1))))],
+                "max": samples[-1],
+            }
+        return stats
+
+    def summary_lines(self) -> List[str]:
+        lines = [f"{'operation':<24} {'count':>5} {'total':>8} {'p50':>7} {'p95':>7} {'max':>7}"]
+        for kind, stat in sorted(self.latency_stats().items()):
+            lines.append(
+                f"{kind:<24} {stat['count']:>5} {stat['total']:>7.2f}s {stat['p50']:>6.2f}s "
+                f"{stat['p95']:>6.2f}s {stat['max']:>6.2f}s"
+            )
+        return lines
+
+    def print_latency_summary(self) -> None:
+        if not self.latencies:
+            return
+        log("\nLatency summary:")
+        for line in self.summary_lines():
+            log(f"  {line}")
+        if self.limiter.remaining is not None:
+            log(f"  Rate limit remaining: {self.limiter.remaining}/{self.limiter.limit or '?'}")
@@ -0,0 +1,364 @@
+import json
+import subprocess
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Set
+
+PAGE_SIZE = 100
+SEARCH_BATCH_SIZE = 20
+SEARCH_RESULTS = 5
+MILESTONE_REF_PREFIX = "refs/heads/milestone/"
+
+PAGE_INFO = "pageInfo { hasNextPage endCursor }"
+ISSUE_FIELDS = "number title state url body labels(first: 50) { nodes { name } } milestone { number title }"
+
+# One GraphQL connection per repository object type. Every connection that
+# still has pages left is folded into the same query, so a full load costs
+# max(pages per connection) round trips instead of one request per page per type.
+CONNECTIONS: Dict[str, str] = {
+    "milestones": (
+        "milestones(first: $pageSize, after: $milestonesCursor, states: [OPEN, CLOSED]) "
+        "{ %s nodes { number title state } }" % PAGE_INFO
+    ),
+    "issues": (
+        "issues(first: $pageSize, after: $issuesCursor, states: [OPEN, CLOSED], "
+        "orderBy: {field: CREATED_AT, direction: ASC}) "
+        "{ %s nodes { %s } }" % (PAGE_INFO, ISSUE_FIELDS)
+    ),
+    "pullRequests": (
+        "pullRequests(first: $pageSize, after: $pullRequestsCursor, states: [OPEN, CLOSED, MERGED]) "
+        "{ %s nodes { number title state url headRefName baseRefName } }" % PAGE_INFO
+    ),
+    "refs": (
+        "refs(first: $pageSize, after: $refsCursor, refPrefix: $refPrefix) "
+        "{ %s nodes { name target { oid } } }" % PAGE_INFO
+    ),
+}
+
+MILESTONE_ISSUES_QUERY = """
+query($owner: String!, $name: String!, $title: String!, $states: [IssueState!], $pageSize: Int!, $cursor: String,
+      $withBody: Boolean = false) {
+  repository(owner: $owner, name: $name) {
+    milestones(first: 20, query: $title, states: [OPEN, CLOSED]) {
+      nodes {
+        number
+        title
+        issues(first: $pageSize, after: $cursor, states: $states, orderBy: {field: CREATED_AT, direction: ASC}) {
+          pageInfo { hasNextPage endCursor }
+          nodes { number title state url body @include(if: $withBody) milestone { number title } }
+        }
+      }
+    }
+  }
+}
+"""
+
+HEAD_PULL_REQUESTS_QUERY = """
+query($owner: String!, $name: String!, $head: String!, $states: [PullRequestState!], $pageSize: Int!, $cursor: String) {
+  repository(owner: $owner, name: $name) {
+    pullRequests(first: $pageSize, after: $cursor, headRefName: $head, states: $states) {
+      pageInfo { hasNextPage endCursor }
+      nodes { number title state url headRefName baseRefName }
+    }
+  }
+}
+"""
+
+ISSUE_QUERY = """
+query($owner: String!, $name: String!, $number: Int!) {
+  repository(owner: $owner, name: $name) {
+    issue(number: $number) { number title state url body milestone { number title } }
+  }
+}
+"""
+
+
+def split_repo(repo: Optional[str]) -> List[str]:
+    """
+    Return [owner, name] for `owner/repo`.
+
+    Without a repo, gh's `{owner}`/`{repo}` placeholders resolve against the
+    repository of the current directory, matching plain `gh issue ...` calls.
+    """
+    if not repo:
+        return ["{owner}", "{repo}"]
+    owner, _, name = repo.partition("/")
+    if not owner or not name:
+        raise ValueError(f"repository must be in owner/repo form: {repo}")
+    return [owner, name]
+
+
+GraphqlRunner = Callable[[str, Dict[str, object]], dict]
+
+
+def graphql_command(query: str, variables: Dict[str, object]) -> List[str]:
+    """Build the `gh api graphql` command for `query` with typed and placeholder fields."""
+    command = ["gh", "api", "graphql", "-f", f"query={query}"]
+    for key, value in variables.items():
+        if value is None:
+            continue
+        if isinstance(value, (list, tuple)):
+            for item in value:
+                command.extend(["-f", f"{key}[]={item}"])
+        elif isinstance(value, bool) or isinstance(value, int):
+            command.extend(["-F", f"{key}={json.dumps(value)}"])
+        elif value in ("{owner}", "{repo}"):
+            # Placeholders are only expanded for typed (-F) fields.
+            command.extend(["-F", f"{key}={value}"])
+        else:
+            command.extend(["-f", f"{key}={value}"])
+    return command
+
+
+def graphql_data(output: str) -> dict:
+    """Return the `data` of a GraphQL response body, raising on reported errors."""
+    payload = json.loads(output or "{}")
+    if payload.get("errors"):
+        raise RuntimeError("; ".join(error.get("message", "") for error in payload["errors"]))
+    return payload.get("data") or {}
+
+
+def run_graphql(query: str, variables: Dict[str, object]) -> dict:
+    """Run one GraphQL request through `gh api graphql` and return its `data`."""
+    result = subprocess.run(graphql_command(query, variables), capture_output=True, text=True)
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip() or "gh api graphql failed")
+    return graphql_data(result.stdout)
+
+
+def _issue_node(issue: dict) -> dict:
+    labels = issue.get("labels")
+    if isinstance(labels, dict):
+        return {**issue, "labels": [label["name"] for label in labels.get("nodes") or []]}
+    return issue
+
+
+def _search_query(count: int) -> str:
+    params = ", ".join(f"$q{i}: String!" for i in range(count))
+    fields = "\n  ".join(
+        "q%d: search(query: $q%d, type: ISSUE, first: %d) { nodes { ... on Issue { %s } } }"
+        % (i, i, SEARCH_RESULTS, ISSUE_FIELDS)
+        for i in range(count)
+    )
+    return "query(%s) {\n  %s\n}" % (params, fields)
+
+
+def search_issues(
+    queries: Dict[str, str],
+    batch_size: int = SEARCH_BATCH_SIZE,
+    *,
+    runner: GraphqlRunner = run_graphql,
+) -> Dict[str, List[dict]]:
+    """
+    Run many issue search queries, `batch_size` aliased searches per GraphQL request.
+
+    Returns `{key: issue nodes}` for each `{key: search query}`; labels are
+    flattened to a list of names like `RepositoryIndex.ingest` does. `runner`
+    sends each request (e.g. through a rate-limited executor).
+    """
+    results: Dict[str, List[dict]] = {}
+    items = list(queries.items())
+    for start in range(0, len(items), batch_size):
+        batch = items[start:start + batch_size]
+        data = runner(_search_query(len(batch)), {f"q{i}": query for i, (_, query) in enumerate(batch)})
+        for i, (key, _) in enumerate(batch):
+            nodes = (data.get(f"q{i}") or {}).get("nodes") or []
+            results[key] = [_issue_node(node) for node in nodes if node]
+    return results
+
+
+def _connection_query(pending: Sequence[str]) -> str:
+    params = ["$owner: String!", "$name: String!", "$pageSize: Int!"]
+    params.extend(f"${name}Cursor: String" for name in pending)
+    if "refs" in pending:
+        params.append("$refPrefix: String!")
+    fields = "\n    ".join(CONNECTIONS[name] for name in pending)
+    return "query(%s) {\n  repository(owner: $owner, name: $name) {\n    %s\n  }\n}" % (", ".join(params), fields)
+
+
+def iter_connection_pages(
+    repo: Optional[str],
+    connections: Sequence[str],
+    *,
+    ref_prefix: str = MILESTONE_REF_PREFIX,
+    page_size: int = PAGE_SIZE,
+    runner: GraphqlRunner = run_graphql,
+) -> Iterator[Dict[str, List[dict]]]:
+    """
+    Yield `{connection: nodes}` per round trip until every connection is exhausted.
+
+    Connections are fetched side by side; a connection drops out of the query
+    once its `pageInfo.hasNextPage` turns false.
+    """
+    owner, name = split_repo(repo)
+    cursors: Dict[str, Optional[str]] = {connection: None for connection in connections}
+    pending = list(connections)
+
+    while pending:
+        variables: Dict[str, object] = {"owner": owner, "name": name, "pageSize": page_size}
+        for connection in pending:
+            variables[f"{connection}Cursor"] = cursors[connection]
+        if "refs" in pending:
+            variables["refPrefix"] = ref_prefix
+
+        repository = runner(_connection_query(pending), variables).get("repository") or {}
+        page: Dict[str, List[dict]] = {}
+        still_pending: List[str] = []
+        for connection in pending:
+            data = repository.get(connection) or {}
+            page[connection] = data.get("nodes") or []
+            info = data.get("pageInfo") or {}
+            if info.get("hasNextPage") and info.get("endCursor"):
+                cursors[connection] = info["endCursor"]
+                still_pending.append(connection)
+        yield page
+        pending = still_pending
+
+
+class RepositoryIndex:
+    """Title/number index over the issues, milestones, PRs, and refs of one repository."""
+
+    def __init__(self, repo: Optional[str] = None):
+        self.repo = repo
+        self.milestones: Dict[str, dict] = {}
+        self.issues_by_title: Dict[str, dict] = {}
+        self.issues_by_number: Dict[int, dict] = {}
+        self.pull_requests: List[dict] = []
+        self.refs: Dict[str, str] = {}
+
+    def add_milestone(self, milestone: dict) -> None:
+        self.milestones[milestone["title"]] = milestone
+
+    def add_issue(self, issue: dict) -> None:
+        number = issue.get("number")
+        previous = self.issues_by_number.get(number, {}) if number is not None else {}
+        if not previous:
+            previous = self.issues_by_title.get(issue["title"], {})
+        merged = {**previous, **issue}
+        if previous and previous.get("title") != merged["title"]:
+            self.issues_by_title.pop(previous.get("title"), None)
+        self.issues_by_title[merged["title"]] = merged
+        if merged.get("number") is not None:
+            self.issues_by_number[merged["number"]] = merged
+
+    def add_pull_request(self, pr: dict) -> None:
+        self.pull_requests.append(pr)
+
+    def add_ref(self, name: str, oid: str = "") -> None:
+        self.refs[name] = oid
+
+    def branch_names(self, prefix: str = MILESTONE_REF_PREFIX) -> Set[str]:
+        branch_root = prefix[len("refs/heads/"):] if prefix.startswith("refs/heads/") else prefix
+        return {f"{branch_root}{name}" for name in self.refs}
+
+    def ingest(self, page: Dict[str, List[dict]]) -> None:
+        for milestone in page.get("milestones", []):
+            self.add_milestone(milestone)
+        for issue in page.get("issues", []):
+            self.add_issue(_issue_node(issue))
+        for pr in page.get("pullRequests", []):
+            self.add_pull_request(pr)
+        for ref in page.get("refs", []):
+            self.add_ref(ref["name"], (ref.get("target") or {}).get("oid", ""))
+
+
+def load_repository_index(
+    repo: Optional[str],
+    connections: Sequence[str] = ("milestones", "issues", "pullRequests", "refs"),
+    *,
+    ref_prefix: str = MILESTONE_REF_PREFIX,
+    on_page: Optional[Callable[[Dict[str, List[dict]]], None]] = None,
+    runner: GraphqlRunner = run_graphql,
+) -> RepositoryIndex:
+    """Stream every page of the requested connections into a `RepositoryIndex`."""
+    index = RepositoryIndex(repo)
+    for page in iter_connection_pages(repo, connections, ref_prefix=ref_prefix, runner=runner):
+        index.ingest(page)
+        if on_page:
+            on_page(page)
+    return index
+
+
+def iter_milestone_issue_pages(
+    repo: Optional[str],
+    milestone_title: str,
+    states: Sequence[str] = ("OPEN",),
+    *,
+    with_body: bool = False,
+) -> Iterator[List[dict]]:
+    """
+    Yield the issues of the milestone titled exactly `milestone_title` one
+    page (up to PAGE_SIZE issues) at a time, following pagination. Bodies are
+    only fetched with `with_body`.
+    """
+    owner, name = split_repo(repo)
+    cursor: Optional[str] = None
+    while True:
+        data = run_graphql(
+            MILESTONE_ISSUES_QUERY,
+            {
+                "owner": owner,
+                "name": name,
+                "title": milestone_title,
+                "states": list(states),
+                "pageSize": PAGE_SIZE,
+                "cursor": cursor,
+                "withBody": with_body,
+            },
+        )
+        milestones = ((data.get("repository") or {}).get("milestones") or {}).get("nodes") or []
+        milestone = next((item for item in milestones if item.get("title") == milestone_title), None)
+        if not milestone:
+            return
+
+        connection = milestone.get("issues") or {}
+        yield connection.get("nodes") or []
+        info = connection.get("pageInfo") or {}
+        if not info.get("hasNextPage") or not info.get("endCursor"):
+            return
+        cursor = info["endCursor"]
+
+
+def milestone_issues(
+    repo: Optional[str],
+    milestone_title: str,
+    states: Sequence[str] = ("OPEN",),
+    *,
+    with_body: bool = False,
+) -> List[dict]:
+    """Return every issue in the milestone titled exactly `milestone_title` (see `iter_milestone_issue_pages`)."""
+    return [
+        issue
+        for page in iter_milestone_issue_pages(repo, milestone_title, states, with_body=with_body)
+        for issue in page
+    ]
+
+
+def pull_requests_for_head(repo: Optional[str], head: str, states: Sequence[str] = ("OPEN",)) -> List[dict]:
+    """Return every PR whose head branch is `head`, following pagination."""
+    owner, name = split_repo(repo)
+    prs: List[dict] = []
+    cursor: Optional[str] = None
+    while True:
+        data = run_graphql(
+            HEAD_PULL_REQUESTS_QUERY,
+            {
+                "owner": owner,
+                "name": name,
+                "head": head,
+                "states": list(states),
+                "pageSize": PAGE_SIZE,
+                "cursor": cursor,
+            },
+        )
+        connection = (data.get("repository") or {}).get("pullRequests") or {}
+        prs.extend(connection.get("nodes") or [])
+        info = connection.get("pageInfo") or {}
+        if not info.get("hasNextPage") or not info.get("endCursor"):
+            return prs
+        cursor = info["endCursor"]
+
+
+def issue_by_number(repo: Optional[str], number: int) -> Optional[dict]:
+    """Return title, body, state, and milestone of one issue in a single request."""
+    owner, name = split_repo(repo)
+    data = run_graphql(ISSUE_QUERY, {"owner": owner, "name": name, "number": number})
+    return (data.get("repository") or {}).get("issue")
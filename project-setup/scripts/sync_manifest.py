@@ -0,0 +1,183 @@
+import argparse
+import json
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List
+
+from gh_executor import DEFAULT_WORKERS, RateLimiter, log, set_log_prefix
+from sync_state import default_state_path, load_sync_state
+from sync_to_github import sync_once
+
+DEFAULT_MAX_PARALLEL = 4
+DEFAULT_API_CONCURRENCY = 8
+DEFAULT_REPORT_FILE = "sync_report.json"
+
+
+def load_manifest(path: str) -> List[dict]:
+    """
+    Read a manifest of sync targets.
+
+    The manifest is a JSON list (or `{"targets": [...]}`) of objects with
+    `file`, `repo`, and optional `branch_word`, `simple_issues`, `reference`,
+    `close_deleted`, and `state_file`. `file` and `reference` are kept as
+    written, since they are rendered into issue bodies and sync state, and
+    `file` is read from `path`, resolved against the manifest's directory,
+    like `state_file`.
+    """
+    with open(path, "r", encoding="utf-8") as file:
+        data = json.load(file)
+    entries = data.get("targets", []) if isinstance(data, dict) else data
+    base_dir = os.path.dirname(os.path.abspath(path))
+
+    targets: List[dict] = []
+    for position, entry in enumerate(entries, 1):
+        if not entry.get("file") or not entry.get("repo"):
+            raise ValueError(f"manifest entry {position} needs both 'file' and 'repo'")
+        state_file = entry.get("state_file")
+        targets.append(
+            {
+                "file": entry["file"],
+                "path": os.path.join(base_dir, entry["file"]),
+                "repo": entry["repo"],
+                "branch_word": entry.get("branch_word", "plan"),
+                "simple_issues": bool(entry.get("simple_issues", False)),
+                "reference": list(entry.get("reference", [])),
+                "close_deleted": bool(entry.get("close_deleted", False)),
+                "state_file": os.path.join(base_dir, state_file) if state_file else None,
+            }
+        )
+    return targets
+
+
+def sync_group(
+    group: List[dict],
+    state_path: str,
+    args,
+    limiter: RateLimiter,
+    budget: threading.Semaphore,
+) -> List[dict]:
+    """Sync targets that share one state file one after another; failures stay per target."""
+    state = load_sync_state(state_path)
+    reports: List[dict] = []
+    for target in group:
+        set_log_prefix(f"[{target['repo']}] ")
+        report = {
+            "file": target["file"],
+            "repo": target["repo"],
+            "branch_word": target["branch_word"],
+            "status": "unchanged",
+        }
+        started = time.monotonic()
+        target_args = argparse.Namespace(
+            file=target["file"],
+            path=target["path"],
+            repo=target["repo"],
+            branch_word=target["branch_word"],
+            simple_issues=target["simple_issues"],
+            reference=target["reference"],
+            close_deleted=target["close_deleted"],
+            concurrency=args.concurrency,
+            plan=None,
+        )
+        try:
+            if not os.path.isfile(target["path"]):
+                raise FileNotFoundError(f"task list not found: {target['path']}")
+            sync_once(target_args, state, state_path, full=args.full, limiter=limiter, budget=budget, report=report)
+            if "operations" in report:
+                report["status"] = "synced"
+        except (Exception, SystemExit) as error:
+            report["status"] = "failed"
+            report["error"] = str(error) or type(error).__name__
+            log(f"Sync failed: {report['error']}")
+        report["duration_seconds"] = round(time.monotonic() - started, 3)
+        reports.append(report)
+    set_log_prefix("")
+    return reports
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Sync several task lists to their GitHub repositories at once.")
+    parser.add_argument("--manifest", type=str, required=True, help="JSON manifest of (file, repo, branch_word) targets.")
+    parser.add_argument(
+        "--max-parallel",
+        type=int,
+        default=DEFAULT_MAX_PARALLEL,
+        help=f"Targets synced at the same time (default: {DEFAULT_MAX_PARALLEL}).",
+    )
+    parser.add_argument(
+        "--api-concurrency",
+        type=int,
+        default=DEFAULT_API_CONCURRENCY,
+        help=f"Maximum gh calls in flight across all targets (default: {DEFAULT_API_CONCURRENCY}).",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=DEFAULT_WORKERS,
+        help=f"Issue upsert workers per target (default: {DEFAULT_WORKERS}).",
+    )
+    parser.add_argument(
+        "--report",
+        type=str,
+        default=DEFAULT_REPORT_FILE,
+        help=f"Where to write the consolidated JSON report (default: {DEFAULT_REPORT_FILE}).",
+    )
+    parser.add_argument("--full", action="store_true", help="Ignore sync state and push every week of every target.")
+    args = parser.parse_args()
+
+    try:
+        targets = load_manifest(args.manifest)
+    except (OSError, ValueError) as error:
+        print(f"Error: could not read manifest {args.manifest}: {error}")
+        sys.exit(1)
+    if not targets:
+        print("Manifest has no targets.")
+        return
+
+    # Targets that share a state file are synced in sequence so the file is never written concurrently.
+    groups: Dict[str, List[dict]] = {}
+    for target in targets:
+        state_path = target["state_file"] or default_state_path(target["path"])
+        groups.setdefault(state_path, []).append(target)
+
+    # Every target uses the same token, so rate-limit feedback and the in-flight budget are global.
+    limiter = RateLimiter()
+    budget = threading.BoundedSemaphore(max(1, args.api_concurrency))
+    started_at = time.time()
+    started = time.monotonic()
+    print(f"Syncing {len(targets)} targets ({len(groups)} state files, up to {args.max_parallel} at once)...")
+
+    with ThreadPoolExecutor(max_workers=max(1, args.max_parallel)) as pool:
+        futures = [
+            pool.submit(sync_group, group, state_path, args, limiter, budget) for state_path, group in groups.items()
+        ]
+        reports = [report for future in futures for report in future.result()]
+
+    summary: Dict[str, int] = {}
+    for report in reports:
+        summary[report["status"]] = summary.get(report["status"], 0) + 1
+    document = {
+        "started_at": int(started_at),
+        "duration_seconds": round(time.monotonic() - started, 3),
+        "api_concurrency": args.api_concurrency,
+        "summary": summary,
+        "targets": reports,
+    }
+    with open(args.report, "w", encoding="utf-8") as file:
+        json.dump(document, file, indent=2, ensure_ascii=False)
+        file.write("\n")
+
+    print(f"\nTargets: {', '.join(f'{count} {status}' for status, count in sorted(summary.items()))}")
+    for report in reports:
+        if report["status"] == "failed":
+            print(f"- {report['repo']} ({report['file']}): {report['error']}")
+    print(f"Report written to {args.report}")
+    if summary.get("failed"):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,169 @@
+import hashlib
+import json
+import os
+from typing import Dict, List, Optional, Tuple
+
+STATE_VERSION = 1
+DEFAULT_STATE_FILE = ".project_sync_state.json"
+
+
+def default_state_path(markdown_path: str) -> str:
+    return os.path.join(os.path.dirname(os.path.abspath(markdown_path)), DEFAULT_STATE_FILE)
+
+
+def load_sync_state(path: str) -> Dict[str, object]:
+    if not os.path.exists(path):
+        return {"version": STATE_VERSION, "targets": {}}
+    with open(path, "r", encoding="utf-8") as file:
+        state = json.load(file)
+    if state.get("version") != STATE_VERSION:
+        print(f"Ignoring sync state with unsupported version in {path}.")
+        return {"version": STATE_VERSION, "targets": {}}
+    state.setdefault("targets", {})
+    return state
+
+
+def save_sync_state(path: str, state: Dict[str, object]) -> None:
+    """Write the state atomically so an interrupted run never leaves a truncated file."""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as file:
+        json.dump(state, file, indent=2, sort_keys=True)
+        file.write("\n")
+    os.replace(tmp_path, path)
+
+
+def target_state(
+    state: Dict[str, object], repo: str, file_path: str, resolved_path: Optional[str] = None
+) -> Dict[str, object]:
+    """
+    Return (creating if needed) the state entry for one markdown file synced
+    to one repo. The key uses `resolved_path` (default: `file_path`) so the
+    same file maps to one entry whatever directory it was named from.
+    """
+    key = f"{repo}:{os.path.abspath(resolved_path or file_path)}"
+    targets = state.setdefault("targets", {})
+    return targets.setdefault(
+        key, {"repo": repo, "file": file_path, "render": None, "phases": {}, "weeks": {}, "issues": {}}
+    )
+
+
+def render_settings(file_path: str, detailed_issues: bool, reference_docs: List[str]) -> Dict[str, object]:
+    """Inputs besides the section text that change the rendered issue body."""
+    return {"source": file_path, "detailed": detailed_issues, "references": sorted(reference_docs)}
+
+
+def week_identifier(file_path: str, week_number: str) -> str:
+    """
+    Stable identity of a week, independent of its title.
+
+    Namespaced by the task list's file name so several plans can sync into
+    one repository; renaming a week keeps its identifier, renumbering it does not.
+    """
+    plan = os.path.splitext(os.path.basename(file_path))[0]
+    return f"{plan}/week-{week_number}"
+
+
+def section_hash(phase_title: str, week: dict) -> str:
+    digest = hashlib.sha256()
+    digest.update(phase_title.encode("utf-8"))
+    digest.update(b"\0")
+    digest.update(week["title"].encode("utf-8"))
+    digest.update(b"\0")
+    digest.update("\n".join(week["raw_lines"]).encode("utf-8"))
+    return digest.hexdigest()
+
+
+def changed_sections(
+    phases: List[dict],
+    target: Dict[str, object],
+    settings: Dict[str, object],
+) -> Tuple[List[dict], List[Tuple[str, dict]]]:
+    """
+    Compare scanned phases with the last successful sync.
+
+    Returns the phases that contain new or edited weeks (holding only those
+    weeks) and the `(week_number, record)` pairs that disappeared from the file.
+    Any change to the render settings invalidates every section.
+    """
+    previous_weeks: Dict[str, dict] = target.get("weeks", {}) if target.get("render") == settings else {}
+    previous_phases: Dict[str, dict] = target.get("phases", {})
+
+    changed: List[dict] = []
+    seen: set = set()
+    for phase in phases:
+        phase_record = previous_phases.get(phase["number"]) or {}
+        weeks = []
+        for week in phase["weeks"]:
+            seen.add(week["number"])
+            week["hash"] = section_hash(phase["title"], week)
+            record = previous_weeks.get(week["number"])
+            if not record or record.get("hash") != week["hash"]:
+                weeks.append(week)
+        if weeks or phase_record.get("title") != phase["title"]:
+            changed.append({**phase, "weeks": weeks})
+
+    deleted = [(number, record) for number, record in target.get("weeks", {}).items() if number not in seen]
+    deleted.sort(key=lambda item: int(item[0]) if item[0].isdigit() else 0)
+    return changed, deleted
+
+
+def record_week(target: Dict[str, object], phase: dict, week: dict, issue_number: Optional[int]) -> None:
+    week_id = week.get("id") or week_identifier(target["file"], week["number"])
+    target.setdefault("weeks", {})[week["number"]] = {
+        "id": week_id,
+        "phase": phase["number"],
+        "title": week["title"],
+        "hash": week["hash"],
+        "issue": issue_number,
+    }
+    if issue_number is not None:
+        target.setdefault("issues", {})[week_id] = issue_number
+
+
+def recorded_issue(target: Dict[str, object], week_id: str, week_number: str) -> Optional[int]:
+    """The issue recorded for a week: its week record, else the week id -> issue store."""
+    record = target.get("weeks", {}).get(week_number) or {}
+    if record.get("issue") is not None and record.get("id", week_id) == week_id:
+        return record["issue"]
+    return target.get("issues", {}).get(week_id)
+
+
+def reset_week_hashes(target: Dict[str, object]) -> None:
+    """
+    Make every week count as changed (for `--full` or new render settings)
+    while keeping the week -> issue mapping, so no issue has to be searched
+    for again.
+    """
+    for record in target.get("weeks", {}).values():
+        record["hash"] = None
+
+
+def forget_week(target: Dict[str, object], week_number: str) -> None:
+    """Drop a deleted week and its issue mapping."""
+    record = target.get("weeks", {}).pop(week_number, None) or {}
+    target.get("issues", {}).pop(record.get("id"), None)
+
+
+def duplicate_weeks(phases: List[dict]) -> List[str]:
+    """
+    Week numbers used by more than one week. Weeks are keyed by number in the
+    sync state, week ids, and branch names, so plans that restart numbering
+    in each phase cannot be synced.
+    """
+    seen: Dict[str, str] = {}
+    duplicates: List[str] = []
+    for phase in phases:
+        for week in phase["weeks"]:
+            if week["number"] in seen:
+                duplicates.append(f"Week {week['number']} ({seen[week['number']]} and {phase['title']})")
+            else:
+                seen[week["number"]] = phase["title"]
+    return duplicates
+
+
+def record_phase(target: Dict[str, object], phase: dict, milestone_number: Optional[int], branch: Optional[str]) -> None:
+    target.setdefault("phases", {})[phase["number"]] = {
+        "title": phase["title"],
+        "milestone": milestone_number,
+        "branch": branch,
+    }
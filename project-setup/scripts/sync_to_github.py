@@ -1,11 +1,58 @@
 import argparse
+import hashlib
 import json
 import os
 import re
 import subprocess
 import sys
-import tempfile
-from typing import Dict, List, Optional
+import threading
+import time
+from concurrent.futures import Future
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from file_watcher import DEFAULT_DEBOUNCE, DEFAULT_POLL_INTERVAL, open_watcher, wait_for_changes
+from gh_executor import DEFAULT_MUTATION_INTERVAL, DEFAULT_WORKERS, GhExecutor, RateLimiter, log
+from github_index import GraphqlRunner, RepositoryIndex, load_repository_index, run_graphql, search_issues
+from sync_state import (
+    DEFAULT_STATE_FILE,
+    changed_sections,
+    default_state_path,
+    duplicate_weeks,
+    forget_week,
+    load_sync_state,
+    record_phase,
+    record_week,
+    recorded_issue,
+    render_settings,
+    reset_week_hashes,
+    save_sync_state,
+    target_state,
+    week_identifier,
+)
+from task_list_ast import WeekCache, parse_task_list_file, parse_week_lines
+
+ISSUE_LABEL = "enhancement"
+SYNC_HASH_MARKER = "<!-- sync-hash: {} -->"
+SYNC_HASH_PATTERN = re.compile(r"<!-- sync-hash: ([0-9a-f]{64}) -->\s*$")
+WEEK_ID_MARKER = "<!-- week-id: {} -->"
+WEEK_ID_PATTERN = re.compile(r"<!-- week-id: (\S+) -->")
+# Issues are resolved per week (state mapping, then search), never by listing
+# every issue of the repository.
+SNAPSHOT_CONNECTIONS = ("milestones", "pullRequests", "refs")
+MILESTONE_BRANCH_RE = re.compile(r"^milestone/([^/]+)/phase-(\d+)$")
+
+PLAN_VERSION = 1
+DEFAULT_PLAN_FILE = "sync_plan.json"
+# REST calls each planned operation costs when applied. `gh pr create` resolves
+# the repository, head, and milestone before the create call itself.
+API_CALL_COSTS: Dict[str, int] = {
+    "milestone.create": 1,
+    "issue.create": 1,
+    "issue.update": 1,
+    "branch.create": 2,
+    "pr.create": 4,
+    "issue.close": 1,
+}
 
 
 def run_gh_command(command_list: List[str], check: bool = True) -> Optional[str]:
@@ -19,130 +66,6 @@ def run_gh_command(command_list: List[str], check: bool = True) -> Optional[str]
     return result.stdout.strip()
 
 
-def run_gh_json(command_list: List[str]):
-    output = run_gh_command(command_list)
-    return json.loads(output) if output else None
-
-
-def _normalized_heading(text: str) -> str:
-    return re.sub(r"\s+", " ", text.strip().lower())
-
-
-def _extract_doc_refs(lines: List[str]) -> List[str]:
-    refs = set()
-    for line in lines:
-        for match in re.findall(r"docs/[A-Za-z0-9_./\-]+\.md", line):
-            refs.add(match)
-    return sorted(refs)
-
-
-def _extract_command_lines(lines: List[str]) -> List[str]:
-    cmds: List[str] = []
-    patterns = [r"\bflutter analyze\b", r"\bflutter test\b", r"\bdart test\b"]
-    for line in lines:
-        stripped = line.strip()
-        if any(re.search(p, stripped) for p in patterns):
-            if stripped not in cmds:
-                cmds.append(stripped)
-    return cmds
-
-
-def _parse_week_sections(raw_lines: List[str]) -> Dict[str, List]:
-    sections = {
-        "categories": [],
-        "files": [],
-        "dod": [],
-        "verification": [],
-        "risks": [],
-        "misc": [],
-    }
-
-    current_category = None
-    current_section = "misc"
-    in_code_block = False
-
-    for raw in raw_lines:
-        line = raw.rstrip("\n")
-        stripped = line.strip()
-
-        if stripped.startswith("```"):
-            in_code_block = not in_code_block
-            if current_section == "verification":
-                sections["verification"].append(stripped)
-            elif current_category is not None:
-                current_category["lines"].append(stripped)
-            else:
-                sections["misc"].append(stripped)
-            continue
-
-        if not stripped:
-            if current_section == "verification":
-                sections["verification"].append("")
-            elif current_category is not None:
-                current_category["lines"].append("")
-            continue
-
-        if not in_code_block:
-            # H4 category header
-            h4_match = re.match(r"^####\s+(.+)$", stripped)
-            if h4_match:
-                title = h4_match.group(1).strip()
-                current_category = {"title": title, "lines": []}
-                sections["categories"].append(current_category)
-                current_section = "category"
-                continue
-
-            # Bold section header (e.g., **Files likely touched**)
-            bold_match = re.match(r"^\*\*(.+?)\*\*:?")
-            if bold_match:
-                heading = _normalized_heading(bold_match.group(1))
-                if "files likely touched" in heading or "likely touched" in heading or "관련 파일" in heading:
-                    current_section = "files"
-                    current_category = None
-                    continue
-                if "definition of done" in heading or "완료 기준" in heading or "definition" in heading:
-                    current_section = "dod"
-                    current_category = None
-                    continue
-                if "verification" in heading or "검증" in heading:
-                    current_section = "verification"
-                    current_category = None
-                    continue
-                if "risk" in heading or "주의" in heading:
-                    current_section = "risks"
-                    current_category = None
-                    continue
-
-                # Convert numeric bold sections to categories (e.g., **1.1 ...**)
-                if re.match(r"^\d+\.\d+", bold_match.group(1).strip()):
-                    title = bold_match.group(1).strip()
-                    current_category = {"title": title, "lines": []}
-                    sections["categories"].append(current_category)
-                    current_section = "category"
-                    continue
-
-        if current_section == "files":
-            sections["files"].append(stripped)
-            continue
-        if current_section == "dod":
-            sections["dod"].append(stripped)
-            continue
-        if current_section == "verification":
-            sections["verification"].append(stripped)
-            continue
-        if current_section == "risks":
-            sections["risks"].append(stripped)
-            continue
-
-        if current_category is not None:
-            current_category["lines"].append(stripped)
-        else:
-            sections["misc"].append(stripped)
-
-    sections["categories"] = [c for c in sections["categories"] if c["lines"]]
-    return sections
-
-
 def _format_bullets(lines: List[str]) -> List[str]:
     formatted: List[str] = []
     for line in lines:
@@ -177,10 +100,14 @@ def build_detailed_issue_body(
     raw_lines: List[str],
     source_file: str,
     reference_docs: List[str],
+    parsed: Optional[Dict[str, object]] = None,
 ) -> str:
-    sections = _parse_week_sections(raw_lines)
-    references = sorted(set([source_file] + reference_docs + _extract_doc_refs(raw_lines)))
-    command_lines = _extract_command_lines(raw_lines)
+    """Render the assignee-ready body; `parsed` is the week's AST node when already available."""
+    if parsed is None or "sections" not in parsed:
+        parsed = parse_week_lines(raw_lines)
+    sections = parsed["sections"]
+    references = sorted(set([source_file] + reference_docs + parsed["doc_refs"]))
+    command_lines = parsed["commands"]
 
     lines: List[str] = []
 
@@ -224,7 +151,7 @@ def build_detailed_issue_body(
                     continue
                 lines.append(line)
     else:
-        checklist = [line.strip() for line in raw_lines if line.strip().startswith("- [")]
+        checklist = parsed["checklist"]
         if checklist:
             for item in checklist:
                 lines.append(item)
@@ -287,179 +214,227 @@ def build_detailed_issue_body(
     return "\n".join(lines).strip() + "\n"
 
 
+def scan_markdown(file_path: str, week_cache: Optional[WeekCache] = None):
+    """Split task list markdown into the phase/week AST without rendering issue bodies."""
+    return parse_task_list_file(file_path, week_cache)
+
+
+def render_week(
+    phase: dict,
+    week: dict,
+    file_path: str,
+    detailed_issues: bool = True,
+    reference_docs: Optional[List[str]] = None,
+) -> str:
+    if detailed_issues:
+        return build_detailed_issue_body(
+            phase_title=phase["title"],
+            week_title=week["title"],
+            week_num=week["number"],
+            raw_lines=week["raw_lines"],
+            source_file=file_path,
+            reference_docs=reference_docs or [],
+            parsed=week,
+        )
+    return build_simple_issue_body(
+        week_num=week["number"],
+        raw_lines=week["raw_lines"],
+        source_file=file_path,
+    )
+
+
 def parse_markdown(
     file_path: str,
     detailed_issues: bool = True,
     reference_docs: Optional[List[str]] = None,
 ):
     """Parse task list markdown into phase/week structures."""
-    phases = []
-    reference_docs = reference_docs or []
-
-    try:
-        with open(file_path, "r", encoding="utf-8") as f:
-            lines = f.readlines()
-    except FileNotFoundError:
-        print(f"Error: File not found {file_path}")
-        sys.exit(1)
-
-    current_phase = None
-    current_week = None
-    current_week_raw: List[str] = []
-
-    def finalize_current_week():
-        nonlocal current_week, current_week_raw, current_phase
-        if current_phase and current_week:
-            if detailed_issues:
-                current_week["body"] = build_detailed_issue_body(
-                    phase_title=current_phase["title"],
-                    week_title=current_week["title"],
-                    week_num=current_week["number"],
-                    raw_lines=current_week_raw,
-                    source_file=file_path,
-                    reference_docs=reference_docs,
-                )
-            else:
-                current_week["body"] = build_simple_issue_body(
-                    week_num=current_week["number"],
-                    raw_lines=current_week_raw,
-                    source_file=file_path,
-                )
-            current_phase["weeks"].append(current_week)
-        current_week = None
-        current_week_raw = []
-
-    for raw_line in lines:
-        line = raw_line.strip()
-
-        phase_match = re.match(r"^##\s+.*?Phase\s+(\d+):\s+(.*)", line)
-        if phase_match:
-            finalize_current_week()
-            if current_phase:
-                phases.append(current_phase)
-
-            phase_num = phase_match.group(1)
-            phase_title = phase_match.group(2)
-            current_phase = {
-                "number": phase_num,
-                "title": f"Phase {phase_num}: {phase_title}",
-                "weeks": [],
-            }
-            continue
-
-        week_match = re.match(r"^###\s+Week\s+(\d+):\s+(.*)", line)
-        if week_match:
-            finalize_current_week()
-            if current_phase:
-                week_num = week_match.group(1)
-                week_goal = week_match.group(2)
-                current_week = {
-                    "number": week_num,
-                    "title": f"Week {week_num}: {week_goal}",
-                    "body": "",
-                }
-            continue
-
-        if current_week:
-            current_week_raw.append(raw_line.rstrip("\n"))
-
-    finalize_current_week()
-    if current_phase:
-        phases.append(current_phase)
-
+    phases = scan_markdown(file_path)
+    for phase in phases:
+        for week in phase["weeks"]:
+            week["body"] = render_week(phase, week, file_path, detailed_issues, reference_docs)
     return phases
 
 
-def get_existing_milestones(repo: str) -> Dict[str, dict]:
-    milestones = run_gh_json(["gh", "api", f"repos/{repo}/milestones?state=all&per_page=100"]) or []
-    return {milestone["title"]: milestone for milestone in milestones}
+class RepoSnapshot:
+    """
+    In-memory view of the repository objects a sync touches.
+
+    Loaded once at the start of `sync_to_github()` through the paginated
+    GraphQL loader and updated in place as milestones, issues, branches, and
+    PRs are created or edited, so each phase/week consults memory instead of
+    re-listing the repository. Week issues are tracked by week identifier in
+    `week_issues`. Updates are locked because issue upserts run on the
+    executor's worker threads.
+    """
 
+    def __init__(self, repo: str, index: RepositoryIndex, branches_loaded: bool = True):
+        self.repo = repo
+        self.index = index
+        self.week_issues: Dict[str, int] = {}
+        self.branch_index: Optional[Dict[str, Set[str]]] = None
+        self.main_commit: Optional[Tuple[str, str]] = None
+        self._lock = threading.Lock()
+        if branches_loaded:
+            self.set_branches(index.branch_names())
+
+    def set_branches(self, branch_names: Iterable[str]) -> None:
+        """Index `milestone/<middle>/phase-N` names as phase number -> taken middles."""
+        branch_index: Dict[str, Set[str]] = {}
+        for name in branch_names:
+            match = MILESTONE_BRANCH_RE.match(name)
+            if match:
+                branch_index.setdefault(match.group(2), set()).add(match.group(1))
+        self.branch_index = branch_index
+
+    @property
+    def milestones(self) -> Dict[str, dict]:
+        return self.index.milestones
+
+    @property
+    def issues(self) -> Dict[str, dict]:
+        return self.index.issues_by_title
+
+    @property
+    def pull_requests(self) -> List[dict]:
+        return self.index.pull_requests
+
+    @classmethod
+    def load(cls, repo: str, runner: GraphqlRunner = run_graphql) -> "RepoSnapshot":
+        log(f"Loading repository snapshot for {repo}...")
+        snapshot = cls(repo, load_repository_index(repo, SNAPSHOT_CONNECTIONS, runner=runner))
+        log(
+            f"  > {len(snapshot.milestones)} milestones, {len(snapshot.pull_requests)} PRs, "
+            f"{sum(map(len, snapshot.branch_index.values()))} milestone branches"
+        )
+        return snapshot
+
+    @classmethod
+    def from_state(cls, repo: str, target: dict) -> "RepoSnapshot":
+        """Seed a snapshot from recorded sync state without any API calls."""
+        log(f"Using recorded sync state for {repo} (no repository listing needed).")
+        index = RepositoryIndex(repo)
+        for phase in target.get("phases", {}).values():
+            if phase.get("milestone") is not None:
+                index.add_milestone({"number": phase["milestone"], "title": phase["title"]})
+        snapshot = cls(repo, index, branches_loaded=False)
+        for number, week in target.get("weeks", {}).items():
+            if week.get("issue") is not None:
+                snapshot.record_week_issue(week.get("id") or week_identifier(target["file"], number), week["issue"], week["title"])
+        for week_id, issue_number in target.get("issues", {}).items():
+            if week_id not in snapshot.week_issues:
+                snapshot.record_week_issue(week_id, issue_number)
+        return snapshot
+
+    def record_milestone(self, milestone: dict) -> None:
+        with self._lock:
+            self.index.add_milestone(milestone)
+
+    def record_issue(self, issue: dict) -> None:
+        with self._lock:
+            self.index.add_issue(issue)
+
+    def record_week_issue(self, week_id: str, issue_number: int, title: Optional[str] = None) -> None:
+        """Map a week to its issue, adding a number/title stub when the issue itself is not indexed."""
+        with self._lock:
+            self.week_issues[week_id] = issue_number
+            if issue_number not in self.index.issues_by_number and title:
+                self.index.add_issue({"number": issue_number, "title": title})
+
+    def week_issue(self, week_id: str) -> Optional[dict]:
+        number = self.week_issues.get(week_id)
+        return self.index.issues_by_number.get(number) if number is not None else None
+
+    def record_pull_request(self, pr: dict) -> None:
+        with self._lock:
+            self.index.add_pull_request(pr)
+
+    def record_branch(self, branch_name: str) -> None:
+        match = MILESTONE_BRANCH_RE.match(branch_name)
+        if match and self.branch_index is not None:
+            with self._lock:
+                self.branch_index.setdefault(match.group(2), set()).add(match.group(1))
+
+    def find_pull_request(self, title: str, head_ref: str) -> Optional[dict]:
+        for pr in self.pull_requests:
+            if pr.get("title") == title or pr.get("headRefName") == head_ref:
+                return pr
+        return None
 
-def ensure_milestone(repo: str, title: str) -> dict:
-    existing = get_existing_milestones(repo)
-    if title in existing:
-        print(f"Reusing Milestone: {title}")
-        return existing[title]
 
-    print(f"Creating Milestone: {title}")
-    milestone = run_gh_json(["gh", "api", f"repos/{repo}/milestones", "-f", f"title={title}"])
-    print(f"  > Created Milestone #{milestone['number']}")
-    return milestone
+def state_covers(phases: List[dict], target: dict) -> bool:
+    """True when every phase and week to sync already has a recorded milestone/issue number (renamed weeks included)."""
+    phase_records = target.get("phases", {})
+    for phase in phases:
+        record = phase_records.get(phase["number"]) or {}
+        if record.get("title") != phase["title"] or record.get("milestone") is None:
+            return False
+        for week in phase["weeks"]:
+            week_id = week.get("id") or week_identifier(target["file"], week["number"])
+            if recorded_issue(target, week_id, week["number"]) is None:
+                return False
+    return True
+
+
+def _number_from_url(url: str) -> Optional[int]:
+    match = re.search(r"/(\d+)/?$", url.strip())
+    return int(match.group(1)) if match else None
+
+
+def _issue_record(issue: dict) -> dict:
+    """Reduce a REST issue payload to the fields the snapshot index keeps."""
+    milestone = issue.get("milestone") or {}
+    return {
+        "number": issue["number"],
+        "title": issue["title"],
+        "state": str(issue.get("state", "")).upper(),
+        "url": issue.get("html_url", ""),
+        "body": issue.get("body") or "",
+        "labels": [label["name"] for label in issue.get("labels") or []],
+        "milestone": {"number": milestone.get("number"), "title": milestone.get("title")} if milestone else None,
+    }
 
 
-def get_existing_issues(repo: str) -> Dict[str, dict]:
-    issues = run_gh_json(["gh", "api", f"repos/{repo}/issues?state=all&per_page=200"]) or []
-    issue_map = {}
-    for issue in issues:
-        if "pull_request" in issue:
-            continue
-        issue_map[issue["title"]] = issue
-    return issue_map
+def body_hash(body: str) -> str:
+    return hashlib.sha256(body.replace("\r\n", "\n").strip().encode("utf-8")).hexdigest()
 
 
-def upsert_issue(repo: str, title: str, body: str, milestone_title: str):
-    issues = get_existing_issues(repo)
-    with tempfile.NamedTemporaryFile("w", delete=False, encoding="utf-8") as tmp:
-        tmp.write(body)
-        tmp_path = tmp.name
+def with_hash_marker(body: str, week_id: Optional[str] = None) -> str:
+    """Append hidden markers recording the week identifier and the hash of the rendered body."""
+    markers = [WEEK_ID_MARKER.format(week_id)] if week_id else []
+    markers.append(SYNC_HASH_MARKER.format(body_hash(body)))
+    return f"{body.rstrip()}\n\n" + "\n".join(markers) + "\n"
 
-    try:
-        if title in issues:
-            issue_number = str(issues[title]["number"])
-            print(f"Updating Issue: {title}")
-            run_gh_command(
-                [
-                    "gh",
-                    "issue",
-                    "edit",
-                    issue_number,
-                    "--repo",
-                    repo,
-                    "--body-file",
-                    tmp_path,
-                    "--milestone",
-                    milestone_title,
-                    "--add-label",
-                    "enhancement",
-                ]
-            )
-            print(f"  > Updated Issue #{issue_number}")
-            return
 
-        print(f"Creating Issue: {title}")
-        issue_url = run_gh_command(
-            [
-                "gh",
-                "issue",
-                "create",
-                "--repo",
-                repo,
-                "--title",
-                title,
-                "--body-file",
-                tmp_path,
-                "--milestone",
-                milestone_title,
-                "--label",
-                "enhancement",
-            ]
-        )
-        if issue_url:
-            print(f"  > Created Issue: {issue_url}")
-    finally:
-        try:
-            os.unlink(tmp_path)
-        except FileNotFoundError:
-            pass
+def remote_week_id(remote_body: Optional[str]) -> Optional[str]:
+    match = WEEK_ID_PATTERN.search(remote_body or "")
+    return match.group(1) if match else None
 
 
-def _branch_exists(repo: str, branch_name: str) -> bool:
-    result = subprocess.run(
-        ["gh", "api", f"repos/{repo}/git/ref/heads/{branch_name}"],
-        capture_output=True,
-        text=True,
+def remote_body_hash(remote_body: Optional[str]) -> Optional[str]:
+    """
+    Hash of the body last pushed by the sync.
+
+    Prefers the embedded marker so checklist boxes ticked on GitHub do not
+    count as drift; bodies written before markers existed are hashed directly.
+    """
+    if remote_body is None:
+        return None
+    match = SYNC_HASH_PATTERN.search(remote_body)
+    if match:
+        return match.group(1)
+    return body_hash(remote_body)
+
+
+def issue_is_current(existing: dict, week: dict, milestone: dict) -> bool:
+    existing_milestone = existing.get("milestone") or {}
+    return (
+        existing.get("title") == week["title"]
+        and remote_week_id(existing.get("body")) == week.get("id")
+        and remote_body_hash(existing.get("body")) == body_hash(week["body"])
+        and existing_milestone.get("number") == milestone.get("number")
+        and ISSUE_LABEL in (existing.get("labels") or [])
     )
-    return result.returncode == 0
 
 
 def _sanitize_branch_word(word: str) -> str:
@@ -470,7 +445,7 @@ def _sanitize_branch_word(word: str) -> str:
     return sanitized
 
 
-def _select_unique_branch_name(repo: str, phase_number: str, branch_word: str) -> str:
+def _select_unique_branch_name(branch_index: Dict[str, Set[str]], phase_number: str, branch_word: str) -> str:
     """
     Branch format:
       milestone/<one-word>/phase-N
@@ -479,114 +454,708 @@ def _select_unique_branch_name(repo: str, phase_number: str, branch_word: str) -
       milestone/<one-word>2/phase-N
       milestone/<one-word>3/phase-N
       ...
+
+    `branch_index` maps phase numbers to the middle segments already taken, so
+    the free name is found with in-memory set lookups only.
     """
     word = _sanitize_branch_word(branch_word)
-    for i in range(1, 1000):
-        middle = word if i == 1 else f"{word}{i}"
-        candidate = f"milestone/{middle}/phase-{phase_number}"
-        if not _branch_exists(repo, candidate):
-            if i > 1:
-                print(f"  > Branch exists, using alternative name: {candidate}")
-            return candidate
-    raise RuntimeError("Unable to find an available milestone branch name.")
-
-
-def ensure_branch(repo: str, phase_number: str, branch_word: str) -> str:
-    branch_name = _select_unique_branch_name(repo, phase_number, branch_word)
-
-    print(f"Creating Integration Branch: {branch_name} from main...")
-    main_sha = run_gh_command(["gh", "api", f"repos/{repo}/git/ref/heads/main", "--jq", ".object.sha"])
-    tree_sha = run_gh_command(["gh", "api", f"repos/{repo}/git/commits/{main_sha}", "--jq", ".tree.sha"])
-    new_commit_sha = run_gh_command(
-        [
-            "gh",
-            "api",
-            f"repos/{repo}/git/commits",
-            "-f",
-            f"message=chore: start milestone {branch_word} phase-{phase_number}",
-            "-f",
-            f"tree={tree_sha}",
-            "-f",
-            f"parents[]={main_sha}",
-            "--jq",
-            ".sha",
-        ]
-    )
-    run_gh_command(
-        [
-            "gh",
-            "api",
-            f"repos/{repo}/git/refs",
-            "-f",
-            f"ref=refs/heads/{branch_name}",
-            "-f",
-            f"sha={new_commit_sha}",
-        ]
-    )
-    print(f"  > Created Remote Branch: {branch_name}")
-    return branch_name
+    taken = branch_index.get(str(phase_number), set())
+    if word not in taken:
+        return f"milestone/{word}/phase-{phase_number}"
+
+    # Only len(taken) suffixes can be occupied, so a free one exists within len(taken) + 1 probes.
+    suffix = next(i for i in range(2, len(taken) + 3) if f"{word}{i}" not in taken)
+    candidate = f"milestone/{word}{suffix}/phase-{phase_number}"
+    log(f"  > Branch exists, using alternative name: {candidate}")
+    return candidate
+
+
+def ensure_branch_index(executor: GhExecutor, snapshot: RepoSnapshot) -> Dict[str, Set[str]]:
+    """Fetch every `milestone/` ref with one matching-refs request if the snapshot has none yet."""
+    if snapshot.branch_index is None:
+        refs = executor.api("branch.list", "GET", f"repos/{snapshot.repo}/git/matching-refs/heads/milestone/") or []
+        snapshot.set_branches(ref["ref"][len("refs/heads/"):] for ref in refs)
+    return snapshot.branch_index
+
+
+def main_base_commit(executor: GhExecutor, snapshot: RepoSnapshot) -> Tuple[str, str]:
+    """Resolve `main` and its tree once per run; every phase branch starts from the same commit."""
+    if snapshot.main_commit is None:
+        repo = snapshot.repo
+        main_sha = executor.api("branch.read", "GET", f"repos/{repo}/git/ref/heads/main")["object"]["sha"]
+        tree_sha = executor.api("branch.read", "GET", f"repos/{repo}/git/commits/{main_sha}")["tree"]["sha"]
+        snapshot.main_commit = (main_sha, tree_sha)
+    return snapshot.main_commit
+
+
+def week_search_query(repo: str, week: dict, field: str) -> str:
+    """Issue search for a week by its hidden week-id marker (`field="id"`) or its exact title."""
+    if field == "id":
+        return f'repo:{repo} is:issue in:body "week-id: {week["id"]}"'
+    return 'repo:%s is:issue in:title "%s"' % (repo, week["title"].replace('"', " "))
+
+
+def _issue_week_field(issue: dict, field: str) -> Optional[str]:
+    return remote_week_id(issue.get("body")) if field == "id" else issue.get("title")
+
+
+def resolve_week_issues(
+    executor: GhExecutor, snapshot: RepoSnapshot, phases, target: Optional[dict] = None
+) -> None:
+    """
+    Map every week to sync onto its existing issue without listing the repository.
+
+    Lookup order: the week -> issue mapping recorded in the sync state, then a
+    batched search for the hidden week-id marker, then an exact-title search
+    for issues synced before markers existed. The cost is per week, not per
+    issue in the repository. Searches go through `executor`, so they wait on
+    its rate limiter and hold a unit of the shared API budget like any call.
+    """
+    unresolved: List[dict] = []
+    for phase in phases:
+        for week in phase["weeks"]:
+            if week["id"] in snapshot.week_issues:
+                continue
+            number = recorded_issue(target or {}, week["id"], week["number"])
+            if number is not None:
+                snapshot.record_week_issue(week["id"], number, week["title"])
+            else:
+                unresolved.append(week)
+
+    for field in ("id", "title"):
+        if not unresolved:
+            return
+        log(f"Searching for {len(unresolved)} week issue(s) by {field}...")
+        queries = {week["id"]: week_search_query(snapshot.repo, week, field) for week in unresolved}
+        results = search_issues(queries, runner=executor.runner("week.search"))
+
+        still_unresolved = []
+        for week in unresolved:
+            # Search matches loosely; only an exact marker or title counts.
+            match = next(
+                (issue for issue in results.get(week["id"], []) if _issue_week_field(issue, field) == week[field]),
+                None,
+            )
+            if match:
+                snapshot.record_issue(match)
+                snapshot.record_week_issue(week["id"], match["number"])
+            else:
+                still_unresolved.append(week)
+        unresolved = still_unresolved
+
+
+def plan_issue_op(snapshot: RepoSnapshot, phase: dict, week: dict, milestone_title: str) -> dict:
+    """Decide whether one week issue must be created, updated, or left alone."""
+    op = {
+        "phase": phase["number"],
+        "week": week["number"],
+        "id": week["id"],
+        "title": week["title"],
+        "hash": week.get("hash"),
+        "milestone": milestone_title,
+        "body": week["body"],
+    }
+    existing = snapshot.week_issue(week["id"])
+    if not existing:
+        return {"op": "issue.create", **op}
+
+    op["number"] = existing["number"]
+    milestone = snapshot.milestones.get(milestone_title) or {}
+    if issue_is_current(existing, week, milestone):
+        op.pop("body")
+        return {"op": "issue.skip", **op}
+    if existing.get("labels") is not None:
+        # PATCH replaces labels, so only send them when the current set is known.
+        op["labels"] = sorted(set(existing["labels"]) | {ISSUE_LABEL})
+    return {"op": "issue.update", **op}
+
+
+def plan_sync(
+    executor: GhExecutor,
+    snapshot: RepoSnapshot,
+    phases,
+    branch_word: str,
+    *,
+    target: Optional[dict] = None,
+    deleted: Optional[List[Tuple[str, dict]]] = None,
+    close_deleted: bool = False,
+) -> List[dict]:
+    """
+    Compute the ordered operations that bring GitHub in line with `phases`.
+
+    Only reads from GitHub (week issue searches and the milestone ref listing,
+    when the snapshot lacks them). Per phase the order is milestone, week issues, branch, PR, so a
+    milestone always exists before the issues that reference it.
+    """
+    resolve_week_issues(executor, snapshot, phases, target)
+    phase_records = (target or {}).get("phases", {})
+    planned_branches: Dict[str, Set[str]] = {}
+    operations: List[dict] = []
+
+    for phase in phases:
+        milestone = snapshot.milestones.get(phase["title"])
+        if milestone:
+            operations.append(
+                {"op": "milestone.reuse", "phase": phase["number"], "title": phase["title"], "number": milestone["number"]}
+            )
+        else:
+            operations.append({"op": "milestone.create", "phase": phase["number"], "title": phase["title"]})
+
+        for week in phase["weeks"]:
+            operations.append(plan_issue_op(snapshot, phase, week, phase["title"]))
+
+        branch_name = (phase_records.get(phase["number"]) or {}).get("branch")
+        if branch_name:
+            operations.append({"op": "branch.reuse", "phase": phase["number"], "name": branch_name})
+            continue
+
+        taken = {key: set(values) for key, values in ensure_branch_index(executor, snapshot).items()}
+        for key, values in planned_branches.items():
+            taken.setdefault(key, set()).update(values)
+        branch_name = _select_unique_branch_name(taken, phase["number"], branch_word)
+        planned_branches.setdefault(str(phase["number"]), set()).add(MILESTONE_BRANCH_RE.match(branch_name).group(1))
+        operations.append(
+            {"op": "branch.create", "phase": phase["number"], "name": branch_name, "branch_word": branch_word}
+        )
+
+        pr_title = f"[{phase['title']}] Integration PR"
+        existing_pr = snapshot.find_pull_request(pr_title, branch_name)
+        if existing_pr:
+            operations.append({"op": "pr.reuse", "phase": phase["number"], "title": pr_title, "number": existing_pr.get("number")})
+        else:
+            operations.append(
+                {"op": "pr.create", "phase": phase["number"], "title": pr_title, "head": branch_name, "milestone": phase["title"]}
+            )
 
+    for week_number, record in deleted or []:
+        operations.append(
+            {
+                "op": "issue.close" if close_deleted and record.get("issue") else "week.deleted",
+                "week": week_number,
+                "title": record.get("title", f"Week {week_number}"),
+                "number": record.get("issue"),
+            }
+        )
+    return operations
 
-def get_existing_prs(repo: str) -> List[dict]:
-    return run_gh_json(["gh", "api", f"repos/{repo}/pulls?state=all&per_page=200"]) or []
 
+def estimate_api_calls(operations: List[dict], snapshot: Optional[RepoSnapshot] = None) -> Dict[str, int]:
+    """Count REST calls per operation type; `main` is resolved once for all new branches."""
+    by_op: Dict[str, int] = {}
+    for operation in operations:
+        cost = API_CALL_COSTS.get(operation["op"], 0)
+        if cost:
+            by_op[operation["op"]] = by_op.get(operation["op"], 0) + cost
+    if "branch.create" in by_op and (snapshot is None or snapshot.main_commit is None):
+        by_op["branch.base"] = 2
+    return by_op
 
-def ensure_integration_pr(repo: str, phase_title: str, branch_name: str):
-    pr_title = f"[{phase_title}] Integration PR"
-    for pr in get_existing_prs(repo):
-        if pr.get("title") == pr_title or pr.get("head", {}).get("ref") == branch_name:
-            print(f"Reusing Pull Request: {pr_title}")
-            return pr
 
-    print(f"Creating Pull Request for {branch_name}...")
+def rate_limit_budget(executor: GhExecutor) -> Dict[str, dict]:
+    """Read the token's remaining quota; `GET /rate_limit` itself does not count against it."""
+    try:
+        payload = executor.api("rate_limit.read", "GET", "rate_limit") or {}
+    except RuntimeError as error:
+        log(f"Could not read rate limit: {error}")
+        return {}
+    resources = payload.get("resources") or {}
+    return {name: resources[name] for name in ("core", "graphql") if name in resources}
+
+
+def build_plan_document(
+    operations: List[dict],
+    *,
+    repo: str,
+    file_path: str,
+    branch_word: str,
+    settings: Dict[str, object],
+    state_path: str,
+    api_calls: Dict[str, int],
+    budget: Dict[str, dict],
+) -> dict:
+    with open(file_path, "rb") as file:
+        source_hash = hashlib.sha256(file.read()).hexdigest()
+    return {
+        "version": PLAN_VERSION,
+        "created_at": int(time.time()),
+        "repo": repo,
+        "file": file_path,
+        "source_hash": source_hash,
+        "branch_word": branch_word,
+        "render": settings,
+        "state_file": state_path,
+        "api_calls": {"total": sum(api_calls.values()), "by_op": api_calls},
+        "rate_limit": budget,
+        "operations": operations,
+    }
+
+
+def print_plan_summary(plan: dict) -> None:
+    counts: Dict[str, int] = {}
+    for operation in plan["operations"]:
+        counts[operation["op"]] = counts.get(operation["op"], 0) + 1
+
+    print(f"\nSync plan for {plan['repo']} ({plan['file']}):")
+    for op in sorted(counts):
+        print(f"  {op:<18} {counts[op]:>5}")
+    for operation in plan["operations"]:
+        if operation["op"] in ("milestone.create", "issue.create", "issue.update", "branch.create", "pr.create", "issue.close"):
+            label = operation.get("name") or operation.get("title")
+            print(f"  + {operation['op']}: {label}")
+        elif operation["op"] == "week.deleted":
+            print(f"  ! removed from task list: {operation['title']} (#{operation['number']})")
+
+    total = plan["api_calls"]["total"]
+    # `gh pr create` and the `main` lookups are not spaced by the executor's mutation interval.
+    mutations = sum(count for op, count in plan["api_calls"]["by_op"].items() if op not in ("branch.base", "pr.create"))
+    print(f"\nEstimated API calls: {total}")
+    core = (plan.get("rate_limit") or {}).get("core")
+    if core:
+        reset_at = time.strftime("%H:%M:%S", time.localtime(core.get("reset", 0)))
+        left = core.get("remaining", 0) - total
+        print(f"Rate limit budget: {core.get('remaining')}/{core.get('limit')} remaining, {left} left after apply (resets {reset_at})")
+        if left < 0:
+            print("Warning: the plan exceeds the remaining hourly quota; schedule the apply after the reset.")
+    print(f"Minimum apply duration at the mutation spacing: {mutations * DEFAULT_MUTATION_INTERVAL:.1f}s")
+
+
+def create_milestone(executor: GhExecutor, snapshot: RepoSnapshot, title: str) -> dict:
+    log(f"Creating Milestone: {title}")
+    milestone = executor.api("milestone.create", "POST", f"repos/{snapshot.repo}/milestones", {"title": title})
+    log(f"  > Created Milestone #{milestone['number']}")
+    snapshot.record_milestone(milestone)
+    return milestone
+
+
+def apply_issue_op(executor: GhExecutor, snapshot: RepoSnapshot, op: dict, milestone_number: int) -> str:
+    """Execute one planned week issue operation; returns "created", "updated", or "unchanged"."""
+    repo = snapshot.repo
+    if op["op"] == "issue.skip":
+        log(f"Unchanged Issue: {op['title']} (#{op['number']})")
+        return "unchanged"
+
+    marked_body = with_hash_marker(op["body"], op.get("id"))
+    if op["op"] == "issue.update":
+        # The title is sent too, so renaming a week renames its issue instead of duplicating it.
+        payload = {"title": op["title"], "body": marked_body, "milestone": milestone_number}
+        if op.get("labels") is not None:
+            payload["labels"] = op["labels"]
+        log(f"Updating Issue: {op['title']}")
+        issue = executor.api("issue.update", "PATCH", f"repos/{repo}/issues/{op['number']}", payload)
+        log(f"  > Updated Issue #{op['number']}")
+        outcome = "updated"
+    else:
+        log(f"Creating Issue: {op['title']}")
+        issue = executor.api(
+            "issue.create",
+            "POST",
+            f"repos/{repo}/issues",
+            {"title": op["title"], "body": marked_body, "milestone": milestone_number, "labels": [ISSUE_LABEL]},
+        )
+        log(f"  > Created Issue: {issue['html_url']}")
+        outcome = "created"
+
+    snapshot.record_issue(_issue_record(issue))
+    if op.get("id"):
+        snapshot.record_week_issue(op["id"], issue["number"])
+    return outcome
+
+
+def create_branch(executor: GhExecutor, snapshot: RepoSnapshot, phase_number: str, branch_name: str, branch_word: str) -> str:
+    repo = snapshot.repo
+    log(f"Creating Integration Branch: {branch_name} from main...")
+    main_sha, tree_sha = main_base_commit(executor, snapshot)
+    new_commit = executor.api(
+        "branch.commit",
+        "POST",
+        f"repos/{repo}/git/commits",
+        {
+            "message": f"chore: start milestone {branch_word} phase-{phase_number}",
+            "tree": tree_sha,
+            "parents": [main_sha],
+        },
+    )
+    executor.api(
+        "branch.create",
+        "POST",
+        f"repos/{repo}/git/refs",
+        {"ref": f"refs/heads/{branch_name}", "sha": new_commit["sha"]},
+    )
+    log(f"  > Created Remote Branch: {branch_name}")
+    snapshot.record_branch(branch_name)
+    return branch_name
+
+
+def create_integration_pr(executor: GhExecutor, snapshot: RepoSnapshot, pr_title: str, branch_name: str, milestone_title: str):
+    log(f"Creating Pull Request for {branch_name}...")
     pr_body = (
-        f"Integration PR for **{phase_title}**.\n"
+        f"Integration PR for **{milestone_title}**.\n"
         "All related feature branches for this milestone will be merged into this phase branch before a final release to `main`."
     )
-    pr_url = run_gh_command(
-        [
-            "gh",
-            "pr",
-            "create",
-            "--repo",
-            repo,
-            "--base",
-            "main",
-            "--head",
-            branch_name,
-            "--title",
-            pr_title,
-            "--body",
-            pr_body,
-            "--milestone",
-            phase_title,
-        ],
-        check=False,
-    )
+    with executor.timed("pr.create"), executor.slot():
+        pr_url = run_gh_command(
+            [
+                "gh",
+                "pr",
+                "create",
+                "--repo",
+                snapshot.repo,
+                "--base",
+                "main",
+                "--head",
+                branch_name,
+                "--title",
+                pr_title,
+                "--body",
+                pr_body,
+                "--milestone",
+                milestone_title,
+            ],
+            check=False,
+        )
     if pr_url:
-        print(f"  > Created PR: {pr_url}")
+        log(f"  > Created PR: {pr_url}")
+        snapshot.record_pull_request(
+            {
+                "title": pr_title,
+                "number": _number_from_url(pr_url),
+                "url": pr_url,
+                "headRefName": branch_name,
+            }
+        )
     else:
-        print(f"  > PR not created for {branch_name}. This can happen when no diff exists against main.")
+        log(f"  > PR not created for {branch_name}. This can happen when no diff exists against main.")
     return pr_url
 
 
-def sync_to_github(phases, repo: str, branch_word: str):
-    print(f"Syncing to repository: {repo}...")
+def apply_plan(
+    executor: GhExecutor,
+    snapshot: RepoSnapshot,
+    operations: List[dict],
+    *,
+    target: Optional[dict] = None,
+    report: Optional[dict] = None,
+) -> Dict[str, int]:
+    """
+    Execute planned operations in order.
 
-    for phase in phases:
-        milestone = ensure_milestone(repo, phase["title"])
+    Week issue operations are submitted to the executor's worker pool once
+    their milestone is known; everything else runs on the calling thread.
+    With a sync-state `target`, each phase and each week that synced is recorded.
+    Issue outcome counts are also stored in `report["issues"]` when given.
+    """
+    milestone_numbers: Dict[str, int] = {}
+    phase_milestones: Dict[str, Tuple[str, int]] = {}
+    pending: List[Tuple[dict, Future]] = []
+    failures: List[Tuple[str, Exception]] = []
+    counts: Dict[str, int] = {}
+    deleted_notes: List[dict] = []
+
+    for op in operations:
+        kind = op["op"]
+        if kind == "milestone.reuse":
+            log(f"Reusing Milestone: {op['title']}")
+            milestone_numbers[op["title"]] = op["number"]
+            phase_milestones[op["phase"]] = (op["title"], op["number"])
+        elif kind == "milestone.create":
+            milestone = create_milestone(executor, snapshot, op["title"])
+            milestone_numbers[op["title"]] = milestone["number"]
+            phase_milestones[op["phase"]] = (op["title"], milestone["number"])
+        elif kind.startswith("issue.") and kind != "issue.close":
+            future = executor.submit("week.upsert", apply_issue_op, executor, snapshot, op, milestone_numbers[op["milestone"]])
+            pending.append((op, future))
+        elif kind in ("branch.reuse", "branch.create"):
+            if kind == "branch.reuse":
+                log(f"Reusing Integration Branch: {op['name']}")
+            else:
+                create_branch(executor, snapshot, op["phase"], op["name"], op["branch_word"])
+            if target is not None:
+                title, number = phase_milestones[op["phase"]]
+                record_phase(target, {"number": op["phase"], "title": title}, number, op["name"])
+        elif kind == "pr.reuse":
+            log(f"Reusing Pull Request: {op['title']}")
+        elif kind == "pr.create":
+            create_integration_pr(executor, snapshot, op["title"], op["head"], op["milestone"])
+        elif kind == "issue.close":
+            log(f"Closing Issue #{op['number']} for deleted {op['title']}")
+            executor.api("issue.close", "PATCH", f"repos/{snapshot.repo}/issues/{op['number']}", {"state": "closed"})
+            if target is not None:
+                forget_week(target, op["week"])
+        elif kind == "week.deleted":
+            deleted_notes.append(op)
+
+    for op, future in pending:
+        try:
+            outcome = future.result()
+            counts[outcome] = counts.get(outcome, 0) + 1
+        except RuntimeError as error:
+            failures.append((op["title"], error))
+            continue
+        if target is not None:
+            number = op.get("number") or snapshot.week_issues.get(op.get("id"))
+            week = {"number": op["week"], "id": op.get("id"), "title": op["title"], "hash": op["hash"]}
+            record_week(target, {"number": op["phase"]}, week, number)
+
+    if deleted_notes:
+        log("\nWeeks removed from the task list since the last sync (use --close-deleted to close):")
+        for op in deleted_notes:
+            log(f"- {op['title']} (#{op['number']})")
+
+    log(
+        f"\nIssues: {counts.get('created', 0)} created, {counts.get('updated', 0)} updated, "
+        f"{counts.get('unchanged', 0)} unchanged, {len(failures)} failed"
+    )
+    if report is not None:
+        report["issues"] = {**counts, "failed": len(failures)}
+    if failures:
+        log(f"\n{len(failures)} issue upsert(s) failed:")
+        for title, error in failures:
+            log(f"- {title}: {error}")
+        raise RuntimeError("Some week issues failed to sync.")
+    return counts
+
+
+def load_snapshot(executor: GhExecutor, repo: str, phases, target: Optional[dict]) -> RepoSnapshot:
+    if target is not None and state_covers(phases, target):
+        return RepoSnapshot.from_state(repo, target)
+    return RepoSnapshot.load(repo, executor.runner("snapshot.load"))
+
+
+def sync_to_github(
+    phases,
+    repo: str,
+    branch_word: str,
+    concurrency: int = DEFAULT_WORKERS,
+    *,
+    target: Optional[dict] = None,
+    deleted: Optional[List[Tuple[str, dict]]] = None,
+    close_deleted: bool = False,
+    snapshot: Optional[RepoSnapshot] = None,
+    limiter: Optional[RateLimiter] = None,
+    budget: Optional[threading.Semaphore] = None,
+    report: Optional[dict] = None,
+):
+    """
+    Push phases/weeks to GitHub: load a snapshot, plan the operations, apply them.
+
+    With a sync-state `target`, `phases` holds only the changed sections: the
+    snapshot is seeded from the recorded milestone/issue numbers when every
+    changed week is already known, phases with a recorded integration branch
+    skip branch/PR setup, and the target is updated for each week that synced.
+    A caller-owned `snapshot` (and `limiter`) is used as is and kept up to date.
+    `budget` caps gh calls in flight when several targets sync at once, and a
+    `report` dict receives the planned operations, issue counts, and latencies.
+    """
+    log(f"Syncing to repository: {repo}...")
+    executor = GhExecutor(concurrency, limiter=limiter, budget=budget)
+    try:
+        if snapshot is None:
+            snapshot = load_snapshot(executor, repo, phases, target)
+        operations = plan_sync(
+            executor, snapshot, phases, branch_word, target=target, deleted=deleted, close_deleted=close_deleted
+        )
+        if report is not None:
+            by_op: Dict[str, int] = {}
+            for operation in operations:
+                by_op[operation["op"]] = by_op.get(operation["op"], 0) + 1
+            report["operations"] = by_op
+            report["api_calls"] = sum(estimate_api_calls(operations, snapshot).values())
+        return apply_plan(executor, snapshot, operations, target=target, report=report)
+    finally:
+        executor.shutdown()
+        executor.print_latency_summary()
+        if report is not None:
+            report["latency"] = executor.latency_stats()
+
+
+def apply_plan_file(plan_path: str, concurrency: int) -> None:
+    with open(plan_path, "r", encoding="utf-8") as file:
+        plan = json.load(file)
+    if plan.get("version") != PLAN_VERSION:
+        print(f"Unsupported plan version in {plan_path}.")
+        sys.exit(1)
+
+    if os.path.exists(plan["file"]):
+        with open(plan["file"], "rb") as file:
+            if hashlib.sha256(file.read()).hexdigest() != plan["source_hash"]:
+                print(f"Warning: {plan['file']} changed after the plan was made; applying the plan as written.")
+
+    state = load_sync_state(plan["state_file"])
+    target = target_state(state, plan["repo"], plan["file"])
+    if target.get("render") != plan["render"]:
+        reset_week_hashes(target)
+    target["render"] = plan["render"]
+
+    print(f"Applying {len(plan['operations'])} planned operations to {plan['repo']} (~{plan['api_calls']['total']} API calls)...")
+    executor = GhExecutor(concurrency)
+    snapshot = RepoSnapshot(plan["repo"], RepositoryIndex(plan["repo"]), branches_loaded=False)
+    try:
+        apply_plan(executor, snapshot, plan["operations"], target=target)
+    except RuntimeError as error:
+        print(f"Apply failed: {error}")
+        sys.exit(1)
+    finally:
+        executor.shutdown()
+        executor.print_latency_summary()
+        save_sync_state(plan["state_file"], state)
+
+
+def write_sync_plan(args, changed, deleted, target: dict, settings: Dict[str, object], state_path: str) -> None:
+    """Plan the sync of the changed sections and write it to `args.plan`; nothing is mutated."""
+    executor = GhExecutor(args.concurrency)
+    try:
+        snapshot = load_snapshot(executor, args.repo, changed, target)
+        operations = plan_sync(
+            executor, snapshot, changed, args.branch_word, target=target, deleted=deleted, close_deleted=args.close_deleted
+        )
+        api_calls = estimate_api_calls(operations, snapshot)
+        budget = rate_limit_budget(executor)
+    finally:
+        executor.shutdown()
+
+    plan = build_plan_document(
+        operations,
+        repo=args.repo,
+        file_path=args.file,
+        branch_word=args.branch_word,
+        settings=settings,
+        state_path=state_path,
+        api_calls=api_calls,
+        budget=budget,
+    )
+    with open(args.plan, "w", encoding="utf-8") as file:
+        json.dump(plan, file, indent=2, ensure_ascii=False)
+        file.write("\n")
+    print_plan_summary(plan)
+    print(f"\nPlan written to {args.plan}. Run with --apply {args.plan} to execute it.")
+
+
+def sync_once(
+    args,
+    state: dict,
+    state_path: str,
+    *,
+    full: bool = False,
+    week_cache: Optional[WeekCache] = None,
+    snapshot: Optional[RepoSnapshot] = None,
+    limiter: Optional[RateLimiter] = None,
+    budget: Optional[threading.Semaphore] = None,
+    report: Optional[dict] = None,
+) -> None:
+    """
+    Sync (or, with --plan, plan) the week sections of `args.file` that changed
+    since the recorded state. `args.path`, when set, is where the file is
+    read from; `args.file` is the name rendered into issues and sync state.
+    """
+    misses = week_cache.misses if week_cache is not None else 0
+    source_path = getattr(args, "path", None) or args.file
+    phases = scan_markdown(source_path, week_cache)
+    if not phases:
+        log("No phases found in the markdown file. Check format.")
+        return
+    duplicates = duplicate_weeks(phases)
+    if duplicates:
+        raise RuntimeError(
+            f"week numbers must be unique across the task list; renumber {', '.join(duplicates)}"
+        )
+
+    detailed_issues = not args.simple_issues
+    target = target_state(state, args.repo, args.file, source_path)
+    settings = render_settings(args.file, detailed_issues, args.reference)
+    if full:
+        reset_week_hashes(target)
+
+    changed, deleted = changed_sections(phases, target, settings)
+    if target.get("render") != settings:
+        reset_week_hashes(target)
+    target["render"] = settings
+
+    week_count = sum(len(phase["weeks"]) for phase in phases)
+    changed_count = sum(len(phase["weeks"]) for phase in changed)
+    if week_cache is not None:
+        log(f"Re-parsed {week_cache.misses - misses} of {week_count} week sections.")
+    log(f"{changed_count} of {week_count} week sections changed since the last sync.")
+    if report is not None:
+        report.update({"weeks": week_count, "changed_weeks": changed_count, "deleted_weeks": len(deleted)})
+    if not changed and not deleted:
+        if not args.plan:
+            save_sync_state(state_path, state)
+        log("Nothing to sync.")
+        return
 
+    for phase in changed:
         for week in phase["weeks"]:
-            upsert_issue(repo, week["title"], week["body"], milestone["title"])
+            week["id"] = week_identifier(args.file, week["number"])
+            week["body"] = render_week(phase, week, args.file, detailed_issues, args.reference)
 
-        branch_name = ensure_branch(repo, phase["number"], branch_word)
-        ensure_integration_pr(repo, phase["title"], branch_name)
+    if args.plan:
+        write_sync_plan(args, changed, deleted, target, settings, state_path)
+        return
+
+    try:
+        sync_to_github(
+            changed,
+            args.repo,
+            args.branch_word,
+            concurrency=args.concurrency,
+            target=target,
+            deleted=deleted,
+            close_deleted=args.close_deleted,
+            snapshot=snapshot,
+            limiter=limiter,
+            budget=budget,
+            report=report,
+        )
+    finally:
+        save_sync_state(state_path, state)
+
+
+def watch_task_list(args, state: dict, state_path: str) -> None:
+    """
+    Sync, then re-sync after every debounced burst of edits until interrupted.
+
+    The repository snapshot, rate limiter, and parsed week bodies stay in
+    memory between cycles, so each cycle re-parses only edited weeks and
+    pushes only the sections whose hash changed.
+    """
+    watched = [args.file] + args.reference
+    reference_paths = {os.path.abspath(path) for path in args.reference}
+    watcher = open_watcher(watched, args.poll_interval)
+    week_cache = WeekCache()
+    limiter = RateLimiter()
+    loader = GhExecutor(1, limiter=limiter)
+    try:
+        snapshot = load_snapshot(loader, args.repo, [], None)
+    finally:
+        loader.shutdown()
+    full = args.full
+
+    print(f"Watching {', '.join(watched)} ({watcher.kind}). Press Ctrl+C to stop.")
+    try:
+        while True:
+            try:
+                sync_once(
+                    args, state, state_path, full=full, week_cache=week_cache, snapshot=snapshot, limiter=limiter
+                )
+            except RuntimeError as error:
+                print(f"Sync failed: {error}")
+
+            changed = wait_for_changes(watcher, args.debounce)
+            print(f"\nChanged: {', '.join(sorted(os.path.relpath(path) for path in changed))}")
+            # Reference docs are listed in every detailed body, so an edit re-checks
+            # all weeks; bodies that render identically are skipped against the
+            # warm snapshot without API calls.
+            full = bool(changed & reference_paths)
+    except KeyboardInterrupt:
+        print("\nStopped watching.")
+    finally:
+        watcher.close()
 
 
 def main():
     parser = argparse.ArgumentParser(description="Sync task list to GitHub milestones and issues.")
-    parser.add_argument("--file", type=str, required=True, help="Path to the task list markdown file.")
-    parser.add_argument("--repo", type=str, required=True, help="Target GitHub repository (owner/repo).")
+    parser.add_argument("--file", type=str, help="Path to the task list markdown file.")
+    parser.add_argument("--repo", type=str, help="Target GitHub repository (owner/repo).")
     parser.add_argument(
         "--branch-word",
         type=str,
@@ -604,19 +1173,81 @@ def main():
         default=[],
         help="Reference markdown file path to include in every issue body. Can be repeated.",
     )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=DEFAULT_WORKERS,
+        help=f"Maximum number of concurrent GitHub API workers for issue upserts (default: {DEFAULT_WORKERS}).",
+    )
+    parser.add_argument(
+        "--state-file",
+        type=str,
+        help=f"Sync state file recording per-week section hashes (default: {DEFAULT_STATE_FILE} next to --file).",
+    )
+    parser.add_argument(
+        "--full",
+        action="store_true",
+        help="Ignore the sync state and re-render and push every week.",
+    )
+    parser.add_argument(
+        "--close-deleted",
+        action="store_true",
+        help="Close issues for weeks that were removed from the task list since the last sync.",
+    )
 
-    args = parser.parse_args()
+    parser.add_argument(
+        "--plan",
+        nargs="?",
+        const=DEFAULT_PLAN_FILE,
+        metavar="PLANFILE",
+        help=f"Write the operations a sync would perform to PLANFILE (default: {DEFAULT_PLAN_FILE}) without changing anything.",
+    )
+    parser.add_argument(
+        "--apply",
+        metavar="PLANFILE",
+        help="Execute exactly the operations recorded in a plan written by --plan.",
+    )
 
-    phases = parse_markdown(
-        file_path=args.file,
-        detailed_issues=not args.simple_issues,
-        reference_docs=args.reference,
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="Keep running and re-sync whenever the task list or a --reference doc changes.",
     )
-    if not phases:
-        print("No phases found in the markdown file. Check format.")
+    parser.add_argument(
+        "--debounce",
+        type=float,
+        default=DEFAULT_DEBOUNCE,
+        help=f"Seconds of quiet after a change before a watch cycle syncs (default: {DEFAULT_DEBOUNCE:g}).",
+    )
+    parser.add_argument(
+        "--poll-interval",
+        type=float,
+        default=DEFAULT_POLL_INTERVAL,
+        help=f"Polling interval when inotify is unavailable (default: {DEFAULT_POLL_INTERVAL:g}).",
+    )
+    args = parser.parse_args()
+
+    if args.apply:
+        if args.plan:
+            parser.error("--plan and --apply cannot be combined")
+        apply_plan_file(args.apply, args.concurrency)
+        return
+    if not args.file or not args.repo:
+        parser.error("--file and --repo are required unless --apply is given")
+    if args.watch and args.plan:
+        parser.error("--watch cannot be combined with --plan")
+
+    state_path = args.state_file or default_state_path(args.file)
+    state = load_sync_state(state_path)
+    if args.watch:
+        watch_task_list(args, state, state_path)
         return
 
-    sync_to_github(phases, args.repo, args.branch_word)
+    try:
+        sync_once(args, state, state_path, full=args.full)
+    except RuntimeError as error:
+        print(f"Sync failed: {error}")
+        sys.exit(1)
 
 
 if __name__ == "__main__":
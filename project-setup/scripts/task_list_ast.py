@@ -0,0 +1,257 @@
+import re
+import sys
+from typing import Dict, Iterable, List, Optional
+
+PHASE_RE = re.compile(r"^##\s+.*?Phase\s+(\d+):\s+(.*)")
+WEEK_RE = re.compile(r"^###\s+Week\s+(\d+):\s+(.*)")
+H4_RE = re.compile(r"^####\s+(.+)$")
+BOLD_RE = re.compile(r"^\*\*(.+?)\*\*:?")
+NUMBERED_RE = re.compile(r"^\d+\.\d+")
+DOC_REF_RE = re.compile(r"docs/[A-Za-z0-9_./\-]+\.md")
+COMMAND_RE = re.compile(r"\bflutter analyze\b|\bflutter test\b|\bdart test\b")
+WHITESPACE_RE = re.compile(r"\s+")
+
+SECTION_KEYS = ("categories", "files", "dod", "verification", "risks", "misc")
+
+
+def normalized_heading(text: str) -> str:
+    return WHITESPACE_RE.sub(" ", text.strip().lower())
+
+
+def classify_heading(text: str) -> Optional[str]:
+    """Map a bold week heading to the section it opens, if any."""
+    heading = normalized_heading(text)
+    if "files likely touched" in heading or "likely touched" in heading or "관련 파일" in heading:
+        return "files"
+    if "definition of done" in heading or "완료 기준" in heading or "definition" in heading:
+        return "dod"
+    if "verification" in heading or "검증" in heading:
+        return "verification"
+    if "risk" in heading or "주의" in heading:
+        return "risks"
+    return None
+
+
+class WeekSectionParser:
+    """
+    Week body state machine fed one line at a time.
+
+    Besides the section lists consumed by the issue body builders, it collects
+    doc references, verification command lines, checklist items, and the
+    1-based source line of every section in the same pass.
+    """
+
+    def __init__(self):
+        self.sections: Dict[str, List] = {key: [] for key in SECTION_KEYS}
+        self.offsets: Dict[str, int] = {}
+        self.doc_refs: set = set()
+        self.commands: List[str] = []
+        self.checklist: List[str] = []
+        self.current_category: Optional[dict] = None
+        self.current_section = "misc"
+        self.in_code_block = False
+
+    def _open_category(self, title: str, line_number: int) -> None:
+        self.current_category = {"title": title, "line": line_number, "lines": []}
+        self.sections["categories"].append(self.current_category)
+        self.current_section = "category"
+
+    def feed(self, raw: str, line_number: int = 0) -> None:
+        stripped = raw.strip()
+        if not stripped:
+            if self.current_section == "verification":
+                self.sections["verification"].append("")
+            elif self.current_category is not None:
+                self.current_category["lines"].append("")
+            return
+
+        if "docs/" in stripped:
+            self.doc_refs.update(DOC_REF_RE.findall(stripped))
+        if COMMAND_RE.search(stripped) and stripped not in self.commands:
+            self.commands.append(stripped)
+        if stripped.startswith("- ["):
+            self.checklist.append(stripped)
+
+        if stripped.startswith("```"):
+            self.in_code_block = not self.in_code_block
+            if self.current_section == "verification":
+                self.sections["verification"].append(stripped)
+            elif self.current_category is not None:
+                self.current_category["lines"].append(stripped)
+            else:
+                self.sections["misc"].append(stripped)
+            return
+
+        if not self.in_code_block:
+            if stripped.startswith("####"):
+                h4_match = H4_RE.match(stripped)
+                if h4_match:
+                    self._open_category(h4_match.group(1).strip(), line_number)
+                    return
+
+            if stripped.startswith("**"):
+                bold_match = BOLD_RE.match(stripped)
+                if bold_match:
+                    section = classify_heading(bold_match.group(1))
+                    if section:
+                        self.current_section = section
+                        self.current_category = None
+                        self.offsets.setdefault(section, line_number)
+                        return
+
+                    # Convert numeric bold sections to categories (e.g., **1.1 ...**)
+                    title = bold_match.group(1).strip()
+                    if NUMBERED_RE.match(title):
+                        self._open_category(title, line_number)
+                        return
+
+        if self.current_section in ("files", "dod", "verification", "risks"):
+            self.sections[self.current_section].append(stripped)
+        elif self.current_category is not None:
+            self.current_category["lines"].append(stripped)
+        else:
+            self.sections["misc"].append(stripped)
+
+    def finish(self) -> Dict[str, object]:
+        sections = dict(self.sections)
+        sections["categories"] = [category for category in sections["categories"] if category["lines"]]
+        sections["offsets"] = self.offsets
+        return {
+            "sections": sections,
+            "doc_refs": sorted(self.doc_refs),
+            "commands": self.commands,
+            "checklist": self.checklist,
+        }
+
+
+def parse_week_lines(raw_lines: Iterable[str], first_line: int = 1) -> Dict[str, object]:
+    """Parse the body lines of a single week outside of a full task list."""
+    parser = WeekSectionParser()
+    for offset, raw in enumerate(raw_lines):
+        parser.feed(raw, first_line + offset)
+    return parser.finish()
+
+
+def _shift_lines(parsed: Dict[str, object], delta: int) -> Dict[str, object]:
+    """Copy a parsed week body with every recorded source line moved by `delta`."""
+    if not delta:
+        return parsed
+    sections = dict(parsed["sections"])
+    sections["categories"] = [{**category, "line": category["line"] + delta} for category in sections["categories"]]
+    sections["offsets"] = {key: line + delta for key, line in sections["offsets"].items()}
+    return {**parsed, "sections": sections}
+
+
+class WeekCache:
+    """
+    Parsed week bodies keyed by their raw text.
+
+    Passing the same cache to successive `parse_task_list` calls re-parses only
+    the weeks whose body changed; untouched weeks are reused with their line
+    offsets shifted. Entries not seen in the latest parse are dropped.
+    """
+
+    def __init__(self):
+        self.entries: Dict[str, tuple] = {}
+        self._next: Dict[str, tuple] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def parse(self, raw_lines: List[str], first_line: int) -> Dict[str, object]:
+        key = "\n".join(raw_lines)
+        cached = self.entries.get(key) or self._next.get(key)
+        if cached is None:
+            self.misses += 1
+            parsed = parse_week_lines(raw_lines, first_line)
+            self._next[key] = (first_line, parsed)
+            return parsed
+        self.hits += 1
+        self._next[key] = cached
+        cached_line, parsed = cached
+        return _shift_lines(parsed, first_line - cached_line)
+
+    def rotate(self) -> None:
+        self.entries, self._next = self._next, {}
+
+
+def parse_task_list(lines: Iterable[str], week_cache: Optional[WeekCache] = None) -> List[dict]:
+    """
+    Build the phase -> week -> section AST in a single pass over `lines`.
+
+    Phases are `{"number", "title", "line", "weeks"}`; weeks carry their raw
+    body lines, `line`/`end_line` source offsets, and the parsed `sections`,
+    `doc_refs`, `commands`, and `checklist` of their body. With a `week_cache`,
+    week bodies are parsed through the cache once each week is complete.
+    """
+    phases: List[dict] = []
+    current_phase: Optional[dict] = None
+    current_week: Optional[dict] = None
+    week_parser: Optional[WeekSectionParser] = None
+    line_number = 0
+
+    def close_week() -> None:
+        if current_week is None:
+            return
+        if week_parser is not None:
+            current_week.update(week_parser.finish())
+        else:
+            current_week.update(week_cache.parse(current_week["raw_lines"], current_week["line"] + 1))
+        current_week["end_line"] = line_number - 1
+
+    for line_number, raw_line in enumerate(lines, 1):
+        # Phase/week headings start with "##"; every other line skips both regexes.
+        if raw_line.lstrip().startswith("##"):
+            line = raw_line.strip()
+            phase_match = PHASE_RE.match(line)
+            if phase_match:
+                close_week()
+                phase_num = phase_match.group(1)
+                current_phase = {
+                    "number": phase_num,
+                    "title": f"Phase {phase_num}: {phase_match.group(2)}",
+                    "line": line_number,
+                    "weeks": [],
+                }
+                phases.append(current_phase)
+                current_week = None
+                week_parser = None
+                continue
+
+            week_match = WEEK_RE.match(line)
+            if week_match:
+                close_week()
+                current_week = None
+                week_parser = None
+                if current_phase is not None:
+                    week_num = week_match.group(1)
+                    current_week = {
+                        "number": week_num,
+                        "title": f"Week {week_num}: {week_match.group(2)}",
+                        "line": line_number,
+                        "raw_lines": [],
+                        "body": "",
+                    }
+                    current_phase["weeks"].append(current_week)
+                    week_parser = WeekSectionParser() if week_cache is None else None
+                continue
+
+        if current_week is not None:
+            raw = raw_line.rstrip("\n")
+            current_week["raw_lines"].append(raw)
+            if week_parser is not None:
+                week_parser.feed(raw, line_number)
+
+    line_number += 1
+    close_week()
+    if week_cache is not None:
+        week_cache.rotate()
+    return phases
+
+
+def parse_task_list_file(file_path: str, week_cache: Optional[WeekCache] = None) -> List[dict]:
+    try:
+        with open(file_path, "r", encoding="utf-8") as file:
+            return parse_task_list(file, week_cache)
+    except FileNotFoundError:
+        print(f"Error: File not found {file_path}")
+        sys.exit(1)
@@ -1,7 +1,8 @@
 import argparse
+import functools
+import importlib.util
 import os
 import re
-import subprocess
 import sys
 from typing import Dict, List, Optional, Tuple
 
@@ -10,14 +11,30 @@ DEFAULT_REPORT_FILE = "TASK_DEBUG.md"
 TASK_MARKER = "## Task Checklist"
 
 
-def run_command(command: str) -> Tuple[int, str, str]:
-    result = subprocess.run(
-        command,
-        shell=True,
-        capture_output=True,
-        text=True,
-    )
-    return result.returncode, result.stdout or "", result.stderr or ""
+@functools.lru_cache(maxsize=None)
+def verification():
+    """Load the streaming command runner from project-task-finish (shared when run in-process)."""
+    module = sys.modules.get("task_verification")
+    if module is not None:
+        return module
+    current_dir = os.path.dirname(os.path.abspath(__file__))
+    path = os.path.join(os.path.dirname(os.path.dirname(current_dir)), "project-task-finish", "scripts", "verification.py")
+    spec = importlib.util.spec_from_file_location("task_verification", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    sys.modules["task_verification"] = module
+    return module
+
+
+def run_command(command: str, tail_lines: int) -> Tuple[int, object]:
+    """
+    Run `command`, echoing its output live; returns (exit code, capture).
+    Only a bounded head and tail of the output stay in memory, the full log
+    is at `capture.log_path`.
+    """
+    runner = verification()
+    code, capture, _ = runner.stream_shell(command, echo_prefix="", tail_lines=max(tail_lines, runner.TAIL_LINES))
+    return code, capture
 
 
 def read_progress_file(path: str) -> Dict[str, object]:
@@ -96,13 +113,8 @@ def format_bullets(items: List[str], fallback: str) -> str:
     return "\n".join(f"- {item}" for item in items)
 
 
-def failure_excerpt(stdout: str, stderr: str, tail_lines: int) -> str:
-    combined = stderr.strip() or stdout.strip()
-    if not combined:
-        return "(no output captured)"
-
-    lines = combined.splitlines()
-    return "\n".join(lines[-tail_lines:])
+def failure_excerpt(capture, tail_lines: int) -> str:
+    return capture.tail_text(tail_lines) or "(no output captured)"
 
 
 def build_report(
@@ -110,8 +122,7 @@ def build_report(
     command: str,
     progress: Dict[str, object],
     code: int,
-    stdout: str,
-    stderr: str,
+    capture,
     tail_lines: int,
 ) -> str:
     title = progress_title(progress) or "Unknown task"
@@ -130,11 +141,12 @@ def build_report(
         f"- Issue: {title}",
         f"- Command: `{command}`",
         f"- Exit code: {code}",
+        f"- Full log: `{capture.log_path}` ({capture.lines} lines)",
         "",
         "## Failure Excerpt",
         "",
         "```",
-        failure_excerpt(stdout, stderr, tail_lines),
+        failure_excerpt(capture, tail_lines),
         "```",
         "",
         "## Current Code Reality",
@@ -163,8 +175,10 @@ def write_report(path: str, content: str) -> None:
         file.write(content)
 
 
-def debug_loop(args: argparse.Namespace) -> int:
-    progress = read_progress_file(args.progress_file)
+def debug_loop(args: argparse.Namespace, progress: Optional[Dict[str, object]] = None) -> int:
+    """Run the command, writing a debug report on failure; returns the final exit code."""
+    if progress is None:
+        progress = read_progress_file(args.progress_file)
     title = progress_title(progress)
     print(f"--- Project Task Debugger: `{args.command}` ---")
     if title:
@@ -174,24 +188,19 @@ def debug_loop(args: argparse.Namespace) -> int:
 
     for attempt in range(1, attempts + 1):
         print(f"\n[Attempt {attempt}/{attempts}] Running command...")
-        code, stdout, stderr = run_command(args.command)
+        code, capture = run_command(args.command, args.tail_lines)
 
         if code == 0:
             print("Command succeeded.")
             return 0
 
-        excerpt = failure_excerpt(stdout, stderr, args.tail_lines)
-        print(f"Command failed with exit code {code}.")
-        print("--- Failure Output ---")
-        print(excerpt)
-        print("----------------------")
+        print(f"Command failed with exit code {code}. Full log: {capture.log_path}")
 
         report = build_report(
             command=args.command,
             progress=progress,
             code=code,
-            stdout=stdout,
-            stderr=stderr,
+            capture=capture,
             tail_lines=args.tail_lines,
         )
         write_report(args.report_file, report)
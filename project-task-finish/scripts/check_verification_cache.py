@@ -0,0 +1,76 @@
+import importlib.util
+import os
+import subprocess
+import sys
+import tempfile
+
+GIT_IDENTITY = {
+    "GIT_AUTHOR_NAME": "check",
+    "GIT_AUTHOR_EMAIL": "check@example.com",
+    "GIT_COMMITTER_NAME": "check",
+    "GIT_COMMITTER_EMAIL": "check@example.com",
+}
+
+
+def load_verification():
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "verification.py")
+    spec = importlib.util.spec_from_file_location("task_verification", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def git(*args: str) -> str:
+    return subprocess.run(["git", *args], capture_output=True, text=True, check=True).stdout
+
+
+def object_count() -> str:
+    return git("count-objects", "-v")
+
+
+def main() -> None:
+    """
+    A pass stored before finish commits the change must be found afterwards,
+    the way review looks it up; an edit must miss; hashing writes no objects.
+    """
+    verification = load_verification()
+    failures = []
+    os.environ.update(GIT_IDENTITY)
+    with tempfile.TemporaryDirectory() as repo:
+        os.chdir(repo)
+        git("init", "-q")
+        with open("app.py", "w", encoding="utf-8") as file:
+            file.write("print('v1')\n")
+        git("add", "app.py")
+        git("commit", "-q", "-m", "init")
+
+        with open("app.py", "a", encoding="utf-8") as file:
+            file.write("print('v2')\n")
+        with open("new_module.py", "w", encoding="utf-8") as file:
+            file.write("VALUE = 1\n")
+        objects = object_count()
+        cache = verification.open_cache()
+        if object_count() != objects:
+            failures.append("hashing the working tree wrote objects")
+        cache.store([{"command": "make test", "status": "passed", "output": "ok"}])
+
+        git("add", ".")
+        git("commit", "-q", "-m", "finish")
+        if verification.open_cache().lookup("make test") is None:
+            failures.append("a pass stored before the commit missed after it")
+
+        with open("app.py", "a", encoding="utf-8") as file:
+            file.write("print('v3')\n")
+        if verification.open_cache().lookup("make test") is not None:
+            failures.append("a pass was reused after the file changed")
+        os.chdir("/")
+
+    for failure in failures:
+        print(f"FAIL {failure}")
+    if not failures:
+        print("ok   verification cache survives the finish commit")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,12 @@
 import argparse
+import functools
+import importlib.util
 import json
 import os
 import re
 import subprocess
 import sys
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional
 
 DEFAULT_PROGRESS_FILE = "TASK_PROGRESS.md"
 TASK_MARKER = "## Task Checklist"
@@ -37,16 +39,6 @@ def run_command(
         return None
 
 
-def run_shell_command(command: str) -> Tuple[bool, str]:
-    result = subprocess.run(command, shell=True, text=True, capture_output=True)
-    combined = "\n".join(
-        part.strip()
-        for part in [result.stdout or "", result.stderr or ""]
-        if part and part.strip()
-    ).strip()
-    return result.returncode == 0, combined
-
-
 def read_progress_file(path: str) -> Dict[str, object]:
     data: Dict[str, object] = {
         "sections": {},
@@ -132,18 +124,49 @@ def progress_source(progress: Dict[str, object]) -> Optional[str]:
     return None
 
 
+def skill_script_path(skill_name: str, script_name: str) -> str:
+    current_dir = os.path.dirname(os.path.abspath(__file__))
+    skills_root = os.path.dirname(os.path.dirname(current_dir))
+    return os.path.join(skills_root, skill_name, "scripts", script_name)
+
+
+@functools.lru_cache(maxsize=None)
+def github_index():
+    """
+    Load the shared paginated GraphQL loader from the project-setup skill.
+
+    The module is registered in `sys.modules`, so when the driver runs this
+    stage in-process both use the same client.
+    """
+    module = sys.modules.get("github_index")
+    if module is not None:
+        return module
+    spec = importlib.util.spec_from_file_location("github_index", skill_script_path("project-setup", "github_index.py"))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    sys.modules["github_index"] = module
+    return module
+
+
+@functools.lru_cache(maxsize=None)
+def issue_metadata(issue_num: int) -> Dict[str, object]:
+    """Fetch title and milestone of the issue once per run."""
+    try:
+        return github_index().issue_by_number(None, issue_num) or {}
+    except RuntimeError as error:
+        print(f"Warning: could not fetch issue #{issue_num}: {error}")
+        return {}
+
+
 def check_existing_pr() -> Optional[Dict[str, object]]:
     current_branch = run_command(["git", "branch", "--show-current"])
     print(f"Checking for existing PR on {current_branch}...")
 
-    output = run_command(
-        ["gh", "pr", "list", "--head", current_branch, "--json", "url,number,state"],
-        check=False,
-    )
-    if not output:
+    try:
+        prs = github_index().pull_requests_for_head(None, current_branch, states=["OPEN"])
+    except RuntimeError as error:
+        print(f"Warning: could not list PRs for {current_branch}: {error}")
         return None
-
-    prs = json.loads(output)
     if not prs:
         return None
 
@@ -154,10 +177,7 @@ def check_existing_pr() -> Optional[Dict[str, object]]:
 
 
 def detect_base_branch(issue_num: int) -> str:
-    milestone = run_command(
-        ["gh", "issue", "view", str(issue_num), "--json", "milestone", "--jq", ".milestone.title"],
-        check=False,
-    )
+    milestone = (issue_metadata(issue_num).get("milestone") or {}).get("title")
     if milestone:
         match = re.search(r"Phase\s+(\d+)", milestone, re.IGNORECASE)
         if match:
@@ -188,51 +208,126 @@ def commit_summary(target_ref: str) -> str:
 
 
 def debugger_script_path() -> str:
-    current_dir = os.path.dirname(os.path.abspath(__file__))
-    skills_root = os.path.dirname(os.path.dirname(current_dir))
-    return os.path.join(skills_root, "project-task-debugger", "scripts", "debug.py")
+    return skill_script_path("project-task-debugger", "debug.py")
 
 
-def run_debugger(command: str) -> bool:
+@functools.lru_cache(maxsize=None)
+def debugger_module():
+    spec = importlib.util.spec_from_file_location("task_debugger", debugger_script_path())
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def run_debugger(command: str, progress: Optional[Dict[str, object]] = None) -> bool:
     script = debugger_script_path()
     if not os.path.exists(script):
         print(f"Debugger script not found at {script}.")
         return False
 
-    result = subprocess.run(["python3", script, "--command", command], check=False)
-    return result.returncode == 0
+    if progress is None:
+        result = subprocess.run(["python3", script, "--command", command], check=False)
+        return result.returncode == 0
+
+    debugger = debugger_module()
+    return debugger.debug_loop(debugger.build_parser().parse_args(["--command", command]), progress) == 0
+
+
+@functools.lru_cache(maxsize=None)
+def verification():
+    """
+    Load the verification runner (`verification.py` next to this script).
+
+    It is registered in `sys.modules` so project-task-review and an in-process
+    driver share one copy.
+    """
+    module = sys.modules.get("task_verification")
+    if module is not None:
+        return module
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "verification.py")
+    spec = importlib.util.spec_from_file_location("task_verification", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    sys.modules["task_verification"] = module
+    return module
 
 
 def run_verifications(
     commands: List[str],
     *,
     use_debugger: bool = False,
+    progress: Optional[Dict[str, object]] = None,
+    jobs: Optional[int] = None,
+    fail_fast: bool = True,
+    use_cache: bool = False,
+    limits: Optional[Dict[str, float]] = None,
+    impact=None,
+    select_tests: bool = False,
 ) -> List[Dict[str, str]]:
-    results: List[Dict[str, str]] = []
-    for command in commands:
-        print(f"Running verification: {command}")
-        ok, output = run_shell_command(command)
-        status = "passed" if ok else "failed"
-
-        if not ok and use_debugger:
-            print(f"Verification failed. Trying debugger for: {command}")
-            debug_ok = run_debugger(command)
-            if debug_ok:
-                ok, output = run_shell_command(command)
-                status = "passed" if ok else "failed"
-
-        results.append(
-            {
-                "command": command,
-                "status": status,
-                "output": output,
-            }
+    """
+    Run verification commands as a dependency DAG (see `verification.run_plan`).
+    With `use_cache`, commands that already passed on the current working
+    tree are not run again. `limits` are the default timeout/mem/cpu limits.
+    With an `impact` session, test commands run only the affected targets when
+    `select_tests` is set, and the results feed its learned mapping.
+
+    With `use_debugger`, each failed command gets one debugger pass; when it
+    succeeds the plan runs again, reusing the results that already passed.
+    Raises ValueError for an invalid plan.
+    """
+    runner = verification()
+    steps = runner.parse_plan(commands)
+    jobs = jobs or runner.default_jobs(steps)
+    cache = runner.open_cache() if use_cache and steps else None
+    selected: Dict[int, Dict[str, str]] = {}
+    if impact is not None and select_tests:
+        # A full-suite pass already cached for this tree beats a selected run.
+        steps, selected = impact.select(steps, lambda command: cache is not None and cache.lookup(command) is not None)
+    results = runner.run_plan(steps, jobs=jobs, fail_fast=fail_fast, previous=selected, cache=cache, limits=limits)
+
+    debugged = set()
+    while use_debugger:
+        failed = next(
+            (index for index, item in enumerate(results) if item["status"] == "failed" and index not in debugged),
+            None,
         )
-        if not ok:
+        if failed is None:
+            break
+        debugged.add(failed)
+        command = results[failed]["command"]
+        print(f"Verification failed. Trying debugger for: {command}")
+        if not run_debugger(command, progress):
             break
+        previous = {**selected, **{index: item for index, item in enumerate(results) if item["status"] == "passed"}}
+        # The debugger may have changed files; the cache is re-keyed to the tree it left behind.
+        cache = runner.open_cache() if use_cache else None
+        results = runner.run_plan(
+            steps,
+            jobs=jobs,
+            fail_fast=fail_fast,
+            previous=previous,
+            cache=cache,
+            limits=limits,
+        )
+    if impact is not None:
+        impact.record(results)
     return results
 
 
+@functools.lru_cache(maxsize=None)
+def test_impact():
+    """Load the change-aware test selection (`test_impact.py` next to this script), shared with project-task-review."""
+    module = sys.modules.get("task_test_impact")
+    if module is not None:
+        return module
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "test_impact.py")
+    spec = importlib.util.spec_from_file_location("task_test_impact", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    sys.modules["task_test_impact"] = module
+    return module
+
+
 def format_bullets(items: List[str], fallback: str) -> str:
     if not items:
         return f"- {fallback}"
@@ -242,7 +337,7 @@ def format_bullets(items: List[str], fallback: str) -> str:
 def format_verification_results(results: List[Dict[str, str]], planned: List[str]) -> str:
     if results:
         return "\n".join(
-            f"- `{item['command']}`: {item['status']}"
+            f"- `{item['command']}`: {verification().status_label(item)}"
             for item in results
         )
     if planned:
@@ -292,20 +387,20 @@ def build_pr_body(
     return "\n".join(parts)
 
 
-def ensure_clean_completion(progress: Dict[str, object], allow_incomplete: bool, draft: bool) -> None:
+def ensure_clean_completion(progress: Dict[str, object], allow_incomplete: bool, draft: bool) -> bool:
     remaining = incomplete_tasks(progress)
     if not remaining:
-        return
+        return True
 
     print("Incomplete tasks detected in TASK_PROGRESS.md:")
     for task in remaining:
         print(f"- {task}")
 
     if allow_incomplete or draft:
-        return
+        return True
 
     print("Refusing to finish a non-draft PR while tracked tasks remain incomplete.")
-    sys.exit(1)
+    return False
 
 
 def stage_and_commit(issue_num: int, progress: Dict[str, object]) -> None:
@@ -371,10 +466,7 @@ def create_or_update_pr(
 
 
 def issue_title(issue_num: int, progress: Dict[str, object]) -> str:
-    title = run_command(
-        ["gh", "issue", "view", str(issue_num), "--json", "title", "--jq", ".title"],
-        check=False,
-    )
+    title = issue_metadata(issue_num).get("title")
     if title:
         return title
 
@@ -399,9 +491,18 @@ def comment_on_issue(issue_num: int, pr_url: str, verification_results: List[Dic
     run_command(["gh", "issue", "edit", str(issue_num), "--remove-label", "in-progress"], check=False)
 
 
-def finish_task(args: argparse.Namespace) -> None:
-    progress = read_progress_file(args.progress_file)
-    ensure_clean_completion(progress, args.allow_incomplete, args.draft)
+def finish_task(args: argparse.Namespace, progress: Optional[Dict[str, object]] = None) -> Dict[str, object]:
+    """
+    Verify, commit, push, and open or update the PR for `args.issue`.
+
+    Returns `{"status", "verification_results", ...}` where status is
+    "finished" (with `pr_url` and `base_branch`), "dry_run", "incomplete", or
+    "verification_failed". git/gh failures exit like the CLI does.
+    """
+    if progress is None:
+        progress = read_progress_file(args.progress_file)
+    if not ensure_clean_completion(progress, args.allow_incomplete, args.draft):
+        return {"status": "incomplete", "incomplete_tasks": incomplete_tasks(progress), "verification_results": []}
 
     verification_commands = list(args.verification_cmd or [])
     if args.use_progress_verification:
@@ -410,14 +511,32 @@ def finish_task(args: argparse.Namespace) -> None:
     if args.test_cmd:
         verification_commands = list(args.test_cmd) + verification_commands
 
-    verification_results = run_verifications(
-        verification_commands,
-        use_debugger=args.use_debugger,
-    )
+    try:
+        limits = verification().parse_limits(args.verification_timeout, args.verification_mem, args.verification_cpu)
+        impact = None
+        if args.test_impact:
+            config = test_impact().load_config(args.test_impact_config)
+            impact = test_impact().ImpactSession(config, resolve_target_ref(detect_base_branch(args.issue)))
+            if not (args.draft or args.dry_run):
+                print("Test impact: final finish, running the full test suite.")
+        verification_results = run_verifications(
+            verification_commands,
+            use_debugger=args.use_debugger,
+            progress=progress,
+            jobs=args.verification_jobs,
+            fail_fast=not args.no_fail_fast,
+            use_cache=not args.no_verification_cache,
+            limits=limits,
+            impact=impact,
+            select_tests=args.draft or args.dry_run,
+        )
+    except (OSError, ValueError) as error:
+        print(f"Invalid verification plan: {error}")
+        return {"status": "verification_failed", "error": str(error), "verification_results": []}
 
-    if verification_results and verification_results[-1]["status"] == "failed" and not args.draft:
+    if any(item["status"] not in verification().PASSING_STATUSES for item in verification_results) and not args.draft:
         print("Verification failed. Aborting finish.")
-        sys.exit(1)
+        return {"status": "verification_failed", "verification_results": verification_results}
 
     if args.dry_run:
         title = progress_title(progress) or f"Issue #{args.issue}"
@@ -432,7 +551,7 @@ def finish_task(args: argparse.Namespace) -> None:
         print(title)
         print("\n--- DRY RUN PR BODY ---")
         print(body)
-        return
+        return {"status": "dry_run", "title": title, "body": body, "verification_results": verification_results}
 
     stage_and_commit(args.issue, progress)
 
@@ -454,6 +573,13 @@ def finish_task(args: argparse.Namespace) -> None:
         draft=args.draft,
     )
     comment_on_issue(args.issue, pr_url, verification_results, verification_commands)
+    return {
+        "status": "finished",
+        "pr_url": pr_url,
+        "branch": current_branch,
+        "base_branch": base_branch,
+        "verification_results": verification_results,
+    }
 
 
 def build_parser() -> argparse.ArgumentParser:
@@ -481,6 +607,46 @@ def build_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Run commands listed in the progress file Verification section.",
     )
+    parser.add_argument(
+        "--verification-jobs",
+        type=int,
+        help="Verification commands run at once; `[needs=...]` and `[group=...]` annotations order them "
+        "(default: one at a time, or one per CPU when any command is annotated).",
+    )
+    parser.add_argument(
+        "--no-fail-fast",
+        action="store_true",
+        help="Keep running independent verification commands after one fails instead of cancelling them.",
+    )
+    parser.add_argument(
+        "--verification-timeout",
+        default=f"{int(verification().DEFAULT_TIMEOUT)}s",
+        help="Wall-clock limit per verification command, e.g. 900, 15m, 2h; 0 disables it (default: %(default)s). "
+        "An entry's own `[timeout=...]` annotation wins.",
+    )
+    parser.add_argument(
+        "--verification-mem",
+        help="Resident memory cap per verification command's process group, e.g. 4G (default: none).",
+    )
+    parser.add_argument(
+        "--verification-cpu",
+        help="CPU-time limit per process of a verification command, e.g. 20m (default: none).",
+    )
+    parser.add_argument(
+        "--test-impact",
+        action="store_true",
+        help="On draft and dry-run finishes, run test commands only for targets affected by the branch's changes. "
+        "A final (non-draft) finish always runs the full suite.",
+    )
+    parser.add_argument(
+        "--test-impact-config",
+        help="Test-impact rules file (default: .test-impact.json at the repository root, if present).",
+    )
+    parser.add_argument(
+        "--no-verification-cache",
+        action="store_true",
+        help="Run every verification command even if it already passed on the same working tree.",
+    )
     parser.add_argument(
         "--use-debugger",
         action="store_true",
@@ -507,7 +673,9 @@ def build_parser() -> argparse.ArgumentParser:
 def main() -> None:
     parser = build_parser()
     args = parser.parse_args()
-    finish_task(args)
+    result = finish_task(args)
+    if result["status"] in ("incomplete", "verification_failed"):
+        sys.exit(1)
 
 
 if __name__ == "__main__":
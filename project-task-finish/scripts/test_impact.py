@@ -0,0 +1,343 @@
+import fnmatch
+import json
+import os
+import posixpath
+import re
+import shlex
+import subprocess
+import sys
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+DEFAULT_CONFIG_FILE = ".test-impact.json"
+# Learned source -> test associations, kept next to the verification cache in the common git dir.
+MAP_FILE = "test-impact-map.json"
+FULL_SUITE = "*"
+# `cd DIR && ` at the start of a verification command; the rest runs in DIR.
+CD_PREFIX = re.compile(r"""^\s*cd\s+('[^']*'|"[^"]*"|[^\s;&|]+)\s*&&\s*""")
+DEFAULT_CONFIG: Dict[str, object] = {
+    # Which files are tests. A changed test file always selects itself.
+    "test_patterns": ["test/**", "tests/**", "**/*_test.*", "**/test_*.py", "**/*.test.*", "**/*.spec.*"],
+    # {"paths": [globs], "tests": [test files, directories, or globs; "*" for the full suite]}
+    "rules": [],
+    # Verification commands that can take test targets, and how to pass them.
+    "commands": {
+        "flutter test": "flutter test {targets}",
+        "dart test": "dart test {targets}",
+        "pytest": "pytest {targets}",
+        "python -m pytest": "python -m pytest {targets}",
+        "python3 -m pytest": "python3 -m pytest {targets}",
+        "npx jest": "npx jest {targets}",
+    },
+    # What a changed file that no rule, learned mapping, or naming convention covers selects: "full" or "none".
+    "unmapped": "full",
+}
+
+
+def _git(args: List[str]) -> Optional[str]:
+    result = subprocess.run(["git", *args], capture_output=True, text=True)
+    return result.stdout if result.returncode == 0 else None
+
+
+def _lines(output: Optional[str]) -> List[str]:
+    return [line.strip() for line in (output or "").splitlines() if line.strip()]
+
+
+def load_config(path: Optional[str] = None) -> Dict[str, object]:
+    """
+    Read the test-impact config (default: `.test-impact.json` at the repository
+    root, optional) over DEFAULT_CONFIG; raises ValueError on invalid settings.
+    """
+    config = {**DEFAULT_CONFIG, "commands": dict(DEFAULT_CONFIG["commands"])}
+    if path is None:
+        root = (_git(["rev-parse", "--show-toplevel"]) or "").strip()
+        path = os.path.join(root, DEFAULT_CONFIG_FILE) if root else DEFAULT_CONFIG_FILE
+        if not os.path.exists(path):
+            return config
+    with open(path, "r", encoding="utf-8") as file:
+        data = json.load(file)
+    unknown = set(data) - set(DEFAULT_CONFIG)
+    if unknown:
+        raise ValueError(f"unknown test-impact settings: {', '.join(sorted(unknown))}")
+    commands = data.pop("commands", {})
+    config.update(data)
+    config["commands"].update(commands)
+    if config["unmapped"] not in ("full", "none"):
+        raise ValueError("unmapped must be 'full' or 'none'")
+    for command, template in config["commands"].items():
+        if "{targets}" not in template:
+            raise ValueError(f"command template for `{command}` has no {{targets}} placeholder")
+    for rule in config["rules"]:
+        if not isinstance(rule, dict) or not rule.get("paths") or "tests" not in rule:
+            raise ValueError("every rule needs 'paths' and 'tests'")
+    return config
+
+
+def matches(path: str, pattern: str) -> bool:
+    """fnmatch where `*` crosses directories and a leading `**/` also matches at the root."""
+    return fnmatch.fnmatch(path, pattern) or (pattern.startswith("**/") and fnmatch.fnmatch(path, pattern[3:]))
+
+
+def changed_files(base_ref: Optional[str]) -> List[str]:
+    """Paths changed on the branch since `base_ref`, plus uncommitted and untracked files."""
+    paths: List[str] = []
+    if base_ref:
+        paths.extend(_lines(_git(["diff", "--name-only", f"{base_ref}...HEAD"])))
+    paths.extend(_lines(_git(["diff", "--name-only", "HEAD"])))
+    paths.extend(_lines(_git(["ls-files", "--others", "--exclude-standard", "--full-name"])))
+    return list(dict.fromkeys(paths))
+
+
+def test_files(config: Dict[str, object]) -> List[str]:
+    """Tracked and untracked files of the repository that match `test_patterns`."""
+    root = (_git(["rev-parse", "--show-toplevel"]) or "").strip()
+    listing = _lines(_git(["-C", root or ".", "ls-files", "--cached", "--others", "--exclude-standard"]))
+    return [path for path in listing if is_test(path, config)]
+
+
+def is_test(path: str, config: Dict[str, object]) -> bool:
+    return any(matches(path, pattern) for pattern in config["test_patterns"])
+
+
+def convention_tests(path: str, tests: List[str]) -> List[str]:
+    """Tests named after a source file: `foo_test.*`, `test_foo.*`, `foo.test.*`, `foo.spec.*`."""
+    stem = os.path.splitext(os.path.basename(path))[0]
+    names = re.compile(rf"^(?:{re.escape(stem)}_test|test_{re.escape(stem)}|{re.escape(stem)}\.(?:test|spec))\.")
+    return [test for test in tests if names.match(os.path.basename(test))]
+
+
+class ImpactMap:
+    """Source file -> {test target: times seen together}, learned from earlier runs."""
+
+    def __init__(self, path: Optional[str]):
+        self.path = path
+        self.links: Dict[str, Dict[str, int]] = {}
+        if path and os.path.exists(path):
+            try:
+                with open(path, "r", encoding="utf-8") as file:
+                    self.links = json.load(file)
+            except (OSError, ValueError):
+                self.links = {}
+
+    def tests_for(self, path: str) -> List[str]:
+        return sorted(self.links.get(path, {}))
+
+    def learn(self, sources: List[str], tests: List[str]) -> None:
+        for source in sources:
+            known = self.links.setdefault(source, {})
+            for test in tests:
+                known[test] = known.get(test, 0) + 1
+
+    def save(self) -> None:
+        if not self.path:
+            return
+        scratch = f"{self.path}.{os.getpid()}.tmp"
+        with open(scratch, "w", encoding="utf-8") as file:
+            json.dump(self.links, file, sort_keys=True)
+        os.replace(scratch, self.path)
+
+
+def open_map() -> ImpactMap:
+    common_dir = (_git(["rev-parse", "--path-format=absolute", "--git-common-dir"]) or "").strip()
+    return ImpactMap(os.path.join(common_dir, MAP_FILE) if common_dir else None)
+
+
+def split_workdir(command: str) -> Tuple[str, str, str]:
+    """
+    Split leading `cd DIR &&` steps off `command`: returns (the prefix as
+    written, the directory they lead to, the remaining command).
+    """
+    prefix, directory, rest = "", "", command
+    match = CD_PREFIX.match(rest)
+    while match:
+        prefix += match.group(0)
+        directory = posixpath.join(directory, shlex.split(match.group(1))[0])
+        rest = rest[match.end():]
+        match = CD_PREFIX.match(rest)
+    return prefix, directory, rest
+
+
+def command_directory(cwd: str, workdir: str) -> Optional[str]:
+    """
+    The repository-relative directory a command runs in ("" for the root),
+    from the process's `cwd` prefix and the command's own `cd`; None when
+    that is outside the repository.
+    """
+    if posixpath.isabs(workdir):
+        return None
+    directory = posixpath.normpath(posixpath.join(cwd, workdir))
+    if directory == ".." or directory.startswith("../"):
+        return None
+    return "" if directory == "." else directory
+
+
+def relative_targets(targets: List[str], directory: str) -> List[str]:
+    """Root-relative `targets` inside `directory`, rewritten relative to it; others are dropped."""
+    if not directory:
+        return list(targets)
+    return [
+        posixpath.relpath(target, directory)
+        for target in targets
+        if target == directory or target.startswith(f"{directory}/")
+    ]
+
+
+def looks_like_tests(command: str, config: Dict[str, object]) -> bool:
+    """Whether `command` runs one of the configured test commands with other arguments."""
+    return any(re.search(rf"(?:^|\s){re.escape(name)}(?:\s|$)", command) for name in config["commands"])
+
+
+def select_targets(
+    changed: List[str],
+    config: Dict[str, object],
+    impact_map: ImpactMap,
+    tests: List[str],
+) -> Tuple[Optional[List[str]], List[str]]:
+    """
+    Test targets affected by `changed`, or None for the full suite, plus
+    explanation lines. Per file, in order: a changed test selects itself, then
+    the first matching path rule, then learned mappings and naming
+    conventions; a file nothing covers follows `unmapped`.
+    """
+    targets: Set[str] = set()
+    notes: List[str] = []
+    existing = set(tests)
+    for path in changed:
+        if is_test(path, config):
+            if path in existing:
+                targets.add(path)
+            continue
+        rule = next((rule for rule in config["rules"] if any(matches(path, glob) for glob in rule["paths"])), None)
+        if rule is not None:
+            if FULL_SUITE in rule["tests"]:
+                notes.append(f"{path}: rule selects the full suite")
+                return None, notes
+            for test in rule["tests"]:
+                expanded = [name for name in tests if matches(name, test)] if any(char in test for char in "*?[") else [test]
+                targets.update(expanded)
+            continue
+        related = [test for test in impact_map.tests_for(path) if test in existing] + convention_tests(path, tests)
+        if related:
+            targets.update(related)
+        elif config["unmapped"] == "full":
+            notes.append(f"{path}: no rule, learned mapping, or matching test name; running the full suite")
+            return None, notes
+    return sorted(targets), notes
+
+
+def select_plan(
+    steps: List[Dict[str, object]],
+    targets: Optional[List[str]],
+    config: Dict[str, object],
+    keep_full: Optional[Callable[[str], bool]] = None,
+    cwd: str = "",
+) -> Tuple[List[Dict[str, object]], Dict[int, Dict[str, str]], List[str]]:
+    """
+    Rewrite the steps whose command takes test targets to run only `targets`.
+    Steps with nothing affected are returned as "unaffected" results (by
+    position) so they are not run; None keeps every step as the full suite,
+    and so does `keep_full(command)` (for example a cached full-suite pass).
+
+    Targets are relative to the repository root and are passed relative to
+    the directory each command runs in: the process's `cwd` prefix plus any
+    leading `cd DIR &&`. Targets outside that directory are not part of the
+    command's suite and are dropped. Also returns a note for every test
+    command that still runs in full.
+    """
+    if targets is None:
+        return steps, {}, []
+    selected: List[Dict[str, object]] = []
+    previous: Dict[int, Dict[str, str]] = {}
+    notes: List[str] = []
+    for index, step in enumerate(steps):
+        full_command = str(step["command"])
+        cd_prefix, workdir, command = split_workdir(full_command)
+        template = config["commands"].get(command)
+        if template is None:
+            if looks_like_tests(command, config):
+                notes.append(f"`{full_command}` matches no entry under `commands`; running it in full")
+            selected.append(step)
+            continue
+        if keep_full is not None and keep_full(full_command):
+            notes.append(f"`{full_command}`: reusing the cached full-suite pass")
+            selected.append(step)
+            continue
+        directory = command_directory(cwd, workdir)
+        if directory is None:
+            notes.append(f"`{full_command}` runs outside the repository; running it in full")
+            selected.append(step)
+            continue
+        local = relative_targets(targets, directory)
+        if not local:
+            previous[index] = {
+                "command": full_command,
+                "status": "unaffected",
+                "output": "No affected test targets; not run by test-impact selection.",
+            }
+            selected.append(step)
+            continue
+        command = cd_prefix + template.format(targets=" ".join(shlex.quote(target) for target in local))
+        selected.append({**step, "command": command, "full_command": full_command})
+    return selected, previous, notes
+
+
+def learn(
+    impact_map: ImpactMap,
+    changed: List[str],
+    config: Dict[str, object],
+    tests: List[str],
+    results: List[Dict[str, str]],
+    cwd: str = "",
+) -> None:
+    """
+    Record which tests belong to the changed sources: tests changed on the
+    same branch, and tests named in the output of a failed full-suite run
+    (by their path relative to the directory the command ran in).
+    """
+    sources = [
+        path
+        for path in changed
+        if not is_test(path, config) and not any(matches(path, glob) for rule in config["rules"] for glob in rule["paths"])
+    ]
+    if not sources:
+        return
+    related = {path for path in changed if is_test(path, config)}
+    for item in results:
+        _, workdir, command = split_workdir(item["command"])
+        directory = command_directory(cwd, workdir)
+        if item["status"] not in ("failed", "timeout", "oom") or command not in config["commands"] or directory is None:
+            continue
+        output = item.get("output", "")
+        related.update(test for test in tests if any(name in output for name in relative_targets([test], directory)))
+    if related:
+        impact_map.learn(sources, sorted(related))
+        impact_map.save()
+
+
+class ImpactSession:
+    """Changed files, test files, and the learned map for one finish or review run."""
+
+    def __init__(self, config: Dict[str, object], base_ref: Optional[str]):
+        self.config = config
+        self.changed = changed_files(base_ref)
+        self.tests = test_files(config)
+        self.map = open_map()
+        # Where finish/review was started, relative to the repository root; commands run from there.
+        self.cwd = (_git(["rev-parse", "--show-prefix"]) or "").strip().rstrip("/")
+
+    def select(
+        self,
+        steps: List[Dict[str, object]],
+        keep_full: Optional[Callable[[str], bool]] = None,
+    ) -> Tuple[List[Dict[str, object]], Dict[int, Dict[str, str]]]:
+        targets, notes = select_targets(self.changed, self.config, self.map, self.tests)
+        for note in notes:
+            print(f"Test impact: {note}", file=sys.stderr)
+        if targets is not None:
+            print(f"Test impact: {len(self.changed)} changed file(s) -> {len(targets)} test target(s).", file=sys.stderr)
+        steps, previous, notes = select_plan(steps, targets, self.config, keep_full, self.cwd)
+        for note in notes:
+            print(f"Test impact: {note}", file=sys.stderr)
+        return steps, previous
+
+    def record(self, results: List[Dict[str, str]]) -> None:
+        learn(self.map, self.changed, self.config, self.tests, results, self.cwd)
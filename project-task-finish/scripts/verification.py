@@ -0,0 +1,570 @@
+import hashlib
+import json
+import os
+import re
+import signal
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Callable, Deque, Dict, List, Optional, Set, Tuple
+
+# Trailing annotation on a verification command:
+# `flutter test [id=test needs=analyze,codegen group=flutter timeout=20m mem=4G cpu=15m]`.
+ANNOTATION_RE = re.compile(r"\s*\[((?:\s*(?:id|needs|group|timeout|mem|cpu)=[^\]\s]*)+)\s*\]\s*$")
+LIMIT_KEYS = ("timeout", "mem", "cpu")
+DURATION_UNITS = {"": 1, "s": 1, "m": 60, "h": 3600}
+SIZE_UNITS = {"": 1, "k": 1024, "m": 1024**2, "g": 1024**3}
+# Wall-clock limit for commands that set none, so a hung command cannot block forever.
+DEFAULT_TIMEOUT = 3600.0
+# Seconds between SIGTERM and SIGKILL when a command's process group is stopped.
+KILL_GRACE = 5.0
+CANCEL_POLL_INTERVAL = 0.2
+# Output kept in memory per command; everything else is only in its log file.
+HEAD_LINES = 20
+TAIL_LINES = 200
+# Longest line read at once; longer lines are split so memory stays bounded.
+LINE_LIMIT = 64 * 1024
+LOG_DIR = os.path.join(tempfile.gettempdir(), "task-verification-logs")
+# Passed results kept in <git common dir>/verification-cache.json, newest first.
+CACHE_FILE = "verification-cache.json"
+CACHE_ENTRIES = 200
+# Statuses that count as success. "unaffected" marks a test command that
+# test-impact selection had nothing to run for; it was not run.
+PASSING_STATUSES = ("passed", "unaffected")
+# Variables that differ between shells without changing what a command does.
+VOLATILE_ENV = {"PWD", "OLDPWD", "SHLVL", "_", "TERM_SESSION_ID", "WINDOWID", "SSH_AUTH_SOCK", "SSH_AGENT_PID"}
+
+Runner = Callable[[str, threading.Event, str, Dict[str, float]], Dict[str, object]]
+_log_sequence = iter(range(1, sys.maxsize))
+
+
+def annotated(step: Dict[str, object]) -> bool:
+    """True when a step declares an `id`, `needs`, or `group` ordering annotation."""
+    return bool(step["needs"] or step["group"] or step["id"] != step["command"])
+
+
+def default_jobs(steps: List[Dict[str, object]]) -> int:
+    """
+    Verification commands run at once by default. Plain lists often rely on
+    their order (`flutter pub get` before `flutter test`), so they run one at a
+    time; a plan with ordering annotations opts in to one job per CPU.
+    """
+    if not any(annotated(step) for step in steps):
+        return 1
+    return max(1, os.cpu_count() or 1)
+
+
+def parse_duration(value: str) -> float:
+    """Seconds from `90`, `90s`, `15m`, or `2h`; raises ValueError."""
+    match = re.fullmatch(r"(\d+(?:\.\d+)?)([smh]?)", value.strip().lower())
+    if not match:
+        raise ValueError(f"invalid duration: {value!r}")
+    return float(match.group(1)) * DURATION_UNITS[match.group(2)]
+
+
+def parse_size(value: str) -> float:
+    """Bytes from `1073741824`, `512M`, or `4G`; raises ValueError."""
+    match = re.fullmatch(r"(\d+(?:\.\d+)?)([kmg]?)b?", value.strip().lower())
+    if not match:
+        raise ValueError(f"invalid size: {value!r}")
+    return float(match.group(1)) * SIZE_UNITS[match.group(2)]
+
+
+def parse_limits(timeout: Optional[str] = None, mem: Optional[str] = None, cpu: Optional[str] = None) -> Dict[str, float]:
+    """Limits dict (`timeout`/`cpu` in seconds, `mem` in bytes) for the values that are set and non-zero."""
+    limits: Dict[str, float] = {}
+    if timeout:
+        limits["timeout"] = parse_duration(timeout)
+    if mem:
+        limits["mem"] = parse_size(mem)
+    if cpu:
+        limits["cpu"] = parse_duration(cpu)
+    return {key: value for key, value in limits.items() if value > 0}
+
+
+def parse_verification(entry: str) -> Dict[str, object]:
+    """
+    Split a verification entry into its command and optional annotation.
+
+    `id` names the step (default: the command itself), `needs` lists the ids
+    that must pass first, and steps sharing a `group` never run at the same
+    time. `timeout` (wall clock), `mem` (resident memory of the whole process
+    group), and `cpu` (CPU time per process) limit the command; `0` lifts a
+    default limit. Raises ValueError for malformed limits.
+    """
+    step: Dict[str, object] = {"command": entry.strip(), "id": None, "needs": [], "group": None, "label": None, "limits": {}}
+    match = ANNOTATION_RE.search(entry)
+    if match:
+        step["command"] = entry[: match.start()].strip()
+        limits: Dict[str, str] = {}
+        for pair in match.group(1).split():
+            key, _, value = pair.partition("=")
+            if key == "needs":
+                step["needs"] = [need for need in value.split(",") if need]
+            elif key in LIMIT_KEYS:
+                limits[key] = value
+            else:
+                step[key] = value or None
+        # Keep explicit zeros so they can override defaults in run_plan.
+        step["limits"] = {key: 0.0 for key, value in limits.items() if value.strip() in ("0", "0s")}
+        step["limits"].update(parse_limits(**limits))
+    step["label"] = step["id"]
+    step["id"] = step["id"] or step["command"]
+    return step
+
+
+def parse_plan(entries: List[str]) -> List[Dict[str, object]]:
+    """Parse entries in declaration order; raises ValueError for unknown or circular `needs`."""
+    steps = [parse_verification(entry) for entry in entries]
+    for position, step in enumerate(steps, 1):
+        step["label"] = step["label"] or str(position)
+    ids = {str(step["id"]) for step in steps}
+    for step in steps:
+        unknown = [need for need in step["needs"] if need not in ids]
+        if unknown:
+            raise ValueError(f"`{step['command']}` needs unknown verification id(s): {', '.join(unknown)}")
+
+    resolved: Set[str] = set()
+    remaining = list(steps)
+    while remaining:
+        ready = [step for step in remaining if set(step["needs"]) <= resolved]
+        if not ready:
+            raise ValueError("circular verification dependencies: " + ", ".join(str(step["id"]) for step in remaining))
+        resolved.update(str(step["id"]) for step in ready)
+        remaining = [step for step in remaining if step not in ready]
+    return steps
+
+
+def _git(args: List[str], env: Optional[Dict[str, str]] = None) -> Optional[str]:
+    result = subprocess.run(["git", *args], capture_output=True, text=True, env=env)
+    return result.stdout.strip() if result.returncode == 0 else None
+
+
+def _git_lines(args: List[str], root: str, stdin: Optional[str] = None) -> Optional[List[str]]:
+    result = subprocess.run(["git", *args], input=stdin, capture_output=True, text=True, cwd=root)
+    if result.returncode != 0:
+        return None
+    return [entry for entry in result.stdout.split("\0" if "-z" in args else "\n") if entry]
+
+
+def working_tree_hash() -> Optional[str]:
+    """
+    Digest of the working tree's content as a sorted path -> blob id map:
+    index entries, with every modified, deleted, or untracked (non-ignored)
+    file replaced by what `git add` would store for it. Committing identical
+    content keeps the same digest. Blobs are hashed with `git hash-object`
+    without `-w`, so nothing is written to the object database or the index.
+    None outside a git repository.
+    """
+    root = _git(["rev-parse", "--show-toplevel"])
+    if not root:
+        return None
+    staged = _git_lines(["ls-files", "--stage", "-z"], root)
+    status = _git_lines(
+        ["--no-optional-locks", "status", "--porcelain", "-z", "--no-renames", "--untracked-files=all"], root
+    )
+    if staged is None or status is None:
+        return None
+    blobs: Dict[str, str] = {}
+    for entry in staged:
+        meta, _, path = entry.partition("\t")
+        blobs[path] = meta.split()[1]
+    # Porcelain entries are "XY path", relative to the repository root.
+    dirty = sorted({entry[3:] for entry in status if len(entry) > 3})
+    files = [path for path in dirty if os.path.isfile(os.path.join(root, path))]
+    if files:
+        # Filters apply as in `git add`, so a dirty file hashes to the blob it will be committed as.
+        hashed = _git_lines(["hash-object", "--stdin-paths"], root, "\n".join(files) + "\n")
+        if hashed is None:
+            return None
+        blobs.update(zip(files, hashed))
+    for path in dirty:
+        if os.path.isdir(os.path.join(root, path)):
+            blobs[path] = f"{blobs.get(path, '')}+modified"
+        elif path not in files:
+            blobs.pop(path, None)
+    digest = hashlib.sha256()
+    for path, blob in sorted(blobs.items()):
+        digest.update(f"{path}\0{blob}\0".encode("utf-8"))
+    return digest.hexdigest()
+
+
+def environment_fingerprint() -> str:
+    stable = sorted((key, value) for key, value in os.environ.items() if key not in VOLATILE_ENV)
+    return hashlib.sha256(json.dumps(stable).encode("utf-8")).hexdigest()
+
+
+class VerificationCache:
+    """
+    Passed verification results keyed by (command, directory within the
+    repository, environment fingerprint, working-tree hash). Any edit to a
+    tracked or untracked file changes the working-tree hash, so stale results
+    are never returned. Failures are not cached.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.environment = environment_fingerprint()
+        # Relative to the repository root, so worktrees of one repository still share entries.
+        self.prefix = _git(["rev-parse", "--show-prefix"]) or ""
+        self.tree: Optional[str] = None
+        self._lock = threading.Lock()
+
+    def key(self, command: str, tree: str) -> str:
+        return hashlib.sha256("\0".join([command, self.prefix, self.environment, tree]).encode("utf-8")).hexdigest()
+
+    def _load(self) -> Dict[str, Dict[str, object]]:
+        try:
+            with open(self.path, "r", encoding="utf-8") as file:
+                data = json.load(file)
+        except (OSError, ValueError):
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    def lookup(self, command: str) -> Optional[Dict[str, object]]:
+        if not self.tree:
+            return None
+        return self._load().get(self.key(command, self.tree))
+
+    def store(self, results: List[Dict[str, str]]) -> None:
+        """Record results run on `self.tree` that passed, unless the commands changed the working tree."""
+        if not self.tree or working_tree_hash() != self.tree:
+            return
+        fresh = {
+            self.key(item["command"], self.tree): {"command": item["command"], "output": item["output"], "at": int(time.time())}
+            for item in results
+            if item["status"] == "passed"
+        }
+        if not fresh:
+            return
+        with self._lock:
+            entries = {**fresh, **{key: value for key, value in self._load().items() if key not in fresh}}
+            entries = dict(list(entries.items())[:CACHE_ENTRIES])
+            scratch = f"{self.path}.{os.getpid()}.tmp"
+            with open(scratch, "w", encoding="utf-8") as file:
+                json.dump(entries, file)
+            os.replace(scratch, self.path)
+
+
+def open_cache() -> Optional[VerificationCache]:
+    """The cache of the current repository (shared by its worktrees), or None outside git."""
+    common_dir = _git(["rev-parse", "--path-format=absolute", "--git-common-dir"])
+    if not common_dir:
+        return None
+    cache = VerificationCache(os.path.join(common_dir, CACHE_FILE))
+    cache.tree = working_tree_hash()
+    return cache if cache.tree else None
+
+
+class OutputCapture:
+    """
+    Bounded view of a command's combined stdout/stderr.
+
+    The first `head_lines` and last `tail_lines` lines stay in memory, every
+    line is appended to `log_path`, and lines are echoed to stderr with
+    `echo_prefix` when it is not None, so memory stays flat however long the
+    log gets and stdout stays free for machine-readable output.
+    """
+
+    def __init__(
+        self,
+        log_path: str,
+        *,
+        head_lines: int = HEAD_LINES,
+        tail_lines: int = TAIL_LINES,
+        echo_prefix: Optional[str] = None,
+    ):
+        self.log_path = log_path
+        self.head: List[str] = []
+        self.head_lines = head_lines
+        self.tail: Deque[str] = deque(maxlen=tail_lines)
+        self.lines = 0
+        self.echo_prefix = echo_prefix
+        os.makedirs(os.path.dirname(log_path), exist_ok=True)
+        self._log = open(log_path, "wb")
+
+    def feed(self, raw: bytes) -> None:
+        self._log.write(raw)
+        line = raw.decode("utf-8", errors="replace").rstrip("\r\n")
+        self.lines += 1
+        if len(self.head) < self.head_lines:
+            self.head.append(line)
+        else:
+            self.tail.append(line)
+        if self.echo_prefix is not None:
+            sys.stderr.write(f"{self.echo_prefix}{line}\n")
+            sys.stderr.flush()
+
+    def close(self) -> None:
+        self._log.close()
+
+    def tail_text(self, count: int) -> str:
+        """The last `count` lines that are still in memory."""
+        lines = (self.head + list(self.tail))[-count:] if count > 0 else []
+        return "\n".join(lines).strip()
+
+    def text(self) -> str:
+        """Head and tail, with a marker for the lines only kept in the log file."""
+        omitted = self.lines - len(self.head) - len(self.tail)
+        parts = list(self.head)
+        if omitted > 0:
+            parts.append(f"... {omitted} lines omitted, full output in {self.log_path} ...")
+        parts.extend(self.tail)
+        return "\n".join(parts).strip()
+
+
+def status_label(item: Dict[str, str]) -> str:
+    """A result's status for summaries, spelling out that unaffected commands did not run."""
+    if item["status"] == "unaffected":
+        return "unaffected (no affected tests, not run)"
+    return str(item["status"])
+
+
+def log_path_for(command: str) -> str:
+    slug = re.sub(r"[^A-Za-z0-9]+", "-", command).strip("-")[:40] or "command"
+    return os.path.join(LOG_DIR, f"{int(time.time())}-{os.getpid()}-{next(_log_sequence)}-{slug}.log")
+
+
+def group_rss(pgid: int) -> int:
+    """Resident bytes of every process in a process group (Linux /proc; 0 elsewhere)."""
+    total = 0
+    page = os.sysconf("SC_PAGE_SIZE")
+    for pid in os.listdir("/proc") if os.path.isdir("/proc") else []:
+        if not pid.isdigit():
+            continue
+        try:
+            with open(f"/proc/{pid}/stat", "rb") as file:
+                # Fields after the parenthesised command name: state ppid pgrp ...
+                fields = file.read().rsplit(b")", 1)[1].split()
+            if int(fields[2]) != pgid:
+                continue
+            with open(f"/proc/{pid}/statm", "rb") as file:
+                total += int(file.read().split()[1]) * page
+        except (OSError, IndexError, ValueError):
+            continue
+    return total
+
+
+def stop_group(pgid: int) -> None:
+    try:
+        os.killpg(pgid, signal.SIGTERM)
+    except ProcessLookupError:
+        pass
+
+
+def kill_group(pgid: int) -> None:
+    try:
+        os.killpg(pgid, signal.SIGKILL)
+    except ProcessLookupError:
+        pass
+
+
+def stream_shell(
+    command: str,
+    cancel: Optional[threading.Event] = None,
+    *,
+    echo_prefix: Optional[str] = None,
+    tail_lines: int = TAIL_LINES,
+    limits: Optional[Dict[str, float]] = None,
+) -> Tuple[int, OutputCapture, Dict[str, object]]:
+    """
+    Run `command` in its own process group, streaming its combined output
+    into an OutputCapture.
+
+    `limits` may hold `timeout` (wall seconds), `mem` (bytes of resident
+    memory summed over the group, sampled every CANCEL_POLL_INTERVAL), and
+    `cpu` (seconds per process, set with setrlimit through `ulimit -t`). A
+    command over its timeout or memory cap, or one that is cancelled, has its
+    whole group terminated (SIGTERM, then SIGKILL after KILL_GRACE).
+
+    Returns (exit code, capture, usage) where usage has `reason` (None,
+    "cancelled", "timeout", "cpu", or "oom"), `wall_seconds`, `cpu_seconds`,
+    and `peak_rss_bytes`.
+    """
+    limits = limits or {}
+    capture = OutputCapture(log_path_for(command), tail_lines=tail_lines, echo_prefix=echo_prefix)
+    shell_command = command
+    if limits.get("cpu"):
+        # Soft limit sends SIGXCPU; the hard limit, KILL_GRACE later, sends SIGKILL to processes that ignore it.
+        soft = max(1, int(limits["cpu"]))
+        shell_command = f"ulimit -St {soft} && ulimit -Ht {soft + int(KILL_GRACE)} || exit 125\n{command}"
+    started = time.monotonic()
+    process = subprocess.Popen(
+        shell_command,
+        shell=True,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        start_new_session=True,
+    )
+
+    def pump() -> None:
+        for raw in iter(lambda: process.stdout.readline(LINE_LIMIT), b""):
+            capture.feed(raw)
+
+    reader = threading.Thread(target=pump, daemon=True)
+    reader.start()
+    reason: Optional[str] = None
+    peak_rss = 0
+    terminated_at: Optional[float] = None
+    delay = 0.01
+    while True:
+        pid, status, usage = os.wait4(process.pid, os.WNOHANG)
+        if pid:
+            break
+        if reason is None:
+            if cancel is not None and cancel.is_set():
+                reason = "cancelled"
+            elif limits.get("timeout") and time.monotonic() - started > limits["timeout"]:
+                reason = "timeout"
+            elif limits.get("mem"):
+                peak_rss = max(peak_rss, group_rss(process.pid))
+                if peak_rss > limits["mem"]:
+                    reason = "oom"
+            if reason is not None:
+                terminated_at = time.monotonic()
+                stop_group(process.pid)
+        elif terminated_at is not None and time.monotonic() - terminated_at > KILL_GRACE:
+            kill_group(process.pid)
+            terminated_at = None
+        time.sleep(delay)
+        delay = min(delay * 2, CANCEL_POLL_INTERVAL)
+
+    process.returncode = os.waitstatus_to_exitcode(status)
+    if reason is not None:
+        # Anything left in the group would keep the output pipe open.
+        kill_group(process.pid)
+    reader.join(None if reason is None else KILL_GRACE)
+    process.stdout.close()
+    capture.close()
+    cpu_seconds = usage.ru_utime + usage.ru_stime
+    # Over its CPU limit a process gets SIGXCPU (later SIGKILL); the shell reports that as 128 + signal.
+    if reason is None and limits.get("cpu"):
+        killed = process.returncode in (-signal.SIGKILL, 128 + signal.SIGKILL) and cpu_seconds >= limits["cpu"]
+        if killed or process.returncode in (-signal.SIGXCPU, 128 + signal.SIGXCPU):
+            reason = "cpu"
+    return process.returncode, capture, {
+        "reason": reason,
+        "wall_seconds": round(time.monotonic() - started, 3),
+        "cpu_seconds": round(cpu_seconds, 3),
+        # ru_maxrss is in KiB on Linux: the largest single process, including reaped descendants.
+        "peak_rss_bytes": max(peak_rss, usage.ru_maxrss * 1024),
+    }
+
+
+def run_shell(command: str, cancel: threading.Event, label: str = "", limits: Optional[Dict[str, float]] = None) -> Dict[str, object]:
+    """
+    Default plan runner: `{"status", "output", "log", "wall_seconds",
+    "cpu_seconds", "peak_rss_bytes"}` for one command, echoing its output
+    live. A command stopped by its CPU or wall-clock limit is "timeout",
+    one stopped by its memory cap is "oom".
+    """
+    code, capture, usage = stream_shell(command, cancel, echo_prefix=f"[{label}] " if label else "", limits=limits)
+    reason = usage.pop("reason")
+    if reason == "cancelled" and code != 0:
+        status = "cancelled"
+    elif reason in ("timeout", "cpu"):
+        status = "timeout"
+        print(f"Verification hit its {'CPU' if reason == 'cpu' else 'time'} limit: {command}", file=sys.stderr)
+    elif reason == "oom":
+        status = "oom"
+        print(f"Verification exceeded its memory cap: {command}", file=sys.stderr)
+    else:
+        status = "passed" if code == 0 else "failed"
+    return {"status": status, "output": capture.text(), "log": capture.log_path, **usage}
+
+
+def run_plan(
+    steps: List[Dict[str, object]],
+    *,
+    jobs: int = 1,
+    fail_fast: bool = True,
+    runner: Runner = run_shell,
+    previous: Optional[Dict[int, Dict[str, str]]] = None,
+    cache: Optional[VerificationCache] = None,
+    limits: Optional[Dict[str, float]] = None,
+) -> List[Dict[str, str]]:
+    """
+    Run parsed verification steps as a DAG, up to `jobs` at once.
+
+    A step starts once every step it `needs` has passed and no other step of
+    its `group` is running. Results come back in declaration order with status
+    "passed", "failed", "timeout", "oom", "cancelled" (killed by fail-fast),
+    or "skipped" (never started because a dependency failed or fail-fast
+    stopped the run), plus "unaffected" for test-impact results passed in
+    `previous`. `limits` are defaults that a step's own annotation
+    overrides.
+    `previous` maps step positions to results that are reused instead of
+    running the step again. With a `cache`, steps that already passed on
+    this exact tree are reported from it (`"cached": True`) without running.
+    Progress lines go to stderr, so callers can keep stdout for `--json`.
+    """
+    results: Dict[int, Dict[str, str]] = dict(previous or {})
+    if cache is not None:
+        for index, step in enumerate(steps):
+            hit = None if index in results else cache.lookup(str(step["command"]))
+            if hit is not None:
+                print(f"Verification cached (passed on this tree): {step['command']}", file=sys.stderr)
+                results[index] = {"command": str(step["command"]), "status": "passed", "output": str(hit["output"]), "cached": True}
+    passed = {str(steps[index]["id"]) for index, result in results.items() if result["status"] in PASSING_STATUSES}
+    failed = {str(steps[index]["id"]) for index, result in results.items() if result["status"] not in PASSING_STATUSES}
+    busy_groups: Set[str] = set()
+    cancel = threading.Event()
+    in_flight: Dict[Future, int] = {}
+    ran: Set[int] = set()
+
+    def blocked(step: Dict[str, object]) -> bool:
+        return bool(set(step["needs"]) & failed)
+
+    with ThreadPoolExecutor(max_workers=max(1, jobs)) as pool:
+        while True:
+            progressed = True
+            while progressed:
+                progressed = False
+                for index, step in enumerate(steps):
+                    if index in results or index in in_flight.values():
+                        continue
+                    if cancel.is_set() or blocked(step):
+                        results[index] = {"command": str(step["command"]), "status": "skipped", "output": ""}
+                        failed.add(str(step["id"]))
+                        progressed = True
+                        continue
+                    if len(in_flight) >= max(1, jobs) or not set(step["needs"]) <= passed:
+                        continue
+                    if step["group"] and step["group"] in busy_groups:
+                        continue
+                    if step["group"]:
+                        busy_groups.add(str(step["group"]))
+                    print(f"Running verification: {step['command']}", file=sys.stderr)
+                    # Parallel output is interleaved, so each echoed line names its command.
+                    label = str(step["label"]) if jobs > 1 else ""
+                    step_limits = {**(limits or {}), **step["limits"]}
+                    step_limits = {key: value for key, value in step_limits.items() if value > 0}
+                    in_flight[pool.submit(runner, str(step["command"]), cancel, label, step_limits)] = index
+
+            if not in_flight:
+                break
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                index = in_flight.pop(future)
+                ran.add(index)
+                step = steps[index]
+                if step["group"]:
+                    busy_groups.discard(str(step["group"]))
+                results[index] = {"command": str(step["command"]), **future.result()}
+                status = results[index]["status"]
+                if status == "passed":
+                    passed.add(str(step["id"]))
+                    continue
+                failed.add(str(step["id"]))
+                if status in ("failed", "timeout", "oom") and fail_fast and not cancel.is_set():
+                    if in_flight:
+                        print(f"Verification failed: {step['command']}. Cancelling {len(in_flight)} running sibling(s).", file=sys.stderr)
+                    cancel.set()
+
+    if cache is not None:
+        cache.store([results[index] for index in sorted(ran)])
+    return [results[index] for index in range(len(steps))]
@@ -0,0 +1,44 @@
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from typing import List
+
+# Verification output that must not leak into the `--json` document.
+CHECKS: List[List[str]] = [
+    ["--verification-cmd", "echo hello"],
+    ["--verification-cmd", "echo one [id=one]", "--verification-cmd", "echo two [needs=one]", "--no-fail-fast"],
+    ["--verification-cmd", "sh -c 'echo broken; exit 3'"],
+    ["--test-impact", "--verification-cmd", "pytest", "--verification-cmd", "echo hello"],
+]
+
+
+def check(review_script: str, repo: str, args: List[str]) -> bool:
+    """Run `review.py --json` with `args` in `repo` and confirm stdout is exactly one JSON document."""
+    result = subprocess.run(
+        [sys.executable, review_script, "--json", "--no-verification-cache", *args],
+        capture_output=True,
+        text=True,
+        cwd=repo,
+    )
+    try:
+        payload = json.loads(result.stdout)
+    except json.JSONDecodeError as error:
+        print(f"FAIL {' '.join(args)}: stdout is not JSON ({error})")
+        print(result.stdout)
+        return False
+    print(f"ok   {' '.join(args)}: status {payload['status']}")
+    return True
+
+
+def main() -> None:
+    review_script = os.path.join(os.path.dirname(os.path.abspath(__file__)), "review.py")
+    with tempfile.TemporaryDirectory() as repo:
+        subprocess.run(["git", "init", "-q", repo], check=True)
+        passed = [check(review_script, repo, args) for args in CHECKS]
+    sys.exit(0 if all(passed) else 1)
+
+
+if __name__ == "__main__":
+    main()
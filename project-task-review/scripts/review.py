@@ -1,10 +1,13 @@
 import argparse
+import contextlib
+import functools
+import importlib.util
 import json
 import os
 import re
 import subprocess
 import sys
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional
 
 DEFAULT_PROGRESS_FILE = "TASK_PROGRESS.md"
 TASK_MARKER = "## Task Checklist"
@@ -23,16 +26,6 @@ def run_command(cmd_list: List[str], check: bool = True) -> Optional[str]:
         return None
 
 
-def run_shell(command: str) -> Tuple[bool, str]:
-    result = subprocess.run(command, shell=True, capture_output=True, text=True)
-    combined = "\n".join(
-        part.strip()
-        for part in [result.stdout or "", result.stderr or ""]
-        if part and part.strip()
-    ).strip()
-    return result.returncode == 0, combined
-
-
 def read_progress_file(path: str) -> Dict[str, object]:
     data: Dict[str, object] = {
         "sections": {},
@@ -126,29 +119,82 @@ def changed_files_for_pr(pr_number: Optional[int]) -> List[str]:
     return [line for line in output.splitlines() if line.strip()]
 
 
-def run_verifications(commands: List[str]) -> List[Dict[str, str]]:
-    results: List[Dict[str, str]] = []
-    for command in commands:
-        ok, output = run_shell(command)
-        results.append(
-            {
-                "command": command,
-                "status": "passed" if ok else "failed",
-                "output": output,
-            }
-        )
-        if not ok:
-            break
+@functools.lru_cache(maxsize=None)
+def verification():
+    """Load the verification runner shared with project-task-finish."""
+    module = sys.modules.get("task_verification")
+    if module is not None:
+        return module
+    current_dir = os.path.dirname(os.path.abspath(__file__))
+    path = os.path.join(os.path.dirname(os.path.dirname(current_dir)), "project-task-finish", "scripts", "verification.py")
+    spec = importlib.util.spec_from_file_location("task_verification", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    sys.modules["task_verification"] = module
+    return module
+
+
+def run_verifications(
+    commands: List[str],
+    *,
+    jobs: Optional[int] = None,
+    fail_fast: bool = True,
+    use_cache: bool = False,
+    limits: Optional[Dict[str, float]] = None,
+    impact=None,
+) -> List[Dict[str, str]]:
+    """
+    Run the verification DAG with default `limits`; with `use_cache`,
+    results finish already passed on this tree are reused. With an `impact`
+    session, test commands run only the affected targets.
+    """
+    runner = verification()
+    steps = runner.parse_plan(commands)
+    jobs = jobs or runner.default_jobs(steps)
+    cache = runner.open_cache() if use_cache and steps else None
+    selected: Dict[int, Dict[str, str]] = {}
+    if impact is not None:
+        steps, selected = impact.select(steps, lambda command: cache is not None and cache.lookup(command) is not None)
+    results = runner.run_plan(steps, jobs=jobs, fail_fast=fail_fast, previous=selected, cache=cache, limits=limits)
+    if impact is not None:
+        impact.record(results)
     return results
 
 
+@functools.lru_cache(maxsize=None)
+def test_impact():
+    """Load the change-aware test selection shared with project-task-finish."""
+    module = sys.modules.get("task_test_impact")
+    if module is not None:
+        return module
+    current_dir = os.path.dirname(os.path.abspath(__file__))
+    path = os.path.join(os.path.dirname(os.path.dirname(current_dir)), "project-task-finish", "scripts", "test_impact.py")
+    spec = importlib.util.spec_from_file_location("task_test_impact", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    sys.modules["task_test_impact"] = module
+    return module
+
+
+def pr_base_ref(pr_number: Optional[int]) -> str:
+    """`origin/<base>` of the PR under review (or of the current branch's PR), else `origin/main`."""
+    command = ["gh", "pr", "view", "--json", "baseRefName", "--jq", ".baseRefName"]
+    if pr_number:
+        command.insert(3, str(pr_number))
+    try:
+        base = run_command(command, check=False)
+    except FileNotFoundError:
+        base = None
+    return f"origin/{base or 'main'}"
+
+
 def build_result(
     progress: Dict[str, object],
     changed_files: List[str],
     verification_results: List[Dict[str, str]],
 ) -> Dict[str, object]:
     remaining = incomplete_tasks(progress)
-    verification_failed = any(item["status"] != "passed" for item in verification_results)
+    verification_failed = any(item["status"] not in verification().PASSING_STATUSES for item in verification_results)
     status = "pass"
     if remaining or verification_failed:
         status = "fail"
@@ -183,14 +229,44 @@ def print_human_summary(result: Dict[str, object]) -> None:
         for task in incomplete:
             print(f"- {task}")
 
-    verification = result.get("verification_results", [])
-    if verification:
+    verification_results = result.get("verification_results", [])
+    if verification_results:
         print("Verification:")
-        for item in verification:
-            print(f"- {item['command']}: {item['status']}")
+        for item in verification_results:
+            print(f"- {item['command']}: {verification().status_label(item)}")
 
 
-def main() -> None:
+def review_task(args: argparse.Namespace, progress: Optional[Dict[str, object]] = None) -> Dict[str, object]:
+    """Review the task and return the result dict that `--json` prints."""
+    if progress is None:
+        progress = read_progress_file(args.progress_file)
+    changed_files = changed_files_for_pr(args.pr)
+
+    verification_commands = list(args.verification_cmd or [])
+    if args.use_progress_verification:
+        verification_commands.extend(section_items(progress, "Verification"))
+
+    try:
+        limits = verification().parse_limits(args.verification_timeout, args.verification_mem, args.verification_cpu)
+        impact = None
+        if args.test_impact:
+            impact = test_impact().ImpactSession(test_impact().load_config(args.test_impact_config), pr_base_ref(args.pr))
+        verification_results = run_verifications(
+            verification_commands,
+            jobs=args.verification_jobs,
+            fail_fast=not args.no_fail_fast,
+            use_cache=not args.no_verification_cache,
+            limits=limits,
+            impact=impact,
+        )
+    except (OSError, ValueError) as error:
+        result = build_result(progress, changed_files, [])
+        result.update({"status": "fail", "error": f"Invalid verification plan: {error}"})
+        return result
+    return build_result(progress, changed_files, verification_results)
+
+
+def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(description="Review task completion against TASK_PROGRESS.md.")
     parser.add_argument("--pr", type=int, help="PR number to review")
     parser.add_argument(
@@ -209,22 +285,61 @@ def main() -> None:
         action="store_true",
         help="Run commands listed in the progress file Verification section.",
     )
+    parser.add_argument(
+        "--verification-jobs",
+        type=int,
+        help="Verification commands run at once (default: one at a time, or one per CPU when any command is "
+        "annotated).",
+    )
+    parser.add_argument(
+        "--no-fail-fast",
+        action="store_true",
+        help="Keep running independent verification commands after one fails.",
+    )
+    parser.add_argument(
+        "--verification-timeout",
+        default=f"{int(verification().DEFAULT_TIMEOUT)}s",
+        help="Wall-clock limit per verification command, e.g. 900, 15m, 2h; 0 disables it (default: %(default)s). "
+        "An entry's own `[timeout=...]` annotation wins.",
+    )
+    parser.add_argument(
+        "--verification-mem",
+        help="Resident memory cap per verification command's process group, e.g. 4G (default: none).",
+    )
+    parser.add_argument(
+        "--verification-cpu",
+        help="CPU-time limit per process of a verification command, e.g. 20m (default: none).",
+    )
+    parser.add_argument(
+        "--test-impact",
+        action="store_true",
+        help="Run test commands only for targets affected by the changes against the PR's base branch.",
+    )
+    parser.add_argument(
+        "--test-impact-config",
+        help="Test-impact rules file (default: .test-impact.json at the repository root, if present).",
+    )
+    parser.add_argument(
+        "--no-verification-cache",
+        action="store_true",
+        help="Run every verification command even if it already passed on the same working tree.",
+    )
     parser.add_argument(
         "--json",
         action="store_true",
         help="Print machine-readable JSON output.",
     )
-    args = parser.parse_args()
+    return parser
 
-    progress = read_progress_file(args.progress_file)
-    changed_files = changed_files_for_pr(args.pr)
 
-    verification_commands = list(args.verification_cmd or [])
-    if args.use_progress_verification:
-        verification_commands.extend(section_items(progress, "Verification"))
-
-    verification_results = run_verifications(verification_commands)
-    result = build_result(progress, changed_files, verification_results)
+def main() -> None:
+    args = build_parser().parse_args()
+    if args.json:
+        # Keep stdout to the JSON document alone; the driver parses it.
+        with contextlib.redirect_stdout(sys.stderr):
+            result = review_task(args)
+    else:
+        result = review_task(args)
 
     if args.json:
         print(json.dumps(result, indent=2))
@@ -1,5 +1,6 @@
 import argparse
 import json
+import os
 import re
 import subprocess
 import sys
@@ -28,6 +29,19 @@ def run_command(cmd_list: List[str], check: bool = True) -> Optional[str]:
         return None
 
 
+def load_issue_context(path: str) -> Dict[str, object]:
+    """
+    Read issue context prefetched by the driver.
+
+    The file holds `{"issue": {title, body, milestone}, "remote_head": sha or ""}`,
+    letting start skip the issue lookup and the feature-branch `ls-remote`.
+    When it also has `base_branch`/`base_head`, the driver has just synced that
+    branch to `base_head`, and start skips its own fetch and pull.
+    """
+    with open(path, "r", encoding="utf-8") as file:
+        return json.load(file)
+
+
 def issue_details(issue_num: int) -> Dict[str, object]:
     output = run_command(
         ["gh", "issue", "view", str(issue_num), "--json", "title,body,milestone"],
@@ -76,7 +90,17 @@ def base_branch_for_milestone(milestone_title: str) -> str:
     return "main"
 
 
-def ensure_branch(branch_name: str) -> None:
+def ref_commit(ref: str) -> Optional[str]:
+    return run_command(["git", "rev-parse", "--verify", "--quiet", ref], check=False) or None
+
+
+def ensure_branch(branch_name: str, known_head: Optional[str] = None) -> None:
+    """Check out `branch_name` up to date with origin; `known_head` is a remote head the caller already synced."""
+    if known_head and ref_commit(f"refs/heads/{branch_name}") == known_head:
+        if run_command(["git", "branch", "--show-current"], check=False) != branch_name:
+            run_command(["git", "checkout", branch_name])
+        return
+
     run_command(["git", "fetch", "origin"], check=False)
     remote_exists = run_command(["git", "ls-remote", "--heads", "origin", branch_name], check=False)
 
@@ -94,10 +118,19 @@ def ensure_branch(branch_name: str) -> None:
     run_command(["git", "checkout", "-b", branch_name])
 
 
-def create_or_restore_feature_branch(issue_num: int, base_branch: str) -> str:
+def create_or_restore_feature_branch(
+    issue_num: int,
+    base_branch: str,
+    remote_head: Optional[str] = None,
+    base_head: Optional[str] = None,
+) -> str:
+    """
+    `remote_head` is the prefetched `ls-remote` result for the feature branch
+    ("" when absent); `base_head` is the base-branch head the driver synced.
+    """
     branch_name = f"feat/issue-{issue_num}"
     print(f"Preparing base branch `{base_branch}`...")
-    ensure_branch(base_branch)
+    ensure_branch(base_branch, base_head)
 
     print(f"Preparing feature branch `{branch_name}`...")
     feature_exists = run_command(["git", "rev-parse", "--verify", branch_name], check=False)
@@ -105,8 +138,12 @@ def create_or_restore_feature_branch(issue_num: int, base_branch: str) -> str:
         run_command(["git", "checkout", branch_name])
         return branch_name
 
-    remote_exists = run_command(["git", "ls-remote", "--heads", "origin", branch_name], check=False)
+    remote_exists = remote_head
+    if remote_exists is None:
+        remote_exists = run_command(["git", "ls-remote", "--heads", "origin", branch_name], check=False)
     if remote_exists:
+        # The prefetched head skips the full fetch, so origin/<branch> may not exist locally yet.
+        run_command(["git", "fetch", "origin", branch_name], check=False)
         run_command(["git", "checkout", "-b", branch_name, "--track", f"origin/{branch_name}"])
         return branch_name
 
@@ -114,6 +151,45 @@ def create_or_restore_feature_branch(issue_num: int, base_branch: str) -> str:
     return branch_name
 
 
+def create_feature_worktree(
+    issue_num: int,
+    base_branch: str,
+    path: str,
+    remote_head: Optional[str] = None,
+    base_head: Optional[str] = None,
+) -> str:
+    """
+    Check the feature branch out in its own `git worktree` at `path`, leaving
+    the current checkout (and its branch) untouched. New branches start from
+    `origin/<base_branch>`, so the base branch does not need to be checked out.
+    """
+    branch_name = f"feat/issue-{issue_num}"
+    if os.path.isdir(path):
+        print(f"Reusing worktree `{path}` for `{branch_name}`.")
+        return branch_name
+
+    print(f"Preparing feature branch `{branch_name}` in worktree `{path}`...")
+    if not base_head or ref_commit(f"refs/remotes/origin/{base_branch}") != base_head:
+        run_command(["git", "fetch", "origin"], check=False)
+    if run_command(["git", "rev-parse", "--verify", branch_name], check=False):
+        run_command(["git", "worktree", "add", path, branch_name])
+        return branch_name
+
+    remote_exists = remote_head
+    if remote_exists is None:
+        remote_exists = run_command(["git", "ls-remote", "--heads", "origin", branch_name], check=False)
+    if remote_exists:
+        run_command(["git", "fetch", "origin", branch_name], check=False)
+        run_command(["git", "worktree", "add", "--track", "-b", branch_name, path, f"origin/{branch_name}"])
+        return branch_name
+
+    start_point = base_branch
+    if ref_commit(f"refs/remotes/origin/{base_branch}"):
+        start_point = f"origin/{base_branch}"
+    run_command(["git", "worktree", "add", "--no-track", "-b", branch_name, path, start_point])
+    return branch_name
+
+
 def update_issue_status(issue_num: int) -> None:
     run_command(
         ["gh", "issue", "edit", str(issue_num), "--add-assignee", "@me", "--add-label", "in-progress"],
@@ -138,8 +214,20 @@ def print_context(title: str, milestone: str, branch_name: str, sections: Dict[s
     print("\nNext step: initialize `TASK_PROGRESS.md` with `project-task-implementer` before coding.")
 
 
-def start_task(issue_num: int) -> None:
-    issue = issue_details(issue_num)
+def start_task(
+    issue_num: int,
+    context: Optional[Dict[str, object]] = None,
+    worktree: Optional[str] = None,
+) -> Dict[str, object]:
+    """
+    Prepare the feature branch for an issue and print its context.
+
+    With `worktree`, the branch is checked out in a new worktree at that path
+    instead of the current checkout. Returns `{"status", "issue", "title",
+    "milestone", "base_branch", "branch", "worktree", "sections"}` for
+    in-process callers; git/gh failures exit like the CLI does.
+    """
+    issue = context["issue"] if context else issue_details(issue_num)
     title = str(issue.get("title") or f"Issue #{issue_num}")
     body = str(issue.get("body") or "")
 
@@ -149,17 +237,45 @@ def start_task(issue_num: int) -> None:
         milestone_title = str(milestone_info["title"])
 
     base_branch = base_branch_for_milestone(milestone_title)
-    branch_name = create_or_restore_feature_branch(issue_num, base_branch)
+    remote_head = context.get("remote_head") if context else None
+    base_head = None
+    if context and context.get("base_branch") == base_branch:
+        base_head = context.get("base_head")
+    if worktree:
+        branch_name = create_feature_worktree(issue_num, base_branch, worktree, remote_head, base_head)
+    else:
+        branch_name = create_or_restore_feature_branch(issue_num, base_branch, remote_head, base_head)
     update_issue_status(issue_num)
     sections = extract_context_sections(body)
     print_context(title, milestone_title, branch_name, sections)
+    return {
+        "status": "started",
+        "issue": issue_num,
+        "title": title,
+        "milestone": milestone_title,
+        "base_branch": base_branch,
+        "branch": branch_name,
+        "worktree": worktree,
+        "sections": sections,
+    }
 
 
 def main() -> None:
     parser = argparse.ArgumentParser(description="Start working on a GitHub issue with week-issue context.")
     parser.add_argument("--issue", type=int, required=True, help="Issue number to start")
+    parser.add_argument(
+        "--context-file",
+        type=str,
+        help="JSON issue context prefetched by project-driver; skips the issue lookup and feature-branch ls-remote.",
+    )
+    parser.add_argument(
+        "--worktree",
+        type=str,
+        help="Check the feature branch out in a new git worktree at this path instead of the current checkout.",
+    )
     args = parser.parse_args()
-    start_task(args.issue)
+    context = load_issue_context(args.context_file) if args.context_file else None
+    start_task(args.issue, context, args.worktree)
 
 
 if __name__ == "__main__":